@@ -2,6 +2,8 @@
 # Michelle Nelson, mhn29
 # 11/2/14
 """ Functions for Assignment A4"""
+import heapq
+import weakref
 
 
 # Task 1: Word Lists
@@ -85,6 +87,107 @@ def word_list_extend(words, prefix):
 
 # Task 2: Prefix Maps
 
+def is_pmap(pmap):
+    """Returns True if pmap can be searched as a prefix map.
+    
+    A prefix map is normally a dict.  The search functions in this module also 
+    accept the node-based prefix maps in this package (subclasses of 
+    nodemap.NodeMap, such as trie.Trie and pmapfile.CompiledPmap).  These support 
+    pmap[prefix] and prefix in pmap like a dict, and also have a method 
+    find(prefix).
+    
+    Precondition: NONE (pmap can be any value)"""
+    return type(pmap) == dict or hasattr(pmap, 'find')
+
+
+def pmap_nodes(pmap):
+    """Returns pmap as a graph of nodes, for the searches in this module.
+    
+    The searches walk a prefix map node by node, using the methods of 
+    nodemap.NodeMap: find, child, children and is_word.  A node-based prefix map 
+    already has these, so it is returned as is.  A dict prefix map is wrapped in 
+    an object whose nodes are the prefix strings themselves.
+    
+    Precondition: pmap is a prefix map (see is_pmap)."""
+    if type(pmap) == dict:
+        return _DictNodes(pmap)
+    return pmap
+
+
+class _DictNodes(object):
+    """Instances present a dict prefix map as a graph of nodes.
+    
+    The node for a prefix is the prefix itself, so the root is ''.
+    
+    Instance Attributes:
+        pmap: the prefix map being wrapped [dict]
+    """
+    root = ''
+    
+    def __init__(self, pmap):
+        """**Constructor**: Wrap the prefix map pmap
+        
+        Precondition: pmap is a dict prefix map."""
+        self.pmap = pmap
+    
+    def find(self, prefix):
+        """Returns prefix if it is in the prefix map, and None otherwise."""
+        if prefix in self.pmap:
+            return prefix
+        return None
+    
+    def child(self, node, letter):
+        """Returns node+letter if it is in the prefix map, and None otherwise."""
+        if letter in self.pmap[node]:
+            return node+letter
+        return None
+    
+    def children(self, node):
+        """Returns the list of (letter, node) pairs leaving node, sorted by letter."""
+        result = []
+        for x in sorted(self.pmap[node]):
+            if x != '':
+                result.append((x, node+x))
+        return result
+    
+    def is_word(self, node):
+        """Returns True if node ends a word."""
+        return '' in self.pmap[node]
+
+
+# Weak references to the objects to tell when a prefix map changes
+_listeners = []
+
+
+def pmap_add_listener(listener):
+    """Registers listener to be told about changes to prefix maps.
+    
+    Before pmap_add_word or pmap_remove_word changes a prefix map pmap, it calls 
+    listener.pmap_changed(pmap,word).  Caches of search results use this to forget 
+    the results that the change affects.  Only a weak reference to listener is 
+    kept, so registering it does not keep it alive.
+    
+    Precondition: listener has a method pmap_changed(pmap,word).
+    
+    Enforced Precondition: listener has a method pmap_changed."""
+    assert hasattr(listener, 'pmap_changed'), `listener` + ' has no pmap_changed method'
+    _listeners.append(weakref.ref(listener))
+
+
+def _notify_listeners(pmap, word):
+    """Tells every registered listener that word is about to change in pmap.
+    
+    Listeners that no longer exist are dropped.
+    
+    Precondition: pmap is a prefix map.  word is a string."""
+    for ref in _listeners[:]:
+        listener = ref()
+        if listener is None:
+            _listeners.remove(ref)
+        else:
+            listener.pmap_changed(pmap, word)
+
+
 def pmap_add_word(pmap,word):
     """Adds a single word to a prefix map.
     
@@ -104,14 +207,23 @@ def pmap_add_word(pmap,word):
     Example: If pmap is { '':['a'], 'a':['t'], 'at':[''] }, pmap_add_word(pmap,'as') 
     changes pmap to { '':['a'], 'a':['s', 't'], 'at':[''], 'as':[''] }.
     
+    If pmap is not a dict but has an add_word method (such as a trie.Trie), this
+    function calls that method instead.  Either way, it first tells the listeners
+    registered with pmap_add_listener.
+    
     Precondition: pmap is a prefix map.  word is a string with only letters.
     
-    Enforced Precondition: pmap is a dict. word is a string with only letters."""
+    Enforced Precondition: pmap is a dict or has an add_word method. word is a 
+    string with only letters."""
     
-    assert type(pmap) == dict, `pmap` + ' is not of type dict'
+    assert type(pmap) == dict or hasattr(pmap, 'add_word'), `pmap` + ' cannot be changed'
     assert type(word) == str, `word` + ' is not a string'
     assert word.isalpha() == True, `word`+' needs to be only letters'
     
+    _notify_listeners(pmap, word)
+    if type(pmap) != dict:
+        pmap.add_word(word)
+        return
     
     """if not word in pmap:
         for x in word:
@@ -144,10 +256,58 @@ def pmap_add_word(pmap,word):
 
     #what about words w/ double letters like goop, well, larry?
 
+def pmap_remove_word(pmap,word):
+    """Removes a single word from a prefix map.
+    
+    This is a procedure.  It modifies the contents of pmap. It does not return
+    a new prefix map.
+    
+    This function removes '' from the list of values for word.  Any prefix of 
+    word that is left with no next letters is removed as well, along with its 
+    letter in the list of the prefix before it.  If word is not in pmap, this 
+    function does nothing.
+    
+    Example: If pmap is { '':['a'], 'a':['s', 't'], 'at':[''], 'as':[''] }, then
+    pmap_remove_word(pmap,'as') changes pmap to { '':['a'], 'a':['t'], 'at':[''] }.
+    
+    If pmap is not a dict but has a remove_word method (such as a trie.Trie), this
+    function calls that method instead.  Either way, it first tells the listeners
+    registered with pmap_add_listener.
+    
+    Precondition: pmap is a prefix map.  word is a string.
+    
+    Enforced Precondition: pmap is a dict or has a remove_word method. word is a 
+    string."""
+    assert type(pmap) == dict or hasattr(pmap, 'remove_word'), `pmap` + ' cannot be changed'
+    assert type(word) == str, `word` + ' is not a string'
+    
+    _notify_listeners(pmap, word)
+    if type(pmap) != dict:
+        pmap.remove_word(word)
+        return
+    
+    if not pmap_has_word(pmap, word):
+        return
+    pmap[word].remove('')
+    pos = len(word)
+    while pos > 0 and pmap[word[:pos]] == []:
+        del pmap[word[:pos]]
+        pmap[word[:pos-1]].remove(word[pos-1])
+        pos = pos - 1
+    if pmap[''] == []:
+        del pmap['']
+
+
 def word_list_to_pmap(words):
     """Returns the prefix map for the given word list.
     
-    Hint: pmap_add_word is a useful helper function.
+    The result is the same as calling pmap_add_word for each word, except that 
+    every list of next letters is sorted (with '' first).  Rather than walking 
+    every prefix of every word, this function visits the words in sorted order.
+    A word then shares its longest common prefix with the word before it, and
+    only the prefixes past that point are new.  So each prefix is sliced once, 
+    and each next letter is appended without checking the list first.  The words 
+    do not need to be sorted (but this is fastest if they are).
     
     Precondition: words is a list of strings with only letters.
     
@@ -155,8 +315,29 @@ def word_list_to_pmap(words):
     assert type(words) == list, `words` + ' is not a list'
     
     pmap = {}
-    for x in words:
-        pmap_add_word(pmap,x)
+    previous = None
+    for word in sorted(words):
+        if word == previous:
+            continue
+        assert type(word) == str and word.isalpha(), `word`+' needs to be only letters'
+        
+        # Find the longest common prefix with the previous word
+        common = 0
+        if previous is not None:
+            limit = min(len(word), len(previous))
+            while common < limit and word[common] == previous[common]:
+                common = common + 1
+        
+        # The prefix word[:common] exists unless this is the first word
+        beginning = word[:common]
+        if beginning in pmap:
+            pmap[beginning].append(word[common])
+        else:
+            pmap[beginning] = [word[common]]
+        for pos in range(common+1, len(word)):
+            pmap[word[:pos]] = [word[pos]]
+        pmap[word] = ['']
+        previous = word
     return pmap
 
 
@@ -168,8 +349,11 @@ def pmap_to_word_list(pmap):
     
     Precondition: pmap is a prefix map.
     
-    Enforced Precondition: pmap is a dict."""
-    assert type(pmap) == dict, `pmap` + ' is not a dict'
+    Enforced Precondition: pmap is a prefix map (see is_pmap)."""
+    assert is_pmap(pmap), `pmap` + ' is not a prefix map'
+    
+    if type(pmap) != dict:
+        return pmap.words()
     
     wordlist = []
     for key in pmap:
@@ -183,157 +367,514 @@ def pmap_has_word(pmap,word):
     
     Precondition: pmap is a prefix map.  word is a string.
     
-    Enforced Precondition: pmap is a dict. word is a string."""
-    assert type(pmap) == dict, `pmap` + ' is not a dict'
+    Enforced Precondition: pmap is a prefix map (see is_pmap). word is a string."""
+    assert is_pmap(pmap), `pmap` + ' is not a prefix map'
     assert type(word) == str, `word` + ' is not a string'
     
-    if word in pmap and word != '':
+    if type(pmap) != dict:
+        return pmap.has_word(word)
+    
+    if word in pmap and word != '' and '' in pmap[word]:
         return True
     else:
         return False
 
 
+def pmap_add_ranks(pmap,words):
+    """Ranks the words of a prefix map by their position in the list words.
+    
+    This is a procedure.  It modifies the contents of pmap.  The first word in 
+    words gets rank 0 (the best), the next rank 1, and so on.  Words of the list 
+    that are not in pmap are skipped, and a word listed twice keeps its first 
+    (better) rank.  Words of pmap that are not in the list stay unranked.
+    
+    Example: pmap_add_ranks(pmap,build_word_list('common.txt')) ranks the words 
+    of pmap by how common they are in English.
+    
+    Precondition: pmap is a prefix map that supports ranks (such as trie.Trie).
+    words is a list of strings.
+    
+    Enforced Precondition: pmap has a set_rank method.  words is a list."""
+    assert hasattr(pmap, 'set_rank'), `pmap` + ' does not support ranks'
+    assert type(words) == list, `words` + ' is not a list'
+    
+    for pos, word in enumerate(words):
+        if pmap.has_word(word) and pmap.rank(pmap.find(word)) > pos:
+            pmap.set_rank(word, pos)
+
+
 # PART C: Word Completions
 
 def autocomplete(prefix, pmap):
     """Returns the list of all words the complete prefix in pmap
     
     If there are no words completing prefix in pmap, this function returns the
-    empty list.
+    empty list.  The list is sorted.
     
     Example: If pmap is the prefix map created from 'short.txt', then 
-    autocomplete('th',pmap) returns the list ['the', 'that'].  
+    autocomplete('th',pmap) returns the list ['that', 'the'].  
     Similarly, autocomplete('x',pmap) returns the empty list []
     
     Precondition: prefix is a string that is either empty or has only letters. 
     pmap is a prefix map.
     
     Enforced Preconditions: We enforce the preconditions for prefix, but only
-    enforce that pmap is a dict."""
-    # This function will require recursion combined with a for-loop.  The base
-    # case is when prefix is not in the prefix map.  Otherwise, you will need
-    # to process all of the values in the list pmap[prefix].
+    enforce that pmap is a prefix map."""
+    if type(pmap) != dict:
+        assert type(prefix) == str, `prefix` + ' is not a string'
+        assert len(prefix) == 0 or prefix.isalpha() == True,`prefix` + ' is not empty or only letters'
+        assert is_pmap(pmap), `pmap` + ' is not a prefix map'
+        return pmap.words(prefix)
+    return list(autocomplete_iter(prefix, pmap))
+
+
+def autocomplete_iter(prefix, pmap, limit=None, after=None):
+    """Yields the words that complete prefix in pmap, in sorted order.
+    
+    This is a generator, so the words are found one at a time as they are asked 
+    for.  It walks the prefix map with a stack instead of recursion, so it is 
+    not limited by the depth of the map, and it does no work for the words after 
+    the last one asked for.
+    
+    If limit is not None, it yields at most limit words.  If after is not None, 
+    it yields only the words that come after it in sorted order.  To page through 
+    the completions, pass the last word of one page as after for the next.
+    
+    Example: If pmap is the prefix map created from 'short.txt', then 
+    list(autocomplete_iter('',pmap,3,'in')) is ['it', 'of', 'that'].
     
-    # Be careful with pmap[prefix]. If prefix is an actual word then '' is in this
-    # list.  If you are not careful with your recursive call, then you will find
-    # yourself in an infinite recursion.
+    Precondition: prefix is a string that is either empty or has only letters. 
+    pmap is a prefix map.  limit is None or an int >= 0.  after is None or a 
+    string.
+    
+    Enforced Preconditions: We enforce the complete precondition for prefix, 
+    limit and after.  We only enforce that pmap is a prefix map."""
+    assert type(prefix) == str, `prefix` + ' is not a string'
+    assert len(prefix) == 0 or prefix.isalpha() == True,`prefix` + ' is not empty or only letters'
+    assert is_pmap(pmap), `pmap` + ' is not a prefix map'
+    assert limit is None or (type(limit) == int and limit >= 0), `limit` + ' is not None or a non-negative int'
+    assert after is None or type(after) == str, `after` + ' is not None or a string'
+    
+    nodes = pmap_nodes(pmap)
+    node = nodes.find(prefix)
+    if node is None or limit == 0:
+        return
+    
+    # The part of after still to be passed below each node (None once passed)
+    cursor = None
+    if after is not None:
+        if after[:len(prefix)] == prefix:
+            cursor = after[len(prefix):]
+        elif after > prefix:
+            return
+    
+    count = 0
+    stack = [(prefix, node, cursor)]
+    while stack:
+        word, node, cursor = stack.pop()
+        if cursor is None and nodes.is_word(node):
+            yield word
+            count = count + 1
+            if count == limit:
+                return
+        
+        # Push the children in reverse, so that the smallest letter is popped first
+        edges = nodes.children(node)
+        for pos in range(len(edges)-1, -1, -1):
+            letter, child = edges[pos]
+            if cursor is None or cursor == '' or letter > cursor[0]:
+                stack.append((word+letter, child, None))
+            elif letter == cursor[0]:
+                stack.append((word+letter, child, cursor[1:]))
+
+
+def count_completions(prefix, pmap):
+    """Returns the number of words that complete prefix in pmap
+    
+    This is the same as len(autocomplete(prefix,pmap)).  Node-based prefix maps 
+    (such as trie.Trie) store the number of words below every node, so for them
+    this takes constant time after finding prefix.  A dict prefix map has no such 
+    counts, and so its completions are counted one at a time.
+    
+    Example: If pmap is the prefix map created from 'short.txt', then 
+    count_completions('th',pmap) returns 2.
     
-    # NOTE: This function MUST be recurse, and you are not allowed to add any
-    # helper functions to implement this function.
+    Precondition: prefix is a string that is either empty or has only letters. 
+    pmap is a prefix map.
     
+    Enforced Preconditions: We enforce the preconditions for prefix, but only
+    enforce that pmap is a prefix map."""
     assert type(prefix) == str, `prefix` + ' is not a string'
     assert len(prefix) == 0 or prefix.isalpha() == True,`prefix` + ' is not empty or only letters'
-    assert type(pmap) == dict, `pmap` + ' is not a dict'
+    assert is_pmap(pmap), `pmap` + ' is not a prefix map'
+    
+    if type(pmap) == dict:
+        count = 0
+        for word in autocomplete_iter(prefix, pmap):
+            count = count + 1
+        return count
+    
+    node = pmap.find(prefix)
+    if node is None:
+        return 0
+    return pmap.count(node)
+
 
-    if prefix != '' and (not pmap_has_word(pmap, prefix)):
+def autocomplete_top(prefix, pmap, k):
+    """Returns the list of the k best-ranked words that complete prefix in pmap.
+    
+    The words are listed best rank first.  Words of equal rank, including all of
+    the unranked words, are listed in alphabetical order.  If fewer than k words
+    complete prefix, the list has all of them.
+    
+    Every node of a ranked prefix map stores the best rank below it.  So this 
+    function does a best-first search: it keeps a heap of the nodes it has seen, 
+    ordered by best rank, and always expands the best one.  It stops as soon as 
+    it has k words, without visiting the rest of the completions.
+    
+    Example: If pmap is the Trie for 'complete.txt', ranked by 'common.txt', then 
+    autocomplete_top('th',pmap,3) returns ['the', 'that', 'this'].
+    
+    Precondition: prefix is a string that is either empty or has only letters.
+    pmap is a prefix map that supports ranks (see pmap_add_ranks).  k is an 
+    int >= 0.
+    
+    Enforced Precondition: We enforce the complete precondition for prefix and k.
+    We only enforce that pmap has a best_rank method."""
+    assert type(prefix) == str, `prefix` + ' is not a string'
+    assert len(prefix) == 0 or prefix.isalpha() == True,`prefix` + ' is not empty or only letters'
+    assert hasattr(pmap, 'best_rank'), `pmap` + ' does not support ranks'
+    assert type(k) == int and k >= 0, `k` + ' is not a non-negative int'
+    
+    node = pmap.find(prefix)
+    if node is None or k == 0:
         return []
-    else:
-        wordlist = []
-        thelist = pmap[prefix]
-        if thelist == ['']:
-            return [prefix] 
+    
+    # Heap entries are (rank, word, kind, node).  Kind 0 is a word, and kind 1 is 
+    # the subtree below node, ranked by its best rank.
+    result = []
+    heap = [(pmap.best_rank(node), prefix, 1, node)]
+    while heap and len(result) < k:
+        rank, word, kind, node = heapq.heappop(heap)
+        if kind == 0:
+            result.append(word)
         else:
-            if '' in thelist:
-                wordlist = [prefix]
-                listcopy = thelist[:]
-                listcopy.remove('')
-                newlist = word_list_extend(listcopy, prefix)
-            else:
-                newlist = word_list_extend(thelist, prefix)
-            for x in newlist:
-                wordlist = wordlist + autocomplete(x,pmap)
-            return wordlist
+            if pmap.is_word(node):
+                heapq.heappush(heap, (pmap.rank(node), word, 0, node))
+            for letter, child in pmap.children(node):
+                heapq.heappush(heap, (pmap.best_rank(child), word+letter, 1, child))
+    return result
 
 
 # PART D: Scrabble Puzzles
 
+# The blank tile, which can stand for any letter
+BLANK = '?'
+
+
+def is_rack(rack):
+    """Returns True if rack is a tile rack: a string of letters and blanks ('?').
+    
+    The empty string is a rack.
+    
+    Precondition: NONE (rack can be any value)"""
+    if type(rack) != str:
+        return False
+    tiles = rack.replace(BLANK,'')
+    return len(tiles) == 0 or tiles.isalpha()
+
+
 def scrabble(rack,size,pmap):
     """Returns the list of all valid words that you can form from the tile rack
     using EXACTLY size letters.
     
-    The prefix map pmap is used to determine whether or not a word is valid.
+    The prefix map pmap is used to determine whether or not a word is valid.  
+    Each word is listed once, even if the rack has repeated letters, and the list
+    is sorted.  The rack may have blanks ('?'), which can stand for any letter; 
+    see scrabble_blanks to find out which letters they stood for.
     
     Example: If pmap is the prefix map created from 'short.txt', then 
-    scrabble('theob',2,pmap) returns ['be', 'to'].
+    scrabble('theob',2,pmap) returns ['be', 'to'], and scrabble('t?',2,pmap) 
+    returns ['it', 'to'].
     
-    Precondition: rack is a string that is either empty or has only letters. 
+    Precondition: rack is a string of letters and blanks, which may be empty. 
     size is a nonnegative integer. pmap is a prefix map.
    
     Enforced Precondition: We enforce the complete precondition for rack and size.
-    We only enforce that pmap is a dict."""
+    We only enforce that pmap is a prefix map."""
     # We are not going to assert the preconditions here
     # We will let you do that in the helper function.
     return scrabble_helper('',rack,size,pmap)
 
 
+def scrabble_blanks(rack,size,pmap):
+    """Returns the list of pairs (word, blanks) for the valid words that you can 
+    form from the tile rack using EXACTLY size letters.
+    
+    blanks is the string of letters that the blanks stood for, in the order they
+    occur in word.  A blank is only used for a letter when the rack has no tile 
+    left with that letter, so each word is listed once, with as few blanks as 
+    possible; blanks that are not needed are left on the rack.  The list is 
+    sorted by word.
+    
+    Example: If pmap is the prefix map created from 'short.txt', then 
+    scrabble_blanks('t?e',3,pmap) returns [('the', 'h')], and 
+    scrabble_blanks('a??',2,pmap) returns [('be', 'be'), ('in', 'in'), 
+    ('it', 'it'), ('of', 'of'), ('to', 'to')].
+    
+    Precondition: rack is a string of letters and blanks, which may be empty. 
+    size is a nonnegative integer. pmap is a prefix map.
+    
+    Enforced Precondition: We enforce the complete precondition for rack and size.
+    We only enforce that pmap is a prefix map."""
+    assert is_rack(rack), `rack` + ' is not a string of letters and blanks'
+    assert type(size) == int and size >= 0, `size` + ' is not a non-negative integer'
+    assert is_pmap(pmap), `pmap` + ' is not a prefix map'
+    
+    nodes = pmap_nodes(pmap)
+    node = nodes.find('')
+    if size==0 or rack == '' or node is None:
+        return []
+    counts = rack_counts(rack)
+    result = []
+    _scrabble_search(nodes,node,'',_rack_letters(counts),counts,size,'',result)
+    return result
+
+
+def rack_counts(rack):
+    """Returns the tile rack as a dict from each letter to how many times it occurs.
+    
+    Blanks are counted like letters, under BLANK.
+    
+    Example: rack_counts('eeessst') returns {'e':3, 's':3, 't':1}.
+    
+    Precondition: rack is a string of letters and blanks, which may be empty.
+    
+    Enforced Precondition: rack is a string."""
+    assert type(rack) == str, `rack` + ' is not a string'
+    counts = {}
+    for x in rack:
+        if x in counts:
+            counts[x] = counts[x] + 1
+        else:
+            counts[x] = 1
+    return counts
+
+
+def _rack_letters(counts):
+    """Returns the sorted list of the letters (not blanks) in counts.
+    
+    Precondition: counts is a dict as returned by rack_counts."""
+    letters = sorted(counts)
+    if BLANK in counts:
+        letters.remove(BLANK)
+    return letters
+
+
 def scrabble_helper(prefix,rack,size,pmap):
     """"Returns the list of all valid words extending prefix that you can form from
     the tile rack using EXACTLY size ADDITIONAL letters.
     
-    The prefix map pmap is used to determine whether or not a word is valid.
+    The prefix map pmap is used to determine whether or not a word is valid.  
+    Each word is listed once, and the list is sorted.
     
     Example: If pmap is the prefix map created from 'short.txt', then 
     scrabble_helper('t','heob',1,pmap) returns ['to'], while 
     scrabble_helper('t','heob',2,pmap) returns ['the']
 
-    Precondition: prefix and rack are a strings with only letters, but which may
-    be empty. size is a nonnegative integer. pmap is a prefix map.
+    Precondition: prefix is a string with only letters, and rack is a string of 
+    letters and blanks, but either may be empty. size is a nonnegative integer. 
+    pmap is a prefix map.
    
     Enforced Precondition: We enforce the complete precondition for prefix, rack, 
-    and size. We only enforce that pmap is a dict."""
-    # This function is to be implemented recursively using the process that was
-    # described in the assignment overview.  At each recursive call, you will remove 
-    # a letter from the rack and add it to the prefix.  Note that,  unlike scramble, 
-    # size is not the number of letters in the word. It is the number of letters 
-    # REMAINING to pick from the rack. So you must decrease it in the recursive call
-    # as well.
-    
-    # This recursive function will have multiple base cases:
-    
-    #     1. size is 0 (so no letter left to pick)
-    #     2. size > 0, but rack is empty (so there is nothing left to pick from)
-    #     3. there are no words that complete prefix
-    
-    # In the case of 2 and 3, you should return the empty list.
-    
+    and size. We only enforce that pmap is a prefix map."""
     assert type(prefix) == str, `prefix` + ' is not a string'
     assert len(prefix) == 0 or prefix.isalpha() == True,`prefix` + ' is not empty or only letters'
-    assert type(rack) == str, `rack` + ' is not a string'
-    assert len(rack) == 0 or rack.isalpha() == True,`rack` + ' is not empty or only letters'
+    assert is_rack(rack), `rack` + ' is not a string of letters and blanks'
     assert type(size) == int and size >= 0, `size` + ' is not a non-negative integer'
-    assert type(pmap) == dict, `pmap` + ' is not a dict'
+    assert is_pmap(pmap), `pmap` + ' is not a prefix map'
     
-    if size==0 or rack == '':
+    nodes = pmap_nodes(pmap)
+    node = nodes.find(prefix)
+    if size==0 or rack == '' or node is None:
         return []
-    else:
-        scrabblelist = []
-        autolist = autocomplete(prefix,pmap)
-        wordlength = len(prefix) + size
-        sizelist = word_list_by_size(autolist, wordlength)
-        for x in rack:
-            print 'pmap[prefix] is '+`pmap[prefix]`
-            if x in pmap[prefix]:
-                print `x`+' is in pmap[prefix]'
-                newprefix = prefix + x
-                print newprefix
-                
-                pos = rack.find(x)
-                first = rack[:pos]
-                last = rack[pos+1:]
-                newrack = first + last
-                print 'newrack is '+`newrack`
-                
-                newsize = size - 1
-                if newprefix in sizelist:
-                    print 'newprefix is in sizelist'
-                    scrabblelist = scrabblelist + [newprefix]
-                    print 'scrabblelist is ' + `scrabblelist`
-                scrabblelist = scrabblelist + scrabble_helper(newprefix, newrack, newsize, pmap)
-                print 'after recursion, scrabblelist is '+`scrabblelist`
-        return scrabblelist
-
-
-def match(template,pmap):
+    counts = rack_counts(rack)
+    found = []
+    _scrabble_search(nodes,node,prefix,_rack_letters(counts),counts,size,'',found)
+    return [word for word, blanks in found]
+
+
+def _scrabble_search(nodes,node,prefix,letters,counts,size,used,result):
+    """Appends to result the pair (word, blanks) for every word below node that 
+    uses EXACTLY size more letters from the rack.
+    
+    The search walks the nodes of the prefix map, and checks whether a node ends 
+    a word with nodes.is_word, so it only does work at the nodes it visits.  When
+    the map stores completion lengths, it also skips every node that has no 
+    completion of exactly size letters.
+    
+    The rack is a multiset: counts maps each letter to the number of tiles left 
+    with that letter.  A letter is tried once no matter how many tiles have it, 
+    so that a rack like 'eeessst' does not search the same words three times 
+    over.  This also means that no word can be found twice.  The letters are 
+    tried in order, so the words are found in sorted order.
+    
+    While there are blanks left, the search follows every child of node instead,
+    as those are the only letters a blank could usefully stand for.  It takes a 
+    tile with the child's letter if there is one, and a blank only if there is 
+    not, so no word is found twice.  blanks is used followed by the letters the 
+    blanks below node stood for.
+    
+    counts is changed while searching, but is restored before returning.
+    
+    Precondition: nodes is a prefix map as returned by pmap_nodes, and node is 
+    its node for prefix.  letters is the sorted list of the letters in counts.  
+    counts is a dict as returned by rack_counts.  size is an int >= 0.  used is 
+    the string of letters the blanks in prefix stood for.  result is a list."""
+    if size == 0:
+        if nodes.is_word(node):
+            result.append((prefix,used))
+        return
+    if not _can_complete(nodes,node,size):
+        return
+    if counts.get(BLANK,0) == 0:
+        for x in letters:
+            if counts[x] > 0:
+                child = nodes.child(node,x)
+                if child is not None:
+                    counts[x] = counts[x] - 1
+                    _scrabble_search(nodes,child,prefix+x,letters,counts,size-1,used,result)
+                    counts[x] = counts[x] + 1
+        return
+    for x, child in nodes.children(node):
+        if counts.get(x,0) > 0:
+            counts[x] = counts[x] - 1
+            _scrabble_search(nodes,child,prefix+x,letters,counts,size-1,used,result)
+            counts[x] = counts[x] + 1
+        else:
+            counts[BLANK] = counts[BLANK] - 1
+            _scrabble_search(nodes,child,prefix+x,letters,counts,size-1,used+x,result)
+            counts[BLANK] = counts[BLANK] + 1
+
+
+def _can_complete(nodes,node,size):
+    """Returns False if no completion of node has exactly size letters.
+    
+    This uses the completion lengths stored in the prefix map.  If the map does 
+    not store them (see nodemap.NodeMap), this always returns True, as finding 
+    them would cost more than the search it could save.
+    
+    Precondition: nodes is a prefix map as returned by pmap_nodes, and node is 
+    one of its nodes.  size is an int >= 0."""
+    if not getattr(nodes,'stores_lengths',False):
+        return True
+    shortest, longest = nodes.lengths(node)
+    return shortest <= size <= longest
+
+
+def scrabble_all(rack,pmap):
+    """Returns a dict from each length to the list of valid words of that length 
+    that you can form from the tile rack.
+    
+    Every word that uses at least one tile is found in a single search, instead 
+    of one search per length.  Each list is sorted.  Lengths with no words are 
+    left out.
+    
+    Example: If pmap is the prefix map created from 'short.txt', then 
+    scrabble_all('theob',pmap) returns {2: ['be', 'to'], 3: ['the']}.
+    
+    Precondition: rack is a string of letters and blanks, which may be empty. 
+    pmap is a prefix map.
+    
+    Enforced Precondition: We enforce the complete precondition for rack.  We 
+    only enforce that pmap is a prefix map."""
+    result = {}
+    for word in scrabble_iter(rack,pmap):
+        size = len(word)
+        if size in result:
+            result[size].append(word)
+        else:
+            result[size] = [word]
+    return result
+
+
+def scrabble_iter(rack,pmap):
+    """Yields every valid word that you can form from the tile rack, in sorted order.
+    
+    This is a generator, so the words can be used as they are found.  Words of 
+    every length are found in a single walk of the prefix map.  Like scrabble, 
+    the rack is searched as a multiset, so no word is yielded twice.  When the 
+    map stores completion lengths, the walk skips every node whose shortest 
+    completion needs more tiles than are left.  Blanks are used as in 
+    scrabble_blanks.
+    
+    Example: If pmap is the prefix map created from 'short.txt', then 
+    list(scrabble_iter('theob',pmap)) is ['be', 'the', 'to'].
+    
+    Precondition: rack is a string of letters and blanks, which may be empty. 
+    pmap is a prefix map.
+    
+    Enforced Precondition: We enforce the complete precondition for rack.  We 
+    only enforce that pmap is a prefix map."""
+    assert is_rack(rack), `rack` + ' is not a string of letters and blanks'
+    assert is_pmap(pmap), `pmap` + ' is not a prefix map'
+    
+    nodes = pmap_nodes(pmap)
+    if rack == '' or nodes.find('') is None:
+        return
+    counts = rack_counts(rack)
+    letters = _rack_letters(counts)
+    letters.reverse()
+    
+    # Entries are (word, node, tile), where tile was taken to reach node.  An 
+    # entry with node None puts its tile back, once the node's subtree has been 
+    # searched.
+    stack = [('', nodes.find(''), None)]
+    while stack:
+        word, node, tile = stack.pop()
+        if node is None:
+            counts[tile] = counts[tile] + 1
+            continue
+        if tile is not None:
+            counts[tile] = counts[tile] - 1
+            stack.append((word, None, tile))
+            if nodes.is_word(node):
+                yield word
+        
+        tiles = len(rack) - len(word)
+        if tiles == 0 or not _can_fit(nodes,node,tiles):
+            continue
+        # Push in reverse, so that the smallest letter is popped first
+        if counts.get(BLANK,0) == 0:
+            for x in letters:
+                if counts[x] > 0:
+                    child = nodes.child(node,x)
+                    if child is not None:
+                        stack.append((word+x, child, x))
+        else:
+            edges = nodes.children(node)
+            for pos in range(len(edges)-1, -1, -1):
+                x, child = edges[pos]
+                if counts.get(x,0) > 0:
+                    stack.append((word+x, child, x))
+                else:
+                    stack.append((word+x, child, BLANK))
+
+
+def _can_fit(nodes,node,tiles):
+    """Returns False if every completion of node has more than tiles letters.
+    
+    Like _can_complete, this always returns True if the map does not store 
+    completion lengths.
+    
+    Precondition: nodes is a prefix map as returned by pmap_nodes, and node is 
+    one of its nodes.  tiles is an int >= 0."""
+    if not getattr(nodes,'stores_lengths',False):
+        return True
+    return nodes.lengths(node)[0] <= tiles
+
+
+def match(template,pmap,rpmap=None):
     """Returns the list of all valid words that match the given template.
     
     A template is a string combining letters and the '?' character.  A
@@ -343,25 +884,72 @@ def match(template,pmap):
     
     The prefix map pmap is used to determine whether or not a word is valid.
     
+    A template like '???ing' has to follow every path of three letters in pmap 
+    before it reaches a fixed letter.  If rpmap is not None, it is the prefix 
+    map of the same words reversed (see reverse_word_list), and the template is 
+    matched from whichever end starts with more fixed letters (see 
+    reverse_template).  The list is sorted either way.
+    
     Example: If pmap is the prefix map created from 'short.txt', then 
     match('i?',pmap) returns ['in', 'it'].
     
     Precondition: template is a string of letters and '?'. pmap is a
-    prefix map.
+    prefix map.  rpmap is None or the prefix map for the reversed words of pmap.
     
-    Enforced Precondition: template is a string. pmap is a dict."""
+    Enforced Precondition: template is a string. pmap is a prefix map."""
     # We are not going to assert the preconditions here
     # We will let you do that in the helper function.
+    if rpmap is not None and reverse_template(template):
+        return reverse_word_list(match_helper('',template[::-1],rpmap))
     return match_helper('',template,pmap)
 
 
+def reverse_word_list(words):
+    """Returns the sorted list of the words in words, each spelled backwards.
+    
+    The prefix map of this list is the reversed map used by match and 
+    match_rack.  Reversing a list of reversed words gives back the words.
+    
+    Example: reverse_word_list(['the','be']) returns ['eb', 'eht'].
+    
+    Precondition: words is a list of strings.
+    
+    Enforced Precondition: words is a list."""
+    assert type(words) == list, `words` + ' is not a list'
+    return sorted([word[::-1] for word in words])
+
+
+def reverse_template(template):
+    """Returns True if template should be matched backwards, from its end.
+    
+    A template is matched from the end when it ends with more fixed letters 
+    (before the first '?') than it starts with.  Those are the letters that 
+    narrow a search of a prefix map right away.
+    
+    Example: reverse_template('???ing') is True, and reverse_template('re??ed') is 
+    False.
+    
+    Precondition: template is a string of letters and '?'."""
+    return _fixed_run(template[::-1]) > _fixed_run(template)
+
+
+def _fixed_run(template):
+    """Returns the number of letters at the start of template before a '?'.
+    
+    Precondition: template is a string of letters and '?'."""
+    pos = template.find('?')
+    if pos == -1:
+        return len(template)
+    return pos
+
+
 def match_helper(prefix,template,pmap):
     """Returns the list of all valid words that start with the given prefix, and
     whose remaining letters match the given template.
     
     Unlike match, the template in this case is not supposed to match the whole
     string. It is only supposed to match the remaining part of the string after
-    the prefix.
+    the prefix.  The list is sorted.
     
     Example: If pmap is the prefix map created from 'short.txt', then 
     match_helper('i','?',pmap) returns ['in', 'it'].
@@ -370,57 +958,128 @@ def match_helper(prefix,template,pmap):
     string of letters and '?'. pmap is a prefix map.
     
     Enforced Precondition: prefix is a string of letters or empty. template is a string. 
-    pmap is a dict."""
-    # This function is to be implemented recursively using a process that is similar
-    # to, but not the same as scrabble.  At each recursive call, you will remove
-    # the first element from template.  If it is a letter, you add it to the prefix.
-    # If it is a '?', you must try each valid extension of the prefix.
-    
-    # There are two base cases: when there are no word that complete the prefix, and 
-    # when the template is empty.  In that second case, what you do depends on whether 
-    # or not prefix is a word.
-    
+    pmap is a prefix map."""
     assert (type(prefix) == str), `prefix` + ' is not a string'
     assert prefix.isalpha() or prefix == '', `prefix` + ' is not empty or all letters'
     assert type(template) == str, `template` + ' is not a string'
-    assert type(pmap) == dict, `pmap` + ' is not a dict'
+    assert is_pmap(pmap), `pmap` + ' is not a prefix map'
     
+    nodes = pmap_nodes(pmap)
+    node = nodes.find(prefix)
     matchlist = []
-    autolist = autocomplete(prefix,pmap)
-    wordlength = len(prefix) + len(template)
-    #print 'wordlength is '+`wordlength`
-    sizelist = word_list_by_size(autolist, wordlength)
-    #print 'sizelist is'+`sizelist`
+    if node is not None:
+        _match_search(nodes,node,prefix,template,0,matchlist)
+    return matchlist
+
+
+def _match_search(nodes,node,prefix,template,pos,result):
+    """Appends to result every word below node whose remaining letters match 
+    template[pos:].
+    
+    Like _scrabble_search, this walks the nodes of the prefix map, and skips the 
+    nodes with no completion of the right length when the map stores lengths.  
+    A letter in the template follows one edge; only a '?' follows them all.
+    
+    Precondition: nodes is a prefix map as returned by pmap_nodes, and node is 
+    its node for prefix.  template is a string of letters and '?'.  pos is an 
+    int in 0..len(template).  result is a list."""
+    if pos == len(template):
+        if nodes.is_word(node):
+            result.append(prefix)
+        return
+    if not _can_complete(nodes,node,len(template)-pos):
+        return
+    x = template[pos]
+    if x == '?':
+        for letter, child in nodes.children(node):
+            _match_search(nodes,child,prefix+letter,template,pos+1,result)
+    else:
+        child = nodes.child(node,x)
+        if child is not None:
+            _match_search(nodes,child,prefix+x,template,pos+1,result)
+
+
+def match_rack(template,rack,pmap,rpmap=None):
+    """Returns the list of all valid words that match the given template, filling 
+    each '?' with a tile from the rack.
     
-    if prefix not in pmap:
-        return []
-    if template == '':
-        #print 'template is empty string'
-        if prefix in sizelist:
-            return [prefix]
-        else:
-            return []
-        return matchlist
-    elif template[0].isalpha():
-        #print 'template[0] is letter'
-        newprefix = prefix + template[0]
-        #print 'newprefix is '+`newprefix`
-        newtemplate = template[1:]
-        matchlist = matchlist + match_helper(newprefix,newtemplate,pmap)
-        return matchlist
-    elif template[0] == '?':
-        #print 'template[0] is ?'
-        nextletterlist = pmap[prefix]
-        copynll = nextletterlist[:]
-        if '' in copynll:
-            copynll.remove('')
-        #print 'copynll is '+`copynll`
-        for x in copynll:
-            #print 'x is '+`x`
-            newprefix = prefix + x
-            #print 'newprefix is '+`newprefix`
-            newtemplate = template[1:]
-            matchlist = matchlist + match_helper(newprefix,newtemplate,pmap)
-            #print 'matchlist is '+`matchlist`
-        return matchlist
+    The letters of the template are already in place (on the board, say), and 
+    cost no tiles.  Each '?' takes one tile, and each tile can be used only once, 
+    so the rack must hold the letters of every '?'.  The rack may have blanks, 
+    which can fill a '?' with any letter, as in scrabble.  The list is sorted.
+    
+    This is a single search: the template's letters follow one edge each, and a 
+    '?' only follows the edges for letters still on the rack.
+    
+    As in match, if rpmap is the prefix map of the reversed words, the template 
+    is matched from whichever end starts with more fixed letters.
+    
+    Example: If pmap is the prefix map created from 'short.txt', then 
+    match_rack('?h??','tatb',pmap) returns ['that'], while match_rack('t??',
+    'eob',pmap) returns [], as there is no 'h' on the rack.
+    
+    Precondition: template is a string of letters and '?'.  rack is a string of 
+    letters and blanks, which may be empty.  pmap is a prefix map.  rpmap is None 
+    or the prefix map for the reversed words of pmap.
     
+    Enforced Precondition: template is a string.  We enforce the complete 
+    precondition for rack.  We only enforce that pmap is a prefix map."""
+    assert type(template) == str, `template` + ' is not a string'
+    assert is_rack(rack), `rack` + ' is not a string of letters and blanks'
+    assert is_pmap(pmap), `pmap` + ' is not a prefix map'
+    
+    if rpmap is not None and reverse_template(template):
+        return reverse_word_list(match_rack(template[::-1],rack,rpmap))
+    nodes = pmap_nodes(pmap)
+    node = nodes.find('')
+    if node is None or template.count('?') > len(rack):
+        return []
+    counts = rack_counts(rack)
+    result = []
+    _match_rack_search(nodes,node,'',template,0,_rack_letters(counts),counts,result)
+    return result
+
+
+def _match_rack_search(nodes,node,prefix,template,pos,letters,counts,result):
+    """Appends to result every word below node whose remaining letters match 
+    template[pos:], with each '?' filled from the rack.
+    
+    This is _match_search, except that a '?' is filled as in _scrabble_search: 
+    with each letter of the rack once, or, while there are blanks left, with 
+    every child of node, taking a tile with that letter if there is one and a 
+    blank if not.  counts is changed while searching, but is restored before 
+    returning.
+    
+    Precondition: nodes is a prefix map as returned by pmap_nodes, and node is 
+    its node for prefix.  template is a string of letters and '?'.  pos is an 
+    int in 0..len(template).  letters is the sorted list of the letters in 
+    counts.  counts is a dict as returned by rack_counts.  result is a list."""
+    if pos == len(template):
+        if nodes.is_word(node):
+            result.append(prefix)
+        return
+    if not _can_complete(nodes,node,len(template)-pos):
+        return
+    x = template[pos]
+    if x != '?':
+        child = nodes.child(node,x)
+        if child is not None:
+            _match_rack_search(nodes,child,prefix+x,template,pos+1,letters,counts,result)
+    elif counts.get(BLANK,0) == 0:
+        for x in letters:
+            if counts[x] > 0:
+                child = nodes.child(node,x)
+                if child is not None:
+                    counts[x] = counts[x] - 1
+                    _match_rack_search(nodes,child,prefix+x,template,pos+1,letters,counts,result)
+                    counts[x] = counts[x] + 1
+    else:
+        for x, child in nodes.children(node):
+            if counts.get(x,0) > 0:
+                counts[x] = counts[x] - 1
+                _match_rack_search(nodes,child,prefix+x,template,pos+1,letters,counts,result)
+                counts[x] = counts[x] + 1
+            else:
+                counts[BLANK] = counts[BLANK] - 1
+                _match_rack_search(nodes,child,prefix+x,template,pos+1,letters,counts,result)
+                counts[BLANK] = counts[BLANK] + 1
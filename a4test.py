@@ -158,6 +158,39 @@ def test_pmap_add_word():
     cornelltest.assert_true('p' in pmap['goo'])
 
 
+def test_pmap_remove_word():
+    """Test function pmap_remove_word"""
+    print 'Testing pmap_remove_word'
+    
+    pmap = a4.word_list_to_pmap(['a', 'as', 'at', 'by'])
+    
+    # Not a word, so nothing changes
+    a4.pmap_remove_word(pmap,'b')
+    a4.pmap_remove_word(pmap,'cat')
+    a4.pmap_remove_word(pmap,'')
+    cornelltest.assert_equals(6, len(pmap))
+    
+    a4.pmap_remove_word(pmap,'as')
+    cornelltest.assert_equals(5, len(pmap))
+    cornelltest.assert_false('as' in pmap)
+    assert_lists_equal(['','t'], pmap['a'])
+    
+    # A word that is a prefix of another only loses its ''
+    a4.pmap_remove_word(pmap,'a')
+    cornelltest.assert_equals(5, len(pmap))
+    assert_lists_equal(['t'], pmap['a'])
+    cornelltest.assert_false(a4.pmap_has_word(pmap,'a'))
+    cornelltest.assert_true(a4.pmap_has_word(pmap,'at'))
+    
+    # Removing a whole branch
+    a4.pmap_remove_word(pmap,'by')
+    cornelltest.assert_equals(3, len(pmap))
+    assert_lists_equal(['a'], pmap[''])
+    
+    a4.pmap_remove_word(pmap,'at')
+    cornelltest.assert_equals({}, pmap)
+
+
 def test_word_list_to_pmap():
     """Test function word_list_to_pmap"""
     print 'Testing function word_list_to_pmap'
@@ -198,6 +231,26 @@ def test_word_list_to_pmap():
     assert_lists_equal(['y'], pmap['b'])
     cornelltest.assert_true('by' in pmap)
     assert_lists_equal([''], pmap['by'])
+    
+    # Unsorted, with duplicates and words that are prefixes of other words
+    words = ['goop', 'go', 'at', 'good', 'go', 'a', 'goo']
+    pmap = a4.word_list_to_pmap(words)
+    cornelltest.assert_equals(8, len(pmap))
+    cornelltest.assert_equals(['a','g'], pmap[''])
+    cornelltest.assert_equals(['','t'], pmap['a'])
+    cornelltest.assert_equals(['','o'], pmap['go'])
+    cornelltest.assert_equals(['','d','p'], pmap['goo'])
+    cornelltest.assert_equals([''], pmap['goop'])
+    
+    # Same prefixes and letters as adding the words one at a time
+    words = a4.build_word_list('short.txt')
+    other = {}
+    for x in words:
+        a4.pmap_add_word(other,x)
+    pmap = a4.word_list_to_pmap(words)
+    assert_lists_equal(other.keys(), pmap.keys())
+    for key in other:
+        assert_lists_equal(other[key], pmap[key])
 
 
 def test_pmap_to_word_list():
@@ -277,6 +330,63 @@ def test_autocomplete():
     words = a4.autocomplete('at',pmap)
     assert_lists_equal(['at','ate'], words)
 
+def test_autocomplete_iter():
+    """Test search function autocomplete_iter"""
+    print 'Testing function autocomplete_iter'
+    
+    pmap = {}
+    cornelltest.assert_equals([], list(a4.autocomplete_iter('',pmap)))
+    
+    # Lists in the map do not have to be sorted
+    pmap = { '':['a'], 'a':['t','','r'], 'at':['e',''], 'ate':[''], 'ar':['e'], 'are':[''] }
+    words = list(a4.autocomplete_iter('a',pmap))
+    cornelltest.assert_equals(['a','are','at','ate'], words)
+    
+    words = a4.build_word_list('short.txt')
+    pmap = a4.word_list_to_pmap(words)
+    cornelltest.assert_equals(sorted(words), list(a4.autocomplete_iter('',pmap)))
+    
+    # Limit
+    cornelltest.assert_equals(['a','and','be'], list(a4.autocomplete_iter('',pmap,3)))
+    cornelltest.assert_equals([], list(a4.autocomplete_iter('',pmap,0)))
+    cornelltest.assert_equals(['that','the'], list(a4.autocomplete_iter('th',pmap,5)))
+    
+    # Cursor, both at a word and between words
+    cornelltest.assert_equals(['it','of','that'], list(a4.autocomplete_iter('',pmap,3,'in')))
+    cornelltest.assert_equals(['the'], list(a4.autocomplete_iter('th',pmap,None,'that')))
+    cornelltest.assert_equals(['the'], list(a4.autocomplete_iter('th',pmap,None,'thb')))
+    cornelltest.assert_equals(['that','the'], list(a4.autocomplete_iter('th',pmap,None,'tha')))
+    cornelltest.assert_equals(['that','the'], list(a4.autocomplete_iter('th',pmap,None,'a')))
+    cornelltest.assert_equals([], list(a4.autocomplete_iter('th',pmap,None,'to')))
+    cornelltest.assert_equals([], list(a4.autocomplete_iter('th',pmap,None,'the')))
+    
+    # Paging through every word gives the whole list
+    paged = []
+    page = list(a4.autocomplete_iter('',pmap,4))
+    while page:
+        paged.extend(page)
+        page = list(a4.autocomplete_iter('',pmap,4,page[-1]))
+    cornelltest.assert_equals(sorted(words), paged)
+    
+    # Long chains do not hit the recursion limit
+    pmap = a4.word_list_to_pmap(['a'*2000])
+    cornelltest.assert_equals(['a'*2000], list(a4.autocomplete_iter('a',pmap)))
+
+
+def test_count_completions():
+    """Test function count_completions"""
+    print 'Testing function count_completions'
+    
+    cornelltest.assert_equals(0, a4.count_completions('a',{}))
+    
+    words = a4.build_word_list('short.txt')
+    pmap = a4.word_list_to_pmap(words)
+    cornelltest.assert_equals(10, a4.count_completions('',pmap))
+    cornelltest.assert_equals(2, a4.count_completions('th',pmap))
+    cornelltest.assert_equals(1, a4.count_completions('the',pmap))
+    cornelltest.assert_equals(0, a4.count_completions('x',pmap))
+
+
 def test_scrabble():
     """Test search function scrabble"""
     print 'Testing function scrabble'
@@ -308,6 +418,68 @@ def test_scrabble():
     words = a4.scrabble('veha',4,pmap)
     assert_lists_equal(['have'], words)
     
+    # Repeated tiles do not repeat words, and the words are sorted
+    wordlist = ['set','sets','tee','tees','test','tests','see','sees','seen']
+    pmap = a4.word_list_to_pmap(wordlist)
+    words = a4.scrabble('eeessst',4,pmap)
+    cornelltest.assert_equals(['sees','sets','tees'], words)
+    words = a4.scrabble('eeessst',3,pmap)
+    cornelltest.assert_equals(['see','set','tee'], words)
+    words = a4.scrabble_helper('te','eesss',2,pmap)
+    cornelltest.assert_equals(['tees'], words)
+    cornelltest.assert_equals({'e':3,'s':3,'t':1}, a4.rack_counts('eeessst'))
+    cornelltest.assert_equals({}, a4.rack_counts(''))
+    
+
+def test_scrabble_blanks():
+    """Test search functions scrabble and scrabble_blanks with blank tiles"""
+    print 'Testing function scrabble_blanks'
+    
+    wordlist = ['the','be','to','of','a','and','in','that','have','it']
+    pmap = a4.word_list_to_pmap(wordlist)
+    
+    cornelltest.assert_equals(['it','to'], a4.scrabble('t?',2,pmap))
+    cornelltest.assert_equals(['be','in','it','of','to'], a4.scrabble('??',2,pmap))
+    cornelltest.assert_equals([('the','h')], a4.scrabble_blanks('t?e',3,pmap))
+    cornelltest.assert_equals([('it','i'),('to','o')], a4.scrabble_blanks('t?',2,pmap))
+    cornelltest.assert_equals([('a','')], a4.scrabble_blanks('a?',1,pmap))
+    cornelltest.assert_equals([('that','a')], a4.scrabble_blanks('htt?',4,pmap))
+    cornelltest.assert_equals([('that','at')], a4.scrabble_blanks('th??',4,pmap))
+    cornelltest.assert_equals([], a4.scrabble_blanks('?',0,pmap))
+    cornelltest.assert_equals(['and','the'], a4.scrabble('???',3,pmap))
+    cornelltest.assert_equals({1:['a'], 2:['be','in','it','of','to'], 3:['the']},
+                              a4.scrabble_all('e??',pmap))
+    cornelltest.assert_true(a4.is_rack('ab?'))
+    cornelltest.assert_true(a4.is_rack(''))
+    cornelltest.assert_false(a4.is_rack('a b'))
+    cornelltest.assert_false(a4.is_rack(3))
+
+
+def test_scrabble_all():
+    """Test search functions scrabble_all and scrabble_iter"""
+    print 'Testing function scrabble_all'
+    
+    wordlist = ['the','be','to','of','a','and','in','that','have','it']
+    pmap = a4.word_list_to_pmap(wordlist)
+    
+    cornelltest.assert_equals({2:['be','to'], 3:['the']}, a4.scrabble_all('theob',pmap))
+    cornelltest.assert_equals({}, a4.scrabble_all('',pmap))
+    cornelltest.assert_equals({}, a4.scrabble_all('xyz',pmap))
+    cornelltest.assert_equals(['be','the','to'], list(a4.scrabble_iter('theob',pmap)))
+    
+    # Each length agrees with scrabble
+    wordlist = ['set','sets','tee','tees','test','tests','see','sees','seen','e']
+    pmap = a4.word_list_to_pmap(wordlist)
+    words = a4.scrabble_all('eeessst',pmap)
+    cornelltest.assert_equals([1,3,4], sorted(words.keys()))
+    for size in range(1,8):
+        cornelltest.assert_equals(a4.scrabble('eeessst',size,pmap), words.get(size,[]))
+    
+    # The generator can be stopped early
+    found = a4.scrabble_iter('eeessst',pmap)
+    cornelltest.assert_equals('e', found.next())
+    cornelltest.assert_equals('see', found.next())
+
 
 def test_match():
     """Test search function match"""
@@ -342,6 +514,58 @@ def test_match():
     
     words = a4.match('a?e',pmap)
     assert_lists_equal(['ate','are','ale','axe'], words)
+    
+    # Matching from the end, with the reversed map
+    rpmap = a4.word_list_to_pmap(a4.reverse_word_list(wordlist))
+    cornelltest.assert_equals(['ale','are','ate','axe'], a4.match('a?e',pmap,rpmap))
+    cornelltest.assert_equals(['axes'], a4.match('??es',pmap,rpmap))
+    cornelltest.assert_equals([], a4.match('??ex',pmap,rpmap))
+    cornelltest.assert_equals(['axe'], a4.match('?xe',pmap,rpmap))
+
+
+def test_reverse():
+    """Test functions reverse_word_list and reverse_template"""
+    print 'Testing functions reverse_word_list and reverse_template'
+    cornelltest.assert_equals(['eb', 'eht'], a4.reverse_word_list(['the','be']))
+    cornelltest.assert_equals([], a4.reverse_word_list([]))
+    cornelltest.assert_true(a4.reverse_template('???ing'))
+    cornelltest.assert_true(a4.reverse_template('a?ing'))
+    cornelltest.assert_true(a4.reverse_template('a??ed'))
+    cornelltest.assert_false(a4.reverse_template('ab?ed'))
+    cornelltest.assert_false(a4.reverse_template('???'))
+    cornelltest.assert_false(a4.reverse_template('the'))
+
+
+def test_match_rack():
+    """Test search function match_rack"""
+    print 'Testing function match_rack'
+    
+    wordlist = ['the','be','to','of','a','and','in','that','have','it']
+    pmap = a4.word_list_to_pmap(wordlist)
+    
+    cornelltest.assert_equals(['that'], a4.match_rack('?h??','tatb',pmap))
+    cornelltest.assert_equals([], a4.match_rack('t??','eob',pmap))
+    cornelltest.assert_equals(['the'], a4.match_rack('t??','eoh',pmap))
+    cornelltest.assert_equals(['be','in','it'], a4.match_rack('??','bient',pmap))
+    cornelltest.assert_equals(['that'], a4.match_rack('that','',pmap))
+    cornelltest.assert_equals([], a4.match_rack('???','ab',pmap))
+    
+    # A '?' in the template takes one tile, and a tile fills only one '?'
+    wordlist = ['ate','are','ale','axe','axes','eel','see']
+    pmap = a4.word_list_to_pmap(wordlist)
+    cornelltest.assert_equals(['ale','are'], a4.match_rack('a?e','lrs',pmap))
+    cornelltest.assert_equals(['see'], a4.match_rack('?ee','s',pmap))
+    cornelltest.assert_equals([], a4.match_rack('??e','s',pmap))
+    cornelltest.assert_equals([], a4.match_rack('??e','ss',pmap))
+    cornelltest.assert_equals(['see'], a4.match_rack('??e','es',pmap))
+    
+    # Blanks fill a '?' with any letter, only when no tile has that letter
+    cornelltest.assert_equals(['ale','are','ate','axe'], a4.match_rack('a?e','?',pmap))
+    cornelltest.assert_equals(['axes'], a4.match_rack('a??s','e?',pmap))
+    cornelltest.assert_equals(['eel','see'], a4.match_rack('?e?','e?',pmap))
+    rpmap = a4.word_list_to_pmap(a4.reverse_word_list(wordlist))
+    cornelltest.assert_equals(['axes'], a4.match_rack('??es','xa',pmap,rpmap))
+    cornelltest.assert_equals(['eel','see'], a4.match_rack('?e?','e?',pmap,rpmap))
 
 
 # Application Code
@@ -353,14 +577,21 @@ if __name__ == "__main__":
 
     # Part B
     test_pmap_add_word()
+    test_pmap_remove_word()
     test_word_list_to_pmap()
     test_pmap_to_word_list()
     test_pmap_has_word()
     
     # Part C
     test_autocomplete()
+    test_autocomplete_iter()
+    test_count_completions()
     
     # Part D
     test_scrabble()
+    test_scrabble_blanks()
+    test_scrabble_all()
     test_match()
+    test_reverse()
+    test_match_rack()
     print "Module a4 is working correctly"
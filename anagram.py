@@ -0,0 +1,150 @@
+# anagram.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Anagram indexes: words grouped by the multiset of their letters
+
+Two words are anagrams when they have the same letters, the same number of times
+each.  The signature of a word is its letters in sorted order, so anagrams are
+exactly the words with the same signature.  An AnagramIndex maps each signature
+to its words.
+
+Unscrambling a full rack is then one dict lookup, with no search at all.  The
+words that use only part of a rack are found by looking up each sub-signature:
+each way of choosing how many of each letter to keep.  A rack of n tiles has at
+most 2**n of these, and fewer when letters repeat.
+"""
+import a4
+
+
+def signature(word):
+    """Returns the letters of word in sorted order.
+
+    Example: signature('teach') returns 'aceht', as does signature('cheat').
+
+    Precondition: word is a string."""
+    return ''.join(sorted(word))
+
+
+def sub_signatures(rack, size=None):
+    """Returns the sorted list of the signatures of every sub-rack of rack.
+
+    A sub-rack keeps any number of the tiles of each letter, from none to all of
+    them, so the signatures are distinct even if rack has repeated letters.  If
+    size is not None, only the signatures with size letters are included.
+
+    Example: sub_signatures('tee') returns ['', 'e', 'ee', 'eet', 'et', 't'], and
+    sub_signatures('tee', 2) returns ['ee', 'et'].
+
+    Precondition: rack is a string that is either empty or has only letters.
+    size is None or an int >= 0."""
+    counts = a4.rack_counts(rack)
+    result = ['']
+    left = len(rack)
+    for letter in sorted(counts):
+        left = left - counts[letter]
+        extended = []
+        for sig in result:
+            for amount in range(counts[letter] + 1):
+                total = len(sig) + amount
+                # Skip signatures that are too long, or too short to ever finish
+                if size is None or (total <= size and total + left >= size):
+                    extended.append(sig + letter * amount)
+        result = extended
+    result.sort()
+    return result
+
+
+class AnagramIndex(object):
+    """Instances map each signature to the words with that signature.
+
+    Instance Attributes:
+        word_count: the number of words in this index [int >= 0]
+    """
+
+    def __init__(self, words):
+        """**Constructor**: Create the anagram index for words.
+
+        Duplicates are ignored.
+
+        Precondition: words is a list of strings with only letters.
+
+        Enforced Precondition: words is a list."""
+        assert type(words) == list, `words` + ' is not a list'
+        self._words = {}
+        self.word_count = 0
+        for word in sorted(words):
+            key = signature(word)
+            if not key in self._words:
+                self._words[key] = [word]
+                self.word_count = self.word_count + 1
+            elif self._words[key][-1] != word:
+                self._words[key].append(word)
+                self.word_count = self.word_count + 1
+
+    def __len__(self):
+        """Returns the number of words in this index."""
+        return self.word_count
+
+    def signature_count(self):
+        """Returns the number of distinct signatures in this index."""
+        return len(self._words)
+
+    def anagrams(self, rack):
+        """Returns the sorted list of words that use every tile of rack exactly once.
+
+        This is a single dict lookup.
+
+        Example: In the index for 'short.txt', anagrams('eht') returns ['the'].
+
+        Precondition: rack is a string.
+
+        Enforced Precondition: rack is a string."""
+        assert type(rack) == str, `rack` + ' is not a string'
+        key = signature(rack)
+        if key in self._words:
+            return self._words[key][:]
+        return []
+
+    def scrabble(self, rack, size):
+        """Returns the sorted list of words that you can form from rack using
+        EXACTLY size letters, as in a4.scrabble.
+
+        If size is the length of rack, this is the same as anagrams(rack).
+        Otherwise it looks up every sub-signature of rack with size letters.
+
+        Precondition: rack is a string that is either empty or has only letters.
+        size is an int >= 0.
+
+        Enforced Precondition: rack is a string.  size is an int >= 0."""
+        assert type(rack) == str, `rack` + ' is not a string'
+        assert type(size) == int and size >= 0, `size` + ' is not a non-negative integer'
+        if size == 0 or size > len(rack):
+            return []
+        if size == len(rack):
+            return self.anagrams(rack)
+        result = []
+        for key in sub_signatures(rack, size):
+            if key in self._words:
+                result.extend(self._words[key])
+        result.sort()
+        return result
+
+    def scrabble_all(self, rack):
+        """Returns a dict from each length to the sorted list of words of that
+        length that you can form from rack, as in a4.scrabble_all.
+
+        Precondition: rack is a string that is either empty or has only letters.
+
+        Enforced Precondition: rack is a string."""
+        assert type(rack) == str, `rack` + ' is not a string'
+        result = {}
+        for key in sub_signatures(rack):
+            if key in self._words:
+                size = len(key)
+                if size in result:
+                    result[size].extend(self._words[key])
+                else:
+                    result[size] = self._words[key][:]
+        for size in result:
+            result[size].sort()
+        return result
@@ -0,0 +1,71 @@
+# anagramtest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module anagram"""
+import cornelltest
+import a4
+import anagram
+
+
+# Test Procedures
+
+def test_signatures():
+    """Test functions signature and sub_signatures"""
+    print 'Testing signatures'
+    cornelltest.assert_equals('aceht', anagram.signature('teach'))
+    cornelltest.assert_equals('aceht', anagram.signature('cheat'))
+    cornelltest.assert_equals('', anagram.signature(''))
+
+    cornelltest.assert_equals(['', 'e', 'ee', 'eet', 'et', 't'],
+                              anagram.sub_signatures('tee'))
+    cornelltest.assert_equals(['ee', 'et'], anagram.sub_signatures('tee', 2))
+    cornelltest.assert_equals(['eet'], anagram.sub_signatures('ete', 3))
+    cornelltest.assert_equals([], anagram.sub_signatures('tee', 4))
+    cornelltest.assert_equals([''], anagram.sub_signatures(''))
+    cornelltest.assert_equals(2 ** 7, len(anagram.sub_signatures('abcdefg')))
+    cornelltest.assert_equals(4 * 4 * 2, len(anagram.sub_signatures('eeessst')))
+
+
+def test_anagrams():
+    """Test the AnagramIndex constructor and method anagrams"""
+    print 'Testing AnagramIndex.anagrams'
+    index = anagram.AnagramIndex(['teach', 'cheat', 'the', 'cheat', 'a'])
+    cornelltest.assert_equals(4, len(index))
+    cornelltest.assert_equals(3, index.signature_count())
+    cornelltest.assert_equals(['cheat', 'teach'], index.anagrams('aceht'))
+    cornelltest.assert_equals(['cheat', 'teach'], index.anagrams('hctea'))
+    cornelltest.assert_equals(['the'], index.anagrams('eht'))
+    cornelltest.assert_equals([], index.anagrams('eh'))
+
+    # The result is a copy
+    index.anagrams('eht').append('x')
+    cornelltest.assert_equals(['the'], index.anagrams('eht'))
+
+
+def test_scrabble():
+    """Test methods scrabble and scrabble_all against the a4 versions"""
+    print 'Testing AnagramIndex.scrabble'
+    words = a4.build_word_list('short.txt')
+    index = anagram.AnagramIndex(words)
+    cornelltest.assert_equals(['be', 'to'], index.scrabble('theob', 2))
+    cornelltest.assert_equals(['have'], index.scrabble('veha', 4))
+    cornelltest.assert_equals([], index.scrabble('veha', 5))
+    cornelltest.assert_equals([], index.scrabble('veha', 0))
+    cornelltest.assert_equals({2: ['be', 'to'], 3: ['the']}, index.scrabble_all('theob'))
+
+    words = a4.build_word_list('common.txt')
+    index = anagram.AnagramIndex(words)
+    pmap = a4.word_list_to_pmap(words)
+    for rack in ['retains', 'eeessst', 'aeiou', 'stop']:
+        for size in range(len(rack) + 2):
+            cornelltest.assert_equals(a4.scrabble(rack, size, pmap),
+                                      index.scrabble(rack, size))
+        cornelltest.assert_equals(a4.scrabble_all(rack, pmap), index.scrabble_all(rack))
+
+
+# Application Code
+if __name__ == "__main__":
+    test_signatures()
+    test_anagrams()
+    test_scrabble()
+    print "Module anagram is working correctly"
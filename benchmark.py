@@ -0,0 +1,494 @@
+# benchmark.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Timing benchmarks for the prefix maps and searches
+
+Run this module to print the timings of every benchmark:
+
+    python benchmark.py
+
+or give the names of the benchmarks to run:
+
+    python benchmark.py build
+"""
+import re
+import string
+import sys
+import time
+
+import a4
+import countmatrix
+import cryptogram
+from anagram import AnagramIndex
+from board import Board
+from dawg import Dawg
+from dictionary import Dictionary
+from gaddag import Gaddag
+from lettermask import LetterSetIndex
+from lrucache import AutocompleteCache, ScrabbleMemo
+from movegen import generate_moves
+from pattern import Pattern, Regex, match_pattern, min_visits
+from sortedwords import SortedWords
+from templateindex import TemplateIndex
+from trie import Trie
+
+
+# The word lists to benchmark against, from smallest to largest
+WORD_FILES = ['short.txt', 'common.txt', 'complete.txt']
+
+
+def best_time(func, repeat=3):
+    """Returns the fastest time (in seconds) of repeat calls to func()
+
+    Precondition: func is a function with no arguments.  repeat is an int > 0."""
+    best = None
+    for x in range(repeat):
+        start = time.time()
+        func()
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def report(label, seconds):
+    """Prints a single timing line
+
+    Precondition: label is a string.  seconds is a number."""
+    print '    %-40s %10.2f ms' % (label, seconds * 1000)
+
+
+def incremental_pmap(words):
+    """Returns the prefix map for words, built one pmap_add_word at a time
+
+    This is how word_list_to_pmap used to work, kept for comparison.
+
+    Precondition: words is a list of strings with only letters."""
+    pmap = {}
+    for word in words:
+        a4.pmap_add_word(pmap, word)
+    return pmap
+
+
+def tilewise_scrabble(prefix, rack, size, pmap):
+    """Returns the words from scrabble_helper, branching once per tile
+    
+    This is how scrabble_helper used to work (without its debug output), kept for
+    comparison.  Repeated tiles repeat the search, and the words found below them.
+    
+    Precondition: as in a4.scrabble_helper."""
+    if size == 0 or rack == '':
+        return []
+    scrabblelist = []
+    sizelist = a4.word_list_by_size(a4.autocomplete(prefix, pmap), len(prefix) + size)
+    for x in rack:
+        if x in pmap[prefix]:
+            pos = rack.find(x)
+            if prefix + x in sizelist:
+                scrabblelist = scrabblelist + [prefix + x]
+            scrabblelist = scrabblelist + tilewise_scrabble(prefix + x,
+                rack[:pos] + rack[pos+1:], size - 1, pmap)
+    return scrabblelist
+
+
+# Benchmarks
+
+def bench_build():
+    """Times building each kind of prefix map for each word file"""
+    print 'Building prefix maps'
+    for filename in WORD_FILES:
+        words = a4.build_word_list(filename)
+        print '  ' + filename + ' (' + `len(words)` + ' words)'
+        report('pmap_add_word, one word at a time',
+               best_time(lambda: incremental_pmap(words)))
+        report('word_list_to_pmap, sorted input',
+               best_time(lambda: a4.word_list_to_pmap(words)))
+        shuffled = words[1::2] + words[::2]
+        report('word_list_to_pmap, unsorted input',
+               best_time(lambda: a4.word_list_to_pmap(shuffled)))
+        report('Trie', best_time(lambda: Trie(words)))
+        report('Dawg', best_time(lambda: Dawg(sorted(words))))
+        report('SortedWords', best_time(lambda: SortedWords(words)))
+
+
+def bench_autocomplete():
+    """Times autocomplete against complete.txt, in full and for the first 10 words"""
+    print 'Autocomplete on complete.txt'
+    words = a4.build_word_list('complete.txt')
+    maps = [('dict', a4.word_list_to_pmap(words)), ('Trie', Trie(words)),
+            ('Dawg', Dawg(words)), ('SortedWords', SortedWords(words))]
+    for name, pmap in maps:
+        print '  ' + name
+        for prefix in ['th', 'inter', 'q']:
+            report('autocomplete ' + `prefix`,
+                   best_time(lambda: a4.autocomplete(prefix, pmap)))
+            report('autocomplete_iter ' + `prefix` + ', limit 10',
+                   best_time(lambda: list(a4.autocomplete_iter(prefix, pmap, 10))))
+
+
+def bench_autocache():
+    """Times a stream of repeated autocomplete queries, with and without a cache"""
+    print 'Cached autocomplete on complete.txt'
+    pmap = Trie(a4.build_word_list('complete.txt'))
+    # Typing 'interesting' three times, as a user who keeps starting over
+    queries = ['interesting'[:pos] for pos in range(1, 12)] * 3
+
+    def run(cache):
+        for prefix in queries:
+            if cache is None:
+                list(a4.autocomplete_iter(prefix, pmap, 10))
+            else:
+                cache.autocomplete(prefix, pmap, 10)
+
+    report('no cache', best_time(lambda: run(None)))
+    cache = AutocompleteCache(100)
+    report('AutocompleteCache, cold', best_time(lambda: run(cache), 1))
+    report('AutocompleteCache, warm', best_time(lambda: run(cache)))
+    stats = cache.stats()
+    print '    hit rate %.2f, %d evictions' % (stats['hit_rate'], stats['evictions'])
+
+
+def bench_scrabble():
+    """Times scrabble against complete.txt on racks with many repeated tiles"""
+    print 'Scrabble on complete.txt'
+    words = a4.build_word_list('complete.txt')
+    pmap = Trie(words)
+    other = a4.word_list_to_pmap(words)
+    for rack, size in [('eeessst', 4), ('aaassst', 4), ('eeeeeee', 3)]:
+        label = `rack` + ', size ' + `size`
+        found = tilewise_scrabble('', rack, size, pmap)
+        print '  ' + label + ': ' + `len(found)` + ' words found tile by tile, ' + \
+              `len(set(found))` + ' distinct'
+        report('one branch per tile',
+               best_time(lambda: tilewise_scrabble('', rack, size, pmap), 1))
+        report('one branch per distinct letter, Trie',
+               best_time(lambda: a4.scrabble(rack, size, pmap)))
+        report('one branch per distinct letter, dict',
+               best_time(lambda: a4.scrabble(rack, size, other)))
+
+
+def substituted_scrabble(rack, size, pmap):
+    """Returns the words from scrabble with blanks, by trying every letter for
+    every blank
+    
+    This is how blanks had to be handled before scrabble supported them, kept for
+    comparison.
+    
+    Precondition: as in a4.scrabble."""
+    if not a4.BLANK in rack:
+        return a4.scrabble(rack, size, pmap)
+    found = set()
+    for letter in 'abcdefghijklmnopqrstuvwxyz':
+        found.update(substituted_scrabble(rack.replace(a4.BLANK, letter, 1), size, pmap))
+    return sorted(found)
+
+
+def bench_blanks():
+    """Times scrabble on racks with blanks against complete.txt"""
+    print 'Scrabble with blanks on complete.txt'
+    pmap = Trie(a4.build_word_list('complete.txt'))
+    for rack in ['retain?', 'reta??s']:
+        for size in [4, 7]:
+            print '  ' + `rack` + ', size ' + `size`
+            report('one search per blank letter',
+                   best_time(lambda: substituted_scrabble(rack, size, pmap), 1))
+            report('blanks in the search',
+                   best_time(lambda: a4.scrabble(rack, size, pmap)))
+
+
+def bench_memo():
+    """Times a stream of scrabble queries with blanks, with and without a memo"""
+    print 'Memoized scrabble with blanks on complete.txt'
+    pmap = Trie(a4.build_word_list('complete.txt'))
+    # Each tile of 'retains' in turn replaced by a blank, at every size
+    racks = ['retains'[:pos] + '?' + 'retains'[pos+1:] for pos in range(7)]
+    queries = [(rack, size) for rack in racks for size in range(2, 8)]
+    # The same racks again, with their tiles in reverse order
+    shuffled = queries + [(rack[::-1], size) for rack, size in queries]
+
+    def run(memo, stream):
+        for rack, size in stream:
+            if memo is None:
+                a4.scrabble_blanks(rack, size, pmap)
+            else:
+                memo.scrabble_blanks(rack, size, pmap)
+
+    print '  ' + `len(queries)` + ' new queries'
+    report('no memo', best_time(lambda: run(None, queries), 1))
+    report('ScrabbleMemo, cold', best_time(lambda: run(ScrabbleMemo(1000), queries), 1))
+    memo = ScrabbleMemo(1000)
+    run(memo, queries)
+    report('ScrabbleMemo, warm', best_time(lambda: run(memo, queries)))
+    print '  ' + `len(shuffled)` + ' queries, each rack twice in different orders'
+    report('no memo', best_time(lambda: run(None, shuffled), 1))
+    memo = ScrabbleMemo(1000)
+    report('ScrabbleMemo, cold', best_time(lambda: run(memo, shuffled), 1))
+    stats = memo.stats()
+    print '    hit rate %.2f, %d results' % (stats['hit_rate'], stats['size'])
+
+
+def bench_scrabble_all():
+    """Times finding the words of every length from a rack, against complete.txt"""
+    print 'All-lengths scrabble on complete.txt'
+    words = a4.build_word_list('complete.txt')
+    maps = [('dict', a4.word_list_to_pmap(words)), ('Trie', Trie(words))]
+    for rack in ['retains', 'eeessst', 'qzjxkvw']:
+        print '  ' + `rack`
+        for name, pmap in maps:
+            report('scrabble for sizes 1 to 7, ' + name,
+                   best_time(lambda: [a4.scrabble(rack, size, pmap) for size in range(1, 8)]))
+            report('scrabble_all, ' + name,
+                   best_time(lambda: a4.scrabble_all(rack, pmap)))
+
+
+def bench_anagram():
+    """Times unscrambling seven-letter racks against complete.txt"""
+    print 'Anagrams on complete.txt'
+    words = a4.build_word_list('complete.txt')
+    pmap = Trie(words)
+    report('building AnagramIndex', best_time(lambda: AnagramIndex(words), 1))
+    index = AnagramIndex(words)
+    for rack in ['retains', 'eeessst', 'qzjxkvw']:
+        print '  ' + `rack`
+        report('scrabble, full rack, Trie',
+               best_time(lambda: a4.scrabble(rack, len(rack), pmap)))
+        report('AnagramIndex, full rack',
+               best_time(lambda: index.scrabble(rack, len(rack))))
+        report('scrabble, 4 letters, Trie',
+               best_time(lambda: a4.scrabble(rack, 4, pmap)))
+        report('AnagramIndex, 4 letters',
+               best_time(lambda: index.scrabble(rack, 4)))
+        report('scrabble_all, Trie', best_time(lambda: a4.scrabble_all(rack, pmap)))
+        report('AnagramIndex, all lengths', best_time(lambda: index.scrabble_all(rack)))
+
+
+def bench_countmatrix():
+    """Times batches of seven-letter racks against complete.txt"""
+    print 'Batched racks on complete.txt'
+    if countmatrix.numpy is None:
+        print '  skipped: NumPy is not installed'
+        return
+    words = a4.build_word_list('complete.txt')
+    racks = a4.word_list_by_size(words, 7)[::40][:1000]
+    pmap = Trie(words)
+    index = AnagramIndex(words)
+    report('building CountMatrix', best_time(lambda: countmatrix.CountMatrix(words), 1))
+    matrix = countmatrix.CountMatrix(words)
+    print '  ' + `len(racks)` + ' racks, every length'
+    report('scrabble_all, Trie', best_time(lambda: [a4.scrabble_all(rack, pmap)
+                                                    for rack in racks], 1))
+    report('AnagramIndex.scrabble_all',
+           best_time(lambda: [index.scrabble_all(rack) for rack in racks], 1))
+    report('CountMatrix.scrabble, one rack at a time',
+           best_time(lambda: [matrix.scrabble(rack) for rack in racks], 1))
+    report('CountMatrix.scrabble_batch', best_time(lambda: matrix.scrabble_batch(racks), 1))
+    print '  ' + `len(racks)` + ' racks, full rack only'
+    report('AnagramIndex.anagrams',
+           best_time(lambda: [index.anagrams(rack) for rack in racks], 1))
+    report('CountMatrix.scrabble_batch', best_time(lambda: matrix.scrabble_batch(racks, 7), 1))
+
+
+def scan_spelling_bee(words, letters, center):
+    """Returns the words spelled only with letters that use center, by a scan
+    
+    This checks every word of the list, for comparison with LetterSetIndex.
+    
+    Precondition: words is a list of strings.  letters and center are strings."""
+    allowed = set(letters)
+    return [word for word in words if center in word and set(word) <= allowed]
+
+
+def bench_spelling_bee():
+    """Times spelling-bee queries against complete.txt"""
+    print 'Spelling bee on complete.txt'
+    words = a4.build_word_list('complete.txt')
+    report('building LetterSetIndex', best_time(lambda: LetterSetIndex(words), 1))
+    index = LetterSetIndex(words)
+    print '  ' + `index.mask_count()` + ' distinct masks'
+    for letters, center in [('aetrins', 'r'), ('bcdilmo', 'o'),
+                            ('abcdefghijklmnopqrstu', 'e')]:
+        print '  ' + `letters` + ', center ' + `center`
+        report('scan of the word list',
+               best_time(lambda: scan_spelling_bee(words, letters, center)))
+        report('LetterSetIndex', best_time(lambda: index.spelling_bee(letters, center)))
+
+
+def filtered_pattern(pattern, words):
+    """Returns the words that pattern accepts, by checking every word
+
+    This is the post-filter that match_pattern replaces.
+
+    Precondition: pattern is a Pattern.  words is a list of strings."""
+    return [word for word in words if pattern.matches(word)]
+
+
+def bench_pattern():
+    """Times match_pattern against complete.txt, against a filter of every word"""
+    print 'Patterns on complete.txt'
+    words = a4.build_word_list('complete.txt')
+    trie = Trie(words)
+    rtrie = Trie(a4.reverse_word_list(words))
+    for text in ['*[^s]ing', '[aeiou]{3}*', 'qu?{3}', '?{2}[^aeiou]{4}*', 's*s', '*tion']:
+        pattern = Pattern(text)
+        print '  ' + `text` + ' (' + `len(match_pattern(pattern, trie))` + ' words)'
+        report('filter of every word', best_time(lambda: filtered_pattern(pattern, words), 1))
+        report('match_pattern', best_time(lambda: match_pattern(pattern, trie)))
+        report('match_pattern, with reversed Trie',
+               best_time(lambda: match_pattern(pattern, trie, rtrie)))
+
+
+def bench_regex():
+    """Times regular expressions against complete.txt, with re and with Regex
+
+    The expressions from 'th.*' to 's.*' narrow one end to fewer and fewer
+    prefixes, to show where walking the map stops paying off against re, and
+    's[^aeiou]*' and 'q[^u]*' narrow further after their prefix.  Each one also
+    shows the lower bound on the cost of the walk (pattern.min_visits) that
+    Dictionary.match_regex compares with its budget."""
+    print 'Regular expressions on complete.txt'
+    words = a4.build_word_list('complete.txt')
+    dictionary = Dictionary(words, False, True)
+    trie = dictionary.pmap
+    rtrie = dictionary.rpmap
+    for text in ['(un|re)?do(es|ne|ing)?', 'th.*', '.*tion', 'un.*', '.*ly', '.*ing',
+                 's.*', 's[^aeiou]*', 'q[^u]*', '.*(ing|ed)', 'a.{2,3}e', '.*ss.*',
+                 '[^aeiou]+']:
+        regex = re.compile('(?:' + text + r')\Z')
+        compiled = Regex(text)
+        backwards = compiled.reverse()
+        if backwards.narrow_prefix() > compiled.narrow_prefix():
+            bound = min_visits(backwards, rtrie)
+        else:
+            bound = min_visits(compiled, trie)
+        print ('  ' + `text` + ' (' + `len(match_pattern(compiled, trie))` +
+               ' words, costs at least ' + `bound` + ')')
+        report('re.match on every word',
+               best_time(lambda: [word for word in words if regex.match(word)], 1))
+        report('Regex, compiling', best_time(lambda: Regex(text)))
+        report('Regex', best_time(lambda: match_pattern(compiled, trie)))
+        report('Regex, with reversed Trie', best_time(lambda: match_pattern(compiled, trie, rtrie)))
+        report('Dictionary.match_regex', best_time(lambda: dictionary.match_regex(text)))
+
+
+def filtered_match(template, rack, pmap):
+    """Returns the words that match template with each '?' filled from rack, by
+    matching the template and then checking the rack
+
+    This is the two-step search that match_rack replaces.
+
+    Precondition: template is a string of letters and '?'.  rack is a string of
+    letters and blanks.  pmap is a prefix map."""
+    result = []
+    for word in a4.match(template, pmap):
+        counts = a4.rack_counts(rack)
+        missing = 0
+        for pos in range(len(word)):
+            if template[pos] == '?':
+                if counts.get(word[pos], 0) > 0:
+                    counts[word[pos]] = counts[word[pos]] - 1
+                else:
+                    missing = missing + 1
+        if missing <= counts.get(a4.BLANK, 0):
+            result.append(word)
+    return result
+
+
+def bench_match():
+    """Times match and match_rack against complete.txt, with and without stored
+    lengths or a reversed map, and match against a TemplateIndex"""
+    print 'Match on complete.txt'
+    words = a4.build_word_list('complete.txt')
+    maps = [('dict', a4.word_list_to_pmap(words)), ('Trie', Trie(words)),
+            ('Dawg', Dawg(words))]
+    trie = maps[1][1]
+    rtrie = Trie(a4.reverse_word_list(words))
+    report('building TemplateIndex', best_time(lambda: TemplateIndex(words), 1))
+    index = TemplateIndex(words)
+    for template in ['?????', 'a???e', '???????????ing', 'q??', '??a?e??', '???x???',
+                     '???ing', '????tion']:
+        print '  ' + `template`
+        for name, pmap in maps:
+            report(name, best_time(lambda: a4.match(template, pmap)))
+        report('Trie, with reversed Trie', best_time(lambda: a4.match(template, trie, rtrie)))
+        report('TemplateIndex', best_time(lambda: index.match(template)))
+    for template, rack in [('??e??', 'retains'), ('?a??e', 'eeessst'), ('??????s', 'reta??s')]:
+        print '  ' + `template` + ' from ' + `rack`
+        report('match, then filter',
+               best_time(lambda: filtered_match(template, rack, trie)))
+        report('match_rack', best_time(lambda: a4.match_rack(template, rack, trie)))
+        report('match_rack, with reversed Trie',
+               best_time(lambda: a4.match_rack(template, rack, trie, rtrie)))
+
+
+def bench_cryptogram():
+    """Times solving cryptograms with the pattern indexes of common.txt and
+    complete.txt"""
+    print 'Cryptograms'
+    # A simple substitution, from the keyboard order of the letters
+    key = string.maketrans(string.ascii_lowercase, 'qwertyuiopasdfghjklzxcvbnm')
+    texts = ['the people would like to know what you think about this work',
+             'we hold these truths to be self evident that all men are created equal']
+    for filename in ['common.txt', 'complete.txt']:
+        words = a4.build_word_list(filename)
+        print '  ' + filename
+        report('building PatternIndex', best_time(lambda: cryptogram.PatternIndex(words), 1))
+        index = cryptogram.PatternIndex(words)
+        for text in texts:
+            ciphertext = text.translate(key)
+            keys = cryptogram.solve(ciphertext, index, 10)
+            print '    ' + `ciphertext` + ' (' + `len(keys)` + ' keys of 10)'
+            report('first key', best_time(lambda: cryptogram.solve(ciphertext, index, 1), 1))
+            report('up to 10 keys', best_time(lambda: cryptogram.solve(ciphertext, index, 10), 1))
+
+
+# A board in the middle of a game, for bench_movegen
+MIDGAME = ['...............',
+           '...............',
+           '...............',
+           '...............',
+           '...............',
+           '.....h.........',
+           '.....a.........',
+           '...theme.......',
+           '.......a.......',
+           '.......not.....',
+           '...............',
+           '...............',
+           '...............',
+           '...............',
+           '...............']
+
+
+def bench_movegen():
+    """Times move generation with the GADDAG for complete.txt"""
+    print 'Move generation on complete.txt'
+    words = a4.build_word_list('complete.txt')
+    start = time.time()
+    gaddag = Gaddag(words)
+    report('building Gaddag', time.time() - start)
+    print '  ' + `gaddag.string_count` + ' strings, ' + `len(gaddag)` + ' nodes'
+    for name, rows in [('empty board', None), ('midgame board', MIDGAME)]:
+        board = Board(rows)
+        for rack in ['retains', 'eeessst', 'qzjxkvw', 'reta?s?']:
+            moves = generate_moves(board, rack, gaddag)
+            report(name + ', ' + `rack` + ' (' + `len(moves)` + ' moves)',
+                   best_time(lambda: generate_moves(board, rack, gaddag)))
+
+
+# All benchmarks, by name
+BENCHMARKS = [('build', bench_build), ('autocomplete', bench_autocomplete),
+              ('autocache', bench_autocache), ('scrabble', bench_scrabble),
+              ('blanks', bench_blanks), ('memo', bench_memo),
+              ('scrabble_all', bench_scrabble_all), ('anagram', bench_anagram),
+              ('countmatrix', bench_countmatrix), ('spellingbee', bench_spelling_bee),
+              ('match', bench_match), ('pattern', bench_pattern),
+              ('regex', bench_regex), ('cryptogram', bench_cryptogram),
+              ('movegen', bench_movegen)]
+
+
+# Application Code
+if __name__ == '__main__':
+    names = sys.argv[1:]
+    for name, bench in BENCHMARKS:
+        if not names or name in names:
+            bench()
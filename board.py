@@ -0,0 +1,302 @@
+# board.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Scrabble boards and moves
+
+A Board is the standard 15x15 board, with its premium squares.  Rows and columns
+are numbered 0..14 from the top left, and the center square is (7, 7).  A move
+places tiles in a single row (across) or a single column (down), and scores the
+main word it forms plus every cross word formed by a new tile.
+
+Tiles are letters.  A blank tile is stored as the letter it stands for, but is
+marked as blank, so that it scores nothing.
+
+The moves themselves are found by the module movegen.
+"""
+
+
+# The number of rows (and columns) of the board
+SIZE = 15
+
+# The center square, which the first move must cover
+CENTER = (7, 7)
+
+# The number of tiles on a full rack, and the bonus for playing all of them
+RACK_SIZE = 7
+BINGO_BONUS = 50
+
+# The value of each letter tile (blanks are worth 0)
+LETTER_SCORES = {'a': 1, 'b': 3, 'c': 3, 'd': 2, 'e': 1, 'f': 4, 'g': 2, 'h': 4,
+                 'i': 1, 'j': 8, 'k': 5, 'l': 1, 'm': 3, 'n': 1, 'o': 1, 'p': 3,
+                 'q': 10, 'r': 1, 's': 1, 't': 1, 'u': 1, 'v': 4, 'w': 4, 'x': 8,
+                 'y': 4, 'z': 10}
+
+# The premium squares: T triple word, D double word, t triple letter,
+# d double letter, and . none
+PREMIUMS = ['T..d...T...d..T',
+            '.D...t...t...D.',
+            '..D...d.d...D..',
+            'd..D...d...D..d',
+            '....D.....D....',
+            '.t...t...t...t.',
+            '..d...d.d...d..',
+            'T..d...D...d..T',
+            '..d...d.d...d..',
+            '.t...t...t...t.',
+            '....D.....D....',
+            'd..D...d...D..d',
+            '..D...d.d...D..',
+            '.D...t...t...D.',
+            'T..d...T...d..T']
+
+# The letter and word multipliers of each kind of premium square
+_LETTER_MULTIPLIER = {'t': 3, 'd': 2}
+_WORD_MULTIPLIER = {'T': 3, 'D': 2}
+
+
+def letter_score(letter):
+    """Returns the value of a tile showing letter (0 for anything not a letter).
+
+    Uppercase letters are worth the same as lowercase ones.
+
+    Precondition: letter is a single character."""
+    return LETTER_SCORES.get(letter.lower(), 0)
+
+
+def step(row, col, across, distance=1):
+    """Returns the square distance squares after (row, col) along a move.
+
+    Example: step(7, 7, True) is (7, 8), and step(7, 7, False, -1) is (6, 7).
+
+    Precondition: row, col and distance are ints.  across is a bool."""
+    if across:
+        return (row, col + distance)
+    return (row + distance, col)
+
+
+class Move(object):
+    """Instances are moves: tiles placed in one row or column of a board.
+
+    Instance Attributes:
+        word:   the main word formed [str]
+        row:    the row of the first letter of word [int in 0..SIZE-1]
+        col:    the column of the first letter of word [int in 0..SIZE-1]
+        across: True if word reads across a row, False if down a column [bool]
+        tiles:  the new tiles, in order, as tuples (row, col, letter, blank),
+                where blank is True for a blank tile [list of tuple]
+        score:  the points the move scores [int >= 0]
+    """
+
+    def __init__(self, word, row, col, across, tiles, score):
+        """**Constructor**: Create a move with the given attributes.
+
+        Precondition: the arguments are as in the instance attributes."""
+        self.word = word
+        self.row = row
+        self.col = col
+        self.across = across
+        self.tiles = tiles
+        self.score = score
+
+    def blanks(self):
+        """Returns the string of letters that blank tiles stand for in this move."""
+        return ''.join([tile[2] for tile in self.tiles if tile[3]])
+
+    def key(self):
+        """Returns the tuple (word, row, col, across) that identifies this move."""
+        return (self.word, self.row, self.col, self.across)
+
+    def __repr__(self):
+        """Returns a description of this move, such as 'cat at (7, 5) across for 10'."""
+        if self.across:
+            direction = 'across'
+        else:
+            direction = 'down'
+        return (self.word + ' at ' + `(self.row, self.col)` + ' ' + direction +
+                ' for ' + `self.score`)
+
+
+class Board(object):
+    """Instances are Scrabble boards.
+
+    Instance Attributes:
+        tile_count: the number of tiles on the board [int >= 0]
+    """
+
+    def __init__(self, rows=None):
+        """**Constructor**: Create a board, empty or with the given tiles.
+
+        If rows is not None, it lists the rows of the board, top to bottom, as
+        strings of SIZE characters.  A letter is a tile, and '.' an empty square.
+        These tiles are not blanks.
+
+        Precondition: rows is None or a list of SIZE strings of SIZE letters and
+        '.'.
+
+        Enforced Precondition: rows is None or a list of SIZE strings of length
+        SIZE."""
+        self._tiles = [[None] * SIZE for row in range(SIZE)]
+        self._blanks = set()
+        self.tile_count = 0
+        if rows is not None:
+            assert type(rows) == list and len(rows) == SIZE, `rows` + ' is not a list of ' + `SIZE` + ' rows'
+            for row in range(SIZE):
+                assert type(rows[row]) == str and len(rows[row]) == SIZE, `rows[row]` + ' is not a row'
+                for col in range(SIZE):
+                    if rows[row][col] != '.':
+                        self._tiles[row][col] = rows[row][col]
+                        self.tile_count = self.tile_count + 1
+
+    def __str__(self):
+        """Returns the rows of this board, one per line, in the form used by the
+        constructor.  Blank tiles are shown as their letter."""
+        lines = []
+        for row in self._tiles:
+            lines.append(''.join([letter or '.' for letter in row]))
+        return '\n'.join(lines)
+
+    def is_empty(self):
+        """Returns True if there are no tiles on this board."""
+        return self.tile_count == 0
+
+    def tile(self, row, col):
+        """Returns the letter on square (row, col), or None if it is empty.
+
+        Squares off the board are empty.
+
+        Precondition: row and col are ints."""
+        if 0 <= row < SIZE and 0 <= col < SIZE:
+            return self._tiles[row][col]
+        return None
+
+    def is_blank(self, row, col):
+        """Returns True if the tile on square (row, col) is a blank.
+
+        Precondition: row and col are ints."""
+        return (row, col) in self._blanks
+
+    def premium(self, row, col):
+        """Returns the premium of square (row, col), as a character of PREMIUMS.
+
+        Precondition: row and col are ints in 0..SIZE-1."""
+        return PREMIUMS[row][col]
+
+    def multipliers(self, row, col):
+        """Returns the pair (letter multiplier, word multiplier) of the premium of
+        square (row, col).  Both are 1 for a square with no premium.
+
+        Precondition: row and col are ints in 0..SIZE-1."""
+        premium = PREMIUMS[row][col]
+        return (_LETTER_MULTIPLIER.get(premium, 1), _WORD_MULTIPLIER.get(premium, 1))
+
+    def tile_score(self, row, col):
+        """Returns the points of the tile on square (row, col): 0 if the square is
+        empty or the tile is a blank.  Premiums are not counted.
+
+        Precondition: row and col are ints."""
+        if self.tile(row, col) is None or self.is_blank(row, col):
+            return 0
+        return letter_score(self.tile(row, col))
+
+    def has_neighbor(self, row, col):
+        """Returns True if a square next to (row, col) has a tile.
+
+        Precondition: row and col are ints."""
+        return (self.tile(row - 1, col) is not None or self.tile(row + 1, col) is not None or
+                self.tile(row, col - 1) is not None or self.tile(row, col + 1) is not None)
+
+    def place(self, move):
+        """Puts the tiles of move on this board.
+
+        Precondition: move is a Move, and its squares are empty.
+
+        Enforced Precondition: The squares of move are empty."""
+        for row, col, letter, blank in move.tiles:
+            assert self.tile(row, col) is None, 'square ' + `(row, col)` + ' is not empty'
+            self._tiles[row][col] = letter
+            if blank:
+                self._blanks.add((row, col))
+            self.tile_count = self.tile_count + 1
+
+    # Words and Scores
+    def word_at(self, row, col, across, tiles=None):
+        """Returns the triple (start row, start col, word) of the word through
+        square (row, col) in the given direction.
+
+        The word is the longest run of tiles through the square.  The tiles in
+        the dict tiles, from squares to letters, are treated as if they were on
+        the board.
+
+        Precondition: row and col are ints in 0..SIZE-1.  across is a bool.
+        tiles is None or a dict from (row, col) to letters."""
+        if tiles is None:
+            tiles = {}
+        start = (row, col)
+        while self._letter(step(start[0], start[1], across, -1), tiles) is not None:
+            start = step(start[0], start[1], across, -1)
+        letters = []
+        square = start
+        while self._letter(square, tiles) is not None:
+            letters.append(self._letter(square, tiles))
+            square = step(square[0], square[1], across)
+        return (start[0], start[1], ''.join(letters))
+
+    def _letter(self, square, tiles):
+        """Returns the letter on square, counting the tiles in the dict tiles.
+
+        Precondition: square is a pair of ints.  tiles is a dict from squares to
+        letters."""
+        if square in tiles:
+            return tiles[square]
+        return self.tile(square[0], square[1])
+
+    def score(self, tiles, across):
+        """Returns the score of placing tiles on this board, in the given direction.
+
+        tiles is a list of tuples (row, col, letter, blank), as in Move.  The
+        main word runs through the tiles in the given direction.  Each tile that
+        has tiles beside it in the other direction also forms a cross word.
+        Premium squares count only under new tiles.  Placing RACK_SIZE tiles
+        earns BINGO_BONUS.
+
+        Precondition: tiles is a nonempty list of tiles in one row (if across) or
+        column (if not), on empty squares.  across is a bool."""
+        placed = {}
+        for row, col, letter, blank in tiles:
+            placed[(row, col)] = (letter, blank)
+
+        total = self._word_score(tiles[0][0], tiles[0][1], across, placed)
+        for row, col, letter, blank in tiles:
+            if (self.tile(*step(row, col, not across, -1)) is not None or
+                self.tile(*step(row, col, not across)) is not None):
+                total = total + self._word_score(row, col, not across, placed)
+        if len(tiles) == RACK_SIZE:
+            total = total + BINGO_BONUS
+        return total
+
+    def _word_score(self, row, col, across, placed):
+        """Returns the score of the word through (row, col) in the given direction.
+
+        Precondition: row and col are ints in 0..SIZE-1.  across is a bool.
+        placed is a dict from squares to pairs (letter, blank) of the new tiles."""
+        letters = {}
+        for square in placed:
+            letters[square] = placed[square][0]
+        row, col, word = self.word_at(row, col, across, letters)
+
+        total = 0
+        multiplier = 1
+        for pos in range(len(word)):
+            square = step(row, col, across, pos)
+            if square in placed:
+                letter, blank = placed[square]
+                if blank:
+                    value = 0
+                else:
+                    value = letter_score(letter)
+                premium = self.premium(square[0], square[1])
+                total = total + value * _LETTER_MULTIPLIER.get(premium, 1)
+                multiplier = multiplier * _WORD_MULTIPLIER.get(premium, 1)
+            elif not self.is_blank(square[0], square[1]):
+                total = total + letter_score(word[pos])
+        return total * multiplier
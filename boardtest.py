@@ -0,0 +1,97 @@
+# boardtest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module board"""
+import cornelltest
+import board
+
+
+# A board with 'cat' across the center
+CAT = ['.' * 15] * 7 + ['.....cat.......'] + ['.' * 15] * 7
+
+
+# Test Procedures
+
+def test_constructor():
+    """Test the Board constructor and its queries"""
+    print 'Testing Board constructor'
+    grid = board.Board()
+    cornelltest.assert_true(grid.is_empty())
+    cornelltest.assert_equals(None, grid.tile(7, 7))
+    cornelltest.assert_equals('D', grid.premium(7, 7))
+    cornelltest.assert_equals('T', grid.premium(14, 0))
+    cornelltest.assert_equals('t', grid.premium(5, 5))
+
+    grid = board.Board(CAT)
+    cornelltest.assert_equals(3, grid.tile_count)
+    cornelltest.assert_equals('c', grid.tile(7, 5))
+    cornelltest.assert_equals(None, grid.tile(7, 8))
+    cornelltest.assert_equals(None, grid.tile(-1, 5))
+    cornelltest.assert_equals(None, grid.tile(7, 15))
+    cornelltest.assert_true(grid.has_neighbor(6, 6))
+    cornelltest.assert_false(grid.has_neighbor(6, 4))
+    cornelltest.assert_equals('\n'.join(CAT), str(grid))
+
+    # The layout is symmetric
+    for row in range(board.SIZE):
+        cornelltest.assert_equals(board.PREMIUMS[row], board.PREMIUMS[row][::-1])
+        cornelltest.assert_equals(board.PREMIUMS[row], board.PREMIUMS[board.SIZE - 1 - row])
+
+
+def test_place():
+    """Test method place and class Move"""
+    print 'Testing Board.place'
+    grid = board.Board()
+    move = board.Move('cat', 7, 5, True, [(7, 5, 'c', False), (7, 6, 'a', True),
+                                          (7, 7, 't', False)], 8)
+    cornelltest.assert_equals('a', move.blanks())
+    cornelltest.assert_equals(('cat', 7, 5, True), move.key())
+    cornelltest.assert_equals('cat at (7, 5) across for 8', `move`)
+    grid.place(move)
+    cornelltest.assert_equals(3, grid.tile_count)
+    cornelltest.assert_true(grid.is_blank(7, 6))
+    cornelltest.assert_false(grid.is_blank(7, 5))
+    cornelltest.assert_equals((7, 5, 'cat'), grid.word_at(7, 6, True))
+    cornelltest.assert_equals((7, 6, 'a'), grid.word_at(7, 6, False))
+    cornelltest.assert_equals((7, 5, 'cats'), grid.word_at(7, 5, True, {(7, 8): 's'}))
+    cornelltest.assert_equals(3, grid.tile_score(7, 5))
+    cornelltest.assert_equals(0, grid.tile_score(7, 6))
+    cornelltest.assert_equals(0, grid.tile_score(0, 0))
+    cornelltest.assert_equals((1, 3), grid.multipliers(0, 0))
+    cornelltest.assert_equals((2, 1), grid.multipliers(0, 3))
+    cornelltest.assert_equals((1, 2), grid.multipliers(7, 7))
+    cornelltest.assert_equals((1, 1), grid.multipliers(0, 1))
+
+
+def test_score():
+    """Test method score"""
+    print 'Testing Board.score'
+    grid = board.Board()
+    cornelltest.assert_equals(10, grid.score([(7, 5, 'c', False), (7, 6, 'a', False),
+                                              (7, 7, 't', False)], True))
+    cornelltest.assert_equals(8, grid.score([(7, 5, 'c', False), (7, 6, 'a', True),
+                                             (7, 7, 't', False)], True))
+
+    # Premiums under tiles already on the board do not count
+    grid = board.Board(CAT)
+    cornelltest.assert_equals(6, grid.score([(7, 8, 's', False)], True))
+    # 'ha' down, with the h on a double letter
+    cornelltest.assert_equals(9, grid.score([(6, 6, 'h', False)], False))
+    # 'ax' below 'at', on a double letter, with cross words 'aa' and 'tx'
+    tiles = [(8, 6, 'a', False), (8, 7, 'x', False)]
+    cornelltest.assert_equals(10 + 3 + 9, grid.score(tiles, True))
+    tiles = [(8, 6, 'a', False), (8, 7, 'x', True)]
+    cornelltest.assert_equals(2 + 3 + 1, grid.score(tiles, True))
+
+    # Seven tiles earn the bingo bonus
+    tiles = [(0, col, 'e', False) for col in range(7)]
+    cornelltest.assert_equals(3 * (1 + 1 + 1 + 2 + 1 + 1 + 1) + board.BINGO_BONUS,
+                              grid.score(tiles, True))
+
+
+# Application Code
+if __name__ == "__main__":
+    test_constructor()
+    test_place()
+    test_score()
+    print "Module board is working correctly"
@@ -0,0 +1,198 @@
+# countmatrix.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Letter-count matrices for vectorized rack queries
+
+A CountMatrix stores a word list as a matrix with one row per word and one column
+per letter, where each entry is the number of times that letter occurs in that
+word.  A word can be formed from a rack exactly when no entry of its row is
+larger than the rack's count of that letter.  So a rack query is one comparison
+of the matrix against the rack, done by NumPy instead of a Python search.  Many
+racks can be compared at once with scrabble_batch.
+
+Most words use some letter that is not on the rack at all.  So each word also
+has a mask, with one bit for each letter it uses.  A query first keeps the words
+whose mask has no bit outside the rack's mask, which is one integer operation per
+word, and only compares the counts of those.
+
+This module needs NumPy, which is optional for the rest of the package.  It can
+be imported without NumPy, but creating a CountMatrix then raises ImportError.
+
+The columns are the letters that occur in the word list, so for a lowercase word
+list there are 26 of them.  Letters are case-sensitive, as in the prefix maps.
+"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# The most racks compared against the matrix in one pass of scrabble_batch
+BATCH_SIZE = 64
+
+
+class CountMatrix(object):
+    """Instances are word lists stored as letter-count matrices.
+
+    Instance Attributes:
+        words:    the words, sorted, without duplicates [list of str]
+        alphabet: the letters that occur in words, sorted [str]
+        counts:   the letter counts, one row per word [numpy uint8 array of
+                  shape (len(words), len(alphabet))]
+        sizes:    the length of each word [numpy int32 array of shape (len(words),)]
+        masks:    the letters used by each word, bit i for alphabet[i]
+                  [numpy uint64 array of shape (len(words),)]
+    """
+
+    def __init__(self, words):
+        """**Constructor**: Create the letter-count matrix for words.
+
+        The words do not need to be sorted, and duplicates are ignored.  A letter
+        may occur at most 255 times in one word.
+
+        Precondition: words is a list of strings with only letters.
+
+        Enforced Precondition: words is a list.  NumPy is installed."""
+        assert type(words) == list, `words` + ' is not a list'
+        if numpy is None:
+            raise ImportError('CountMatrix needs numpy')
+        self.words = []
+        for word in sorted(words):
+            if not self.words or self.words[-1] != word:
+                self.words.append(word)
+
+        letters = set()
+        for word in self.words:
+            letters.update(word)
+        self.alphabet = ''.join(sorted(letters))
+        self._columns = {}
+        for pos, letter in enumerate(self.alphabet):
+            self._columns[letter] = pos
+
+        # Count every letter of every word at once, by its (row, column) position
+        width = len(self.alphabet)
+        self.sizes = numpy.array([len(word) for word in self.words], numpy.int32)
+        table = numpy.zeros(256, numpy.intp)
+        for letter in self.alphabet:
+            table[ord(letter)] = self._columns[letter]
+        codes = numpy.frombuffer(''.join(self.words), numpy.uint8)
+        rows = numpy.repeat(numpy.arange(len(self.words)), self.sizes)
+        cells = numpy.bincount(rows * width + table[codes],
+                               minlength=len(self.words) * width)
+        self.counts = cells.reshape(len(self.words), width).astype(numpy.uint8)
+        self.masks = self._mask(self.counts)
+
+    def __len__(self):
+        """Returns the number of words in this matrix."""
+        return len(self.words)
+
+    def nbytes(self):
+        """Returns the number of bytes used by the counts, sizes and masks."""
+        return self.counts.nbytes + self.sizes.nbytes + self.masks.nbytes
+
+    def _mask(self, counts):
+        """Returns the masks of the letters used by each row of counts.
+
+        Precondition: counts is a 2D numpy array with len(alphabet) columns."""
+        bits = numpy.left_shift(numpy.uint64(1), numpy.arange(len(self.alphabet), dtype=numpy.uint64))
+        return numpy.dot(counts > 0, bits).astype(numpy.uint64)
+
+    def rack_vector(self, rack):
+        """Returns the letter counts of rack, as a row of this matrix.
+
+        Tiles with letters that no word uses are left out, as they cannot be
+        played.  Counts above 255 are stored as 255.
+
+        Precondition: rack is a string that is either empty or has only letters."""
+        vector = numpy.zeros(len(self.alphabet), numpy.int32)
+        for letter in rack:
+            if letter in self._columns:
+                vector[self._columns[letter]] += 1
+        return numpy.minimum(vector, 255).astype(numpy.uint8)
+
+    def _rows(self, size, tiles):
+        """Returns the rows to compare for racks of the given number of tiles.
+
+        These are the words of length size, or of every length up to tiles if
+        size is None.
+
+        Precondition: size is None or an int >= 0.  tiles is an int >= 0."""
+        if size is None:
+            return numpy.flatnonzero((self.sizes > 0) & (self.sizes <= tiles))
+        if size == 0 or size > tiles:
+            return numpy.zeros(0, numpy.intp)
+        return numpy.flatnonzero(self.sizes == size)
+
+    # Searches
+    def scrabble(self, rack, size=None):
+        """Returns the sorted list of words that you can form from rack using
+        EXACTLY size letters, as in a4.scrabble.
+
+        If size is None, this returns the words of every length, as one sorted
+        list.
+
+        Precondition: rack is a string that is either empty or has only letters.
+        size is None or an int >= 0.
+
+        Enforced Precondition: rack is a string.  size is None or an int >= 0."""
+        assert type(rack) == str, `rack` + ' is not a string'
+        assert size is None or (type(size) == int and size >= 0), `size` + ' is not None or a non-negative integer'
+        vector = self.rack_vector(rack)
+        rows = self._rows(size, len(rack))
+        outside = numpy.invert(self._mask(vector[numpy.newaxis, :]))
+        rows = rows[(self.masks[rows] & outside) == 0]
+        fits = (self.counts[rows] <= vector).all(axis=1)
+        return [self.words[row] for row in rows[fits]]
+
+    def scrabble_all(self, rack):
+        """Returns a dict from each length to the sorted list of words of that
+        length that you can form from rack, as in a4.scrabble_all.
+
+        Precondition: rack is a string that is either empty or has only letters."""
+        result = {}
+        for word in self.scrabble(rack):
+            size = len(word)
+            if size in result:
+                result[size].append(word)
+            else:
+                result[size] = [word]
+        return result
+
+    def scrabble_batch(self, racks, size=None):
+        """Returns the list of the results of scrabble(rack, size) for each rack in
+        racks, in the same order.
+
+        The racks are compared against the matrix BATCH_SIZE at a time.  The
+        masks of the whole batch are compared in one operation, and then the
+        counts of the pairs of a rack and a word that pass, so that no Python
+        code runs per word.  All the racks should have about the same number of
+        tiles, as the words compared are those that fit the longest rack.
+
+        Precondition: racks is a list of strings that are either empty or have
+        only letters.  size is None or an int >= 0.
+
+        Enforced Precondition: racks is a list.  size is None or an int >= 0."""
+        assert type(racks) == list, `racks` + ' is not a list'
+        assert size is None or (type(size) == int and size >= 0), `size` + ' is not None or a non-negative integer'
+        results = []
+        for start in range(0, len(racks), BATCH_SIZE):
+            batch = racks[start:start+BATCH_SIZE]
+            tiles = numpy.array([len(rack) for rack in batch])
+            vectors = numpy.array([self.rack_vector(rack) for rack in batch])
+            vectors = vectors.reshape(len(batch), len(self.alphabet))
+            outside = numpy.invert(self._mask(vectors))
+            rows = self._rows(size, tiles.max())
+
+            # Pairs (which[k], rows[cols[k]]) of a rack and a word it may form,
+            # ordered by rack and then by word
+            maybe = (self.masks[rows][numpy.newaxis, :] & outside[:, numpy.newaxis]) == 0
+            maybe &= self.sizes[rows][numpy.newaxis, :] <= tiles[:, numpy.newaxis]
+            which, cols = numpy.nonzero(maybe)
+            fits = (self.counts[rows[cols]] <= vectors[which]).all(axis=1)
+            which = which[fits]
+            found = rows[cols[fits]]
+
+            bounds = numpy.searchsorted(which, numpy.arange(len(batch) + 1))
+            for pos in range(len(batch)):
+                results.append([self.words[row] for row in found[bounds[pos]:bounds[pos+1]]])
+        return results
@@ -0,0 +1,70 @@
+# countmatrixtest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module countmatrix
+
+These tests need NumPy.  If it is not installed, they are skipped."""
+import cornelltest
+import a4
+import countmatrix
+
+
+# Test Procedures
+
+def test_constructor():
+    """Test the CountMatrix constructor and method rack_vector"""
+    print 'Testing CountMatrix constructor'
+    matrix = countmatrix.CountMatrix(['tee', 'at', 'tee'])
+    cornelltest.assert_equals(['at', 'tee'], matrix.words)
+    cornelltest.assert_equals(2, len(matrix))
+    cornelltest.assert_equals('aet', matrix.alphabet)
+    cornelltest.assert_equals([[1, 0, 1], [0, 2, 1]], matrix.counts.tolist())
+    cornelltest.assert_equals([2, 3], matrix.sizes.tolist())
+    cornelltest.assert_equals([0, 3, 1], matrix.rack_vector('eexte').tolist())
+
+    matrix = countmatrix.CountMatrix([])
+    cornelltest.assert_equals([], matrix.scrabble('abc'))
+    cornelltest.assert_equals([[]], matrix.scrabble_batch(['abc']))
+
+
+def test_scrabble():
+    """Test methods scrabble and scrabble_all against the a4 versions"""
+    print 'Testing CountMatrix.scrabble'
+    matrix = countmatrix.CountMatrix(a4.build_word_list('short.txt'))
+    cornelltest.assert_equals(['be', 'to'], matrix.scrabble('theob', 2))
+    cornelltest.assert_equals(['have'], matrix.scrabble('veha', 4))
+    cornelltest.assert_equals([], matrix.scrabble('veha', 0))
+    cornelltest.assert_equals([], matrix.scrabble('veha', 5))
+    cornelltest.assert_equals(['be', 'the', 'to'], matrix.scrabble('theob'))
+    cornelltest.assert_equals({2: ['be', 'to'], 3: ['the']}, matrix.scrabble_all('theob'))
+
+    words = a4.build_word_list('common.txt')
+    matrix = countmatrix.CountMatrix(words)
+    pmap = a4.word_list_to_pmap(words)
+    for rack in ['retains', 'eeessst', 'aeiou', 'stop', '']:
+        for size in range(len(rack) + 2):
+            cornelltest.assert_equals(a4.scrabble(rack, size, pmap),
+                                      matrix.scrabble(rack, size))
+        cornelltest.assert_equals(a4.scrabble_all(rack, pmap), matrix.scrabble_all(rack))
+
+
+def test_scrabble_batch():
+    """Test method scrabble_batch"""
+    print 'Testing CountMatrix.scrabble_batch'
+    matrix = countmatrix.CountMatrix(a4.build_word_list('common.txt'))
+    racks = ['retains', 'eeessst', 'aeiou', 'stop', 'qqq', 'a'] * 30
+    for size in [None, 1, 3, 7]:
+        expected = [matrix.scrabble(rack, size) for rack in racks]
+        cornelltest.assert_equals(expected, matrix.scrabble_batch(racks, size))
+    cornelltest.assert_equals([], matrix.scrabble_batch([]))
+
+
+# Application Code
+if __name__ == "__main__":
+    if countmatrix.numpy is None:
+        print "NumPy is not installed, so module countmatrix was not tested"
+    else:
+        test_constructor()
+        test_scrabble()
+        test_scrabble_batch()
+        print "Module countmatrix is working correctly"
@@ -0,0 +1,227 @@
+# cryptogram.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Letter patterns and a solver for cryptograms
+
+A cryptogram is a text in which every letter has been replaced by another, the
+same one everywhere.  Enciphering keeps which letters of a word are equal, so
+'that' can only be the cipher of a word whose first and last letters are equal
+and whose others are not, like 'eave'.  The letter pattern of a word writes this
+down: each letter is replaced by a code letter, A for its first letter, B for
+the next letter that is different, and so on.  Both 'that' and 'eave' have the
+pattern 'ABCA'.
+
+A PatternIndex maps each letter pattern to the words with that pattern.  The
+function solve uses it to solve whole cryptograms.  It looks for a key (a
+mapping from cipher letters to plain letters) by backtracking.  At each step it
+chooses the cipher word with the fewest dictionary words left that agree with
+the key so far, and tries each of them in turn.  Each choice extends the key,
+and the words left are narrowed to those that agree with it before going on.
+"""
+import re
+import string
+
+
+# The code letters of a letter pattern, in order
+_CODES = string.ascii_uppercase + string.ascii_lowercase
+
+
+def letter_pattern(word):
+    """Returns the letter pattern of word.
+
+    Example: letter_pattern('that') and letter_pattern('eave') both return
+    'ABCA', and letter_pattern('letter') returns 'ABCCBD'.
+
+    Precondition: word is a string with only letters.
+
+    Enforced Precondition: word is a string."""
+    assert type(word) == str, `word` + ' is not a string'
+    codes = {}
+    result = []
+    for letter in word:
+        if not letter in codes:
+            codes[letter] = _CODES[len(codes)]
+        result.append(codes[letter])
+    return ''.join(result)
+
+
+class PatternIndex(object):
+    """Instances map each letter pattern to the words with that pattern.
+
+    Instance Attributes:
+        word_count: the number of words in this index [int >= 0]
+    """
+
+    def __init__(self, words):
+        """**Constructor**: Create the pattern index for words.
+
+        Duplicates are ignored.
+
+        Precondition: words is a list of strings with only letters.
+
+        Enforced Precondition: words is a list."""
+        assert type(words) == list, `words` + ' is not a list'
+        self._words = {}
+        self.word_count = 0
+        for word in sorted(set(words)):
+            pattern = letter_pattern(word)
+            if pattern in self._words:
+                self._words[pattern].append(word)
+            else:
+                self._words[pattern] = [word]
+            self.word_count = self.word_count + 1
+
+    def __len__(self):
+        """Returns the number of words in this index."""
+        return self.word_count
+
+    def pattern_count(self):
+        """Returns the number of distinct letter patterns in this index."""
+        return len(self._words)
+
+    def words(self, pattern):
+        """Returns the sorted list of words with the given letter pattern.
+
+        Example: In the index for 'short.txt', words('ABCA') returns ['that'].
+
+        Precondition: pattern is a string."""
+        if pattern in self._words:
+            return self._words[pattern][:]
+        return []
+
+    def matches(self, word):
+        """Returns the sorted list of words with the same letter pattern as word.
+
+        Example: In the index for 'short.txt', matches('eave') returns ['that'].
+
+        Precondition: word is a string with only letters."""
+        return self.words(letter_pattern(word))
+
+
+def cipher_words(ciphertext):
+    """Returns the sorted list of the distinct words of ciphertext, in lowercase.
+
+    A word is a run of letters, so "don't" is the two words 'don' and 't'.
+
+    Example: cipher_words('Xli xli, QSB!') returns ['qsb', 'xli'].
+
+    Precondition: ciphertext is a string.
+
+    Enforced Precondition: ciphertext is a string."""
+    assert type(ciphertext) == str, `ciphertext` + ' is not a string'
+    return sorted(set(re.findall('[a-z]+', ciphertext.lower())))
+
+
+def decipher(ciphertext, key):
+    """Returns ciphertext with every letter replaced by its letter in key.
+
+    Uppercase letters stay uppercase.  Characters that are not in key (in
+    lowercase) are left alone.
+
+    Example: decipher('Xli!', {'x': 't', 'l': 'h', 'i': 'e'}) returns 'The!'.
+
+    Precondition: ciphertext is a string.  key is a dict from lowercase letters
+    to lowercase letters."""
+    result = []
+    for x in ciphertext:
+        letter = key.get(x.lower(), x)
+        if x.isupper():
+            letter = letter.upper()
+        result.append(letter)
+    return ''.join(result)
+
+
+def solve(ciphertext, index, limit=None):
+    """Returns the list of the keys that decipher every word of ciphertext into a
+    word of index.
+
+    A key is a dict from each cipher letter of ciphertext (in lowercase) to its
+    plain letter.  No two cipher letters have the same plain letter.  If limit
+    is not None, the search stops after finding limit keys.  Each key is found
+    once, so a text with no solution returns [].  This is also the result if any
+    word of the plain text (such as a name) is not in index.
+
+    The words of index are compared in lowercase.  Use decipher to apply a key.
+
+    Example: With the index for 'short.txt', solve('Xli xlex', index) returns
+    [{'x': 't', 'l': 'h', 'i': 'e', 'e': 'a'}].
+
+    Precondition: ciphertext is a string.  index is a PatternIndex.  limit is
+    None or an int > 0.
+
+    Enforced Precondition: ciphertext is a string.  index is a PatternIndex."""
+    assert isinstance(index, PatternIndex), `index` + ' is not a PatternIndex'
+    words = cipher_words(ciphertext)
+    candidates = {}
+    for word in words:
+        # Lowercasing can make letters equal, as in 'Aa', and so change the pattern
+        pattern = letter_pattern(word)
+        plains = set([match.lower() for match in index.words(pattern)])
+        candidates[word] = sorted([plain for plain in plains
+                                   if letter_pattern(plain) == pattern])
+    keys = []
+    _solve(candidates, {}, {}, keys, limit)
+    return keys
+
+
+def _solve(choices, key, used, keys, limit):
+    """Appends to keys every extension of key that deciphers each word of choices
+    into one of its choices.
+
+    The choices for a word only ever shrink as key grows, so each step filters
+    the lists it was given, not the full lists from the index.  key and used
+    are changed while searching, but are restored before returning.
+
+    Precondition: choices is a dict from each cipher word left to the list of
+    the plain words that agree with key.  key is a dict from cipher letters to
+    plain letters, and used is its inverse.  keys is a list.  limit is None or
+    an int > 0."""
+    if not choices:
+        keys.append(dict(key))
+        return
+
+    # The most constrained word first
+    word = None
+    for other in choices:
+        if word is None or len(choices[other]) < len(choices[word]):
+            word = other
+    for plain in choices[word]:
+        added = []
+        for x, y in zip(word, plain):
+            if not x in key:
+                key[x] = y
+                used[y] = x
+                added.append(x)
+        rest = {}
+        for other in choices:
+            if other != word:
+                rest[other] = [fit for fit in choices[other] if _agrees(other, fit, key, used)]
+                if not rest[other]:
+                    # A word with no choices left ends this branch
+                    rest = None
+                    break
+        if rest is not None:
+            _solve(rest, key, used, keys, limit)
+        for x in added:
+            del used[key[x]]
+            del key[x]
+        if limit is not None and len(keys) >= limit:
+            return
+
+
+def _agrees(word, plain, key, used):
+    """Returns True if deciphering word as plain agrees with key.
+
+    Every letter of word already in key must map to the letter of plain, and no
+    other letter of word may map to a plain letter that is already used.  The
+    two words are assumed to have the same letter pattern.
+
+    Precondition: word and plain are strings with the same letter pattern.  key
+    is a dict from cipher letters to plain letters, and used is its inverse."""
+    for x, y in zip(word, plain):
+        if x in key:
+            if key[x] != y:
+                return False
+        elif y in used:
+            return False
+    return True
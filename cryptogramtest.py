@@ -0,0 +1,82 @@
+# cryptogramtest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module cryptogram"""
+import string
+
+import cornelltest
+import a4
+import cryptogram
+
+
+# Test Procedures
+
+def test_letter_pattern():
+    """Test function letter_pattern"""
+    print 'Testing function letter_pattern'
+    cornelltest.assert_equals('ABCA', cryptogram.letter_pattern('that'))
+    cornelltest.assert_equals('ABCA', cryptogram.letter_pattern('eave'))
+    cornelltest.assert_equals('ABCCBD', cryptogram.letter_pattern('letter'))
+    cornelltest.assert_equals('A', cryptogram.letter_pattern('I'))
+    cornelltest.assert_equals('AB', cryptogram.letter_pattern('Aa'))
+    cornelltest.assert_equals('', cryptogram.letter_pattern(''))
+
+
+def test_pattern_index():
+    """Test class PatternIndex"""
+    print 'Testing PatternIndex'
+    index = cryptogram.PatternIndex(a4.build_word_list('short.txt'))
+    cornelltest.assert_equals(10, len(index))
+    cornelltest.assert_equals(['that'], index.words('ABCA'))
+    cornelltest.assert_equals(['that'], index.matches('eave'))
+    cornelltest.assert_equals(['and', 'the'], index.matches('xyz'))
+    cornelltest.assert_equals([], index.words('AA'))
+    cornelltest.assert_equals(5, index.pattern_count())
+
+    # The result is a copy
+    index.words('ABCA').append('eave')
+    cornelltest.assert_equals(['that'], index.words('ABCA'))
+
+
+def test_decipher():
+    """Test functions cipher_words and decipher"""
+    print 'Testing functions cipher_words and decipher'
+    cornelltest.assert_equals(['qsb', 'xli'], cryptogram.cipher_words('Xli xli, QSB!'))
+    cornelltest.assert_equals([], cryptogram.cipher_words('1, 2!'))
+    key = {'x': 't', 'l': 'h', 'i': 'e'}
+    cornelltest.assert_equals('The!', cryptogram.decipher('Xli!', key))
+    cornelltest.assert_equals('the q', cryptogram.decipher('xli q', key))
+
+
+def test_solve():
+    """Test function solve"""
+    print 'Testing function solve'
+    index = cryptogram.PatternIndex(a4.build_word_list('short.txt'))
+    keys = cryptogram.solve('Xli xlex', index)
+    cornelltest.assert_equals([{'x': 't', 'l': 'h', 'i': 'e', 'e': 'a'}], keys)
+    cornelltest.assert_equals('The that', cryptogram.decipher('Xli xlex', keys[0]))
+    cornelltest.assert_equals([], cryptogram.solve('Xli xlex qqq', index))
+    cornelltest.assert_equals([{}], cryptogram.solve('', index))
+
+    # Two words with the same pattern cannot share plain letters
+    keys = cryptogram.solve('abc def', index)
+    cornelltest.assert_equals(2, len(keys))
+    cornelltest.assert_equals(1, len(cryptogram.solve('abc def', index, 1)))
+
+    # A sentence of common words, shifted by three letters
+    plain = 'The people would like to know what you think about this work'
+    shift = string.maketrans(string.ascii_lowercase + string.ascii_uppercase,
+                             'defghijklmnopqrstuvwxyzabcDEFGHIJKLMNOPQRSTUVWXYZABC')
+    ciphertext = plain.translate(shift)
+    index = cryptogram.PatternIndex(a4.build_word_list('common.txt'))
+    keys = cryptogram.solve(ciphertext, index)
+    cornelltest.assert_equals([plain], [cryptogram.decipher(ciphertext, key) for key in keys])
+
+
+# Application Code
+if __name__ == "__main__":
+    test_letter_pattern()
+    test_pattern_index()
+    test_decipher()
+    test_solve()
+    print "Module cryptogram is working correctly"
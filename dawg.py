@@ -0,0 +1,207 @@
+# dawg.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Minimized prefix maps (directed acyclic word graphs)
+
+A prefix map stores the suffix 'ing' once for every word that ends with it.  A
+directed acyclic word graph (DAWG) is a prefix map in which any two nodes with
+the same set of completions are merged into one, so common suffixes are stored
+only once.  For complete.txt this needs far fewer nodes than a Trie.
+
+The graph is built in a single pass over a sorted word list, using the
+incremental algorithm of Daciuk, Mihov, Watson and Watson (2000).  Once built
+it cannot be changed.  A Dawg is a NodeMap, so it can be searched with
+autocomplete, scrabble and match like any other prefix map.
+"""
+from array import array
+
+from nodemap import NodeMap, NO_LENGTH
+
+
+class Dawg(NodeMap):
+    """Instances are read-only, minimized prefix maps.
+
+    The nodes of a Dawg are ints, with the root at 0.  As nodes are shared, a
+    node stands for a set of completions and not a single prefix.
+
+    Instance Attributes:
+        word_count: the number of words in this graph [int >= 0]
+    """
+    stores_lengths = True
+
+    def __init__(self, words):
+        """**Constructor**: Create the minimized graph for words.
+
+        Precondition: words is a sorted list of strings with only letters.
+        Duplicates are allowed.
+
+        Enforced Precondition: words is a list, and is sorted."""
+        assert type(words) == list, `words` + ' is not a list'
+
+        # During the build, node n is children[n] (a dict) and final[n].  Once it
+        # is checked, its completion lengths and number of words are lengths[n]
+        children = [{}]
+        final = [False]
+        lengths = [None]
+        register = {}
+        unchecked = []   # (parent, letter, child) along the previous word
+        previous = ''
+        count = 0
+
+        for word in words:
+            if word == previous and count > 0:
+                continue
+            assert word > previous or count == 0, `words` + ' is not sorted'
+
+            common = 0
+            limit = min(len(word), len(previous))
+            while common < limit and word[common] == previous[common]:
+                common = common + 1
+            self._minimize(children, final, lengths, register, unchecked, common)
+
+            if unchecked:
+                node = unchecked[-1][2]
+            else:
+                node = 0
+            for letter in word[common:]:
+                made = len(final)
+                children.append({})
+                final.append(False)
+                lengths.append(None)
+                children[node][letter] = made
+                unchecked.append((node, letter, made))
+                node = made
+            final[node] = True
+            previous = word
+            count = count + 1
+        self._minimize(children, final, lengths, register, unchecked, 0)
+        lengths[0] = self._measure(children[0], final[0], lengths)
+
+        self.word_count = count
+        self._freeze(children, final, lengths)
+
+    def _minimize(self, children, final, lengths, register, unchecked, depth):
+        """Merges the unchecked nodes below depth into equivalent registered nodes.
+
+        The nodes are checked deepest first, so the children of a node are always
+        registered before the node is.
+
+        Precondition: the arguments are the build state of the constructor.
+        depth is an int >= 0."""
+        while len(unchecked) > depth:
+            parent, letter, child = unchecked.pop()
+            lengths[child] = self._measure(children[child], final[child], lengths)
+            key = (final[child], tuple(sorted(children[child].items())))
+            if key in register:
+                children[parent][letter] = register[key]
+                children[child] = None
+            else:
+                register[key] = child
+
+    def _measure(self, edges, final, lengths):
+        """Returns the triple (shortest, longest, count) for a node, where shortest
+        and longest are its completion lengths and count its number of words.
+
+        Precondition: edges is the dict of children of the node, which have all
+        been measured.  final is True if the node ends a word.  lengths is the
+        list of measurements from the constructor."""
+        if final:
+            shortest = 0
+            count = 1
+        else:
+            shortest = NO_LENGTH
+            count = 0
+        longest = 0
+        for child in edges.values():
+            low, high, below = lengths[child]
+            shortest = min(shortest, low + 1)
+            longest = max(longest, high + 1)
+            count = count + below
+        return (shortest, longest, count)
+
+    def _freeze(self, children, final, lengths):
+        """Stores the graph built by the constructor in compact arrays.
+
+        The live nodes are renumbered breadth first from the root, and the edges
+        of each node are stored contiguously, sorted by letter.
+
+        Precondition: children, final and lengths are the build state of the
+        constructor."""
+        number = {0: 0}
+        order = [0]
+        self._offsets = array('i', [0])
+        self._targets = array('i')
+        self._final = array('B')
+        self._minlen = array('H')
+        self._maxlen = array('H')
+        self._count = array('i')
+        labels = []
+        pos = 0
+        while pos < len(order):
+            node = order[pos]
+            self._final.append(1 if final[node] else 0)
+            self._minlen.append(lengths[node][0])
+            self._maxlen.append(lengths[node][1])
+            self._count.append(lengths[node][2])
+            for letter, child in sorted(children[node].items()):
+                if not child in number:
+                    number[child] = len(order)
+                    order.append(child)
+                labels.append(letter)
+                self._targets.append(number[child])
+            self._offsets.append(len(self._targets))
+            pos = pos + 1
+        self._labels = ''.join(labels)
+
+    def __len__(self):
+        """Returns the number of nodes in this graph."""
+        return len(self._final)
+
+    def nbytes(self):
+        """Returns the number of bytes used by the node table."""
+        return (len(self._offsets) * self._offsets.itemsize +
+                len(self._targets) * self._targets.itemsize +
+                len(self._final) * self._final.itemsize + len(self._labels) +
+                len(self._minlen) * self._minlen.itemsize +
+                len(self._maxlen) * self._maxlen.itemsize +
+                len(self._count) * self._count.itemsize)
+
+    # Node Access
+    def child(self, node, letter):
+        """Returns the node reached from node by letter, or None if there is none.
+
+        Precondition: node is a node of this graph.  letter is a single character."""
+        start = self._offsets[node]
+        pos = self._labels.find(letter, start, self._offsets[node + 1])
+        if pos == -1:
+            return None
+        return self._targets[pos]
+
+    def children(self, node):
+        """Returns the list of (letter, node) pairs leaving node, sorted by letter.
+
+        Precondition: node is a node of this graph."""
+        start = self._offsets[node]
+        end = self._offsets[node + 1]
+        return zip(self._labels[start:end], self._targets[start:end])
+
+    def is_word(self, node):
+        """Returns True if node ends a word.
+
+        Precondition: node is a node of this graph."""
+        return self._final[node] == 1
+
+    def lengths(self, node):
+        """Returns the pair (shortest, longest) of the lengths of the completions
+        of node.
+
+        If no word passes through node, shortest is greater than longest.
+
+        Precondition: node is a node of this graph."""
+        return (self._minlen[node], self._maxlen[node])
+
+    def count(self, node):
+        """Returns the number of words that complete node.
+
+        Precondition: node is a node of this graph."""
+        return self._count[node]
@@ -0,0 +1,108 @@
+# dawgtest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module dawg"""
+import cornelltest
+import a4
+import dawg
+import trie
+from a4test import assert_lists_equal
+
+
+# Test Procedures
+
+def test_build():
+    """Test the constructor of Dawg"""
+    print 'Testing Dawg constructor'
+    pmap = dawg.Dawg([])
+    cornelltest.assert_equals(1, len(pmap))
+    cornelltest.assert_equals(0, pmap.word_count)
+    assert_lists_equal([], a4.pmap_to_word_list(pmap))
+
+    # Duplicates are allowed, but only counted once
+    pmap = dawg.Dawg(['a', 'at', 'at', 'by'])
+    cornelltest.assert_equals(3, pmap.word_count)
+    cornelltest.assert_equals(['a', 'at', 'by'], a4.pmap_to_word_list(pmap))
+
+    # Unsorted input is refused
+    try:
+        dawg.Dawg(['by', 'at'])
+        cornelltest.quit_with_error('Dawg accepted an unsorted list')
+    except AssertionError:
+        pass
+
+
+def test_minimized():
+    """Test that shared suffixes are stored once"""
+    print 'Testing Dawg minimization'
+    words = ['tap', 'taps', 'top', 'tops']
+    pmap = dawg.Dawg(words)
+    # t, a|o (shared), p, s: root + 4 nodes
+    cornelltest.assert_equals(5, len(pmap))
+    cornelltest.assert_equals(pmap.find('ta'), pmap.find('to'))
+    cornelltest.assert_equals(words, a4.pmap_to_word_list(pmap))
+
+    words = ['bakes', 'baking', 'makes', 'making', 'rakes', 'raking']
+    pmap = dawg.Dawg(words)
+    cornelltest.assert_true(len(pmap) < len(trie.Trie(words)))
+    cornelltest.assert_equals(pmap.find('bak'), pmap.find('rak'))
+    cornelltest.assert_equals(words, a4.pmap_to_word_list(pmap))
+
+
+def test_lengths():
+    """Test the completion lengths and counts stored in a Dawg"""
+    print 'Testing Dawg lengths and counts'
+    pmap = dawg.Dawg([])
+    shortest, longest = pmap.lengths(pmap.root)
+    cornelltest.assert_true(shortest > longest)
+
+    pmap = dawg.Dawg(['a', 'that', 'thatch', 'the'])
+    cornelltest.assert_equals((1, 6), pmap.lengths(pmap.root))
+    cornelltest.assert_equals((1, 4), pmap.lengths(pmap.find('th')))
+    cornelltest.assert_equals((0, 2), pmap.lengths(pmap.find('that')))
+    cornelltest.assert_equals((0, 0), pmap.lengths(pmap.find('a')))
+
+    # Counts are per node, even when the node is shared
+    pmap = dawg.Dawg(['bake', 'baked', 'make', 'maked', 'takes'])
+    cornelltest.assert_equals(5, a4.count_completions('', pmap))
+    cornelltest.assert_equals(2, a4.count_completions('bak', pmap))
+    cornelltest.assert_equals(2, a4.count_completions('mak', pmap))
+    cornelltest.assert_equals(1, a4.count_completions('tak', pmap))
+
+
+def test_prefix_map_interface():
+    """Test that a Dawg looks like the dict prefix map"""
+    print 'Testing Dawg as a prefix map'
+    pmap = dawg.Dawg(['a', 'at', 'by'])
+    assert_lists_equal(['a','b'], pmap[''])
+    assert_lists_equal(['','t'], pmap['a'])
+    assert_lists_equal([''], pmap['by'])
+    cornelltest.assert_false('c' in pmap)
+    assert_lists_equal(['', 'a', 'b', 'at', 'by'], list(pmap))
+    cornelltest.assert_true(a4.pmap_has_word(pmap, 'at'))
+    cornelltest.assert_false(a4.pmap_has_word(pmap, 'b'))
+    cornelltest.assert_false(a4.pmap_has_word(pmap, ''))
+
+
+def test_searches():
+    """Test that searching a Dawg agrees with the dict prefix map"""
+    print 'Testing searches on Dawg'
+    words = sorted(a4.build_word_list('short.txt'))
+    pmap = dawg.Dawg(words)
+    assert_lists_equal(['the', 'that'], a4.autocomplete('th', pmap))
+    assert_lists_equal(['be', 'to'], a4.scrabble('theob', 2, pmap))
+    assert_lists_equal(['in', 'it'], a4.match('i?', pmap))
+
+    pmap = dawg.Dawg(['ale', 'are', 'ate', 'axe', 'axes'])
+    assert_lists_equal(['ate','are','ale','axe'], a4.match('a?e', pmap))
+    assert_lists_equal(['axe', 'axes'], a4.autocomplete('ax', pmap))
+
+
+# Application Code
+if __name__ == "__main__":
+    test_build()
+    test_minimized()
+    test_lengths()
+    test_prefix_map_interface()
+    test_searches()
+    print "Module dawg is working correctly"
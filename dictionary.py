@@ -0,0 +1,387 @@
+# dictionary.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Dictionaries: word lists kept together with the indexes that search them
+
+The functions in a4 work from a bare word list or prefix map, and so have to
+rebuild whatever they need on every call.  For example, word_list_by_size scans
+the whole list every time.  A Dictionary builds its indexes once, when it is
+created, and answers queries from them.
+"""
+import bisect
+import re
+
+import a4
+import cryptogram
+from anagram import AnagramIndex
+from dawg import Dawg
+from lettermask import LetterSetIndex
+from lrucache import AutocompleteCache, ScrabbleMemo
+from pattern import Regex, match_pattern
+from sortedwords import END
+from templateindex import TemplateIndex
+from trie import Trie
+
+
+# Visiting a node of a prefix map in match_regex costs about as much as matching
+# this many words with re, so a walk is only worth it when it visits fewer than
+# len(words) / _WALK_COST nodes
+_WALK_COST = 16
+
+
+def load_dictionary(filename, minimize=False, reverse=False):
+    """Returns the dictionary for the word list stored in filename.
+
+    Precondition: filename is the name of a text file storing a list of words, as
+    in build_word_list.  minimize and reverse are bools, as in the Dictionary
+    constructor.
+
+    Enforced Precondition: filename is a string."""
+    assert type(filename) == str, `filename` + ' is not a string'
+    return Dictionary(a4.build_word_list(filename), minimize, reverse)
+
+
+class Dictionary(object):
+    """Instances are word lists indexed for searching.
+
+    Besides the sorted word list and its prefix map, a dictionary keeps the words
+    in buckets by length.  Each bucket is sorted, so the words of a given length
+    that start with a given prefix are a contiguous range of their bucket.
+
+    Instance Attributes:
+        words: the words in this dictionary, sorted, without duplicates [list of str]
+        pmap:  the prefix map for words [Trie, or Dawg if minimized]
+        rpmap: the prefix map for the reversed words, of the same kind as pmap,
+               or None [Trie, Dawg, or None]
+        cache: the cache of autocomplete results [AutocompleteCache, or None]
+        memo:  the memo of scrabble results [ScrabbleMemo, or None]
+    """
+
+    def __init__(self, words, minimize=False, reverse=False):
+        """**Constructor**: Create a new dictionary of the given words.
+
+        If minimize is True, the prefix map is a Dawg, which takes much less
+        memory but cannot have words added to it.  If reverse is True, the
+        dictionary also has a prefix map of the reversed words, so that
+        templates that end with fixed letters are matched from the end.
+
+        Precondition: words is a list of strings with only letters.  minimize and
+        reverse are bools.
+
+        Enforced Precondition: words is a list."""
+        assert type(words) == list, `words` + ' is not a list'
+        self.words = []
+        for word in sorted(words):
+            if not self.words or self.words[-1] != word:
+                self.words.append(word)
+
+        if minimize:
+            self.pmap = Dawg(self.words)
+        else:
+            self.pmap = Trie(self.words)
+        self.rpmap = None
+        if reverse:
+            self.rpmap = type(self.pmap)(a4.reverse_word_list(self.words))
+
+        self.cache = None
+        self.memo = None
+        self._anagrams = None
+        self._letter_sets = None
+        self._templates = None
+        self._patterns = None
+        self._by_size = {}
+        for word in self.words:
+            size = len(word)
+            if size in self._by_size:
+                self._by_size[size].append(word)
+            else:
+                self._by_size[size] = [word]
+
+    def __len__(self):
+        """Returns the number of words in this dictionary."""
+        return len(self.words)
+
+    def __contains__(self, word):
+        """Returns True if word is in this dictionary."""
+        return type(word) == str and self.pmap.has_word(word)
+
+    def has_word(self, word):
+        """Returns True if word is in this dictionary.
+
+        Precondition: word is a string.
+
+        Enforced Precondition: word is a string."""
+        assert type(word) == str, `word` + ' is not a string'
+        return self.pmap.has_word(word)
+
+    def word_list_by_size(self, size, prefix=''):
+        """Returns the sorted list of words with length size that start with prefix.
+
+        This is a lookup in the bucket for size, not a scan of the word list.
+
+        Example: In the dictionary for 'short.txt', word_list_by_size(2) returns
+        ['be', 'in', 'it', 'of', 'to'], and word_list_by_size(2, 'i') returns
+        ['in', 'it'].
+
+        Precondition: size is an int >= 0.  prefix is a string.
+
+        Enforced Precondition: size is an int >= 0.  prefix is a string."""
+        assert type(size) == int and size >= 0, `size` + ' is not a non-negative integer'
+        assert type(prefix) == str, `prefix` + ' is not a string'
+        if not size in self._by_size:
+            return []
+        bucket = self._by_size[size]
+        if prefix == '':
+            return bucket[:]
+        start = bisect.bisect_left(bucket, prefix)
+        end = bisect.bisect_left(bucket, prefix + END, start)
+        return bucket[start:end]
+
+    def can_complete(self, prefix, size):
+        """Returns True if some word of length size starts with prefix.
+
+        This checks the completion lengths stored in the prefix map.  It can say
+        True when no completion has exactly the right length, but it never says
+        False when there is one.
+
+        Precondition: prefix is a string.  size is an int >= 0.
+
+        Enforced Precondition: prefix is a string.  size is an int >= 0."""
+        assert type(prefix) == str, `prefix` + ' is not a string'
+        assert type(size) == int and size >= 0, `size` + ' is not a non-negative integer'
+        node = self.pmap.find(prefix)
+        if node is None:
+            return False
+        shortest, longest = self.pmap.lengths(node)
+        return shortest <= size - len(prefix) <= longest
+
+    def use_cache(self, maxsize=1000):
+        """Starts caching the results of autocomplete, keeping up to maxsize.
+
+        Precondition: maxsize is an int > 0."""
+        self.cache = AutocompleteCache(maxsize)
+
+    def use_memo(self, maxsize=1000):
+        """Starts remembering the results of scrabble searches with blanks,
+        keeping up to maxsize of them.
+
+        Precondition: maxsize is an int > 0."""
+        self.memo = ScrabbleMemo(maxsize)
+
+    def stats(self):
+        """Returns a dict from 'autocomplete' and 'scrabble' to the counters of the
+        cache and the memo (see lrucache.LRUCache.stats).
+
+        A search that is not cached or memoized is left out."""
+        result = {}
+        if self.cache is not None:
+            result['autocomplete'] = self.cache.stats()
+        if self.memo is not None:
+            result['scrabble'] = self.memo.stats()
+        return result
+
+    # Searches
+    def autocomplete(self, prefix, limit=None, after=None):
+        """Returns the sorted list of words that complete prefix.
+
+        The arguments limit and after are as in a4.autocomplete_iter.  If this
+        dictionary has a cache (see use_cache), queries without after use it.
+
+        Precondition: prefix is a string that is either empty or has only letters.
+        limit is None or an int >= 0.  after is None or a string."""
+        if self.cache is not None and after is None:
+            return list(self.cache.autocomplete(prefix, self.pmap, limit))
+        return list(a4.autocomplete_iter(prefix, self.pmap, limit, after))
+
+    def count_completions(self, prefix):
+        """Returns the number of words that complete prefix.
+
+        Precondition: prefix is a string that is either empty or has only letters."""
+        return a4.count_completions(prefix, self.pmap)
+
+    def load_ranks(self, filename):
+        """Ranks the words of this dictionary by the word list in filename.
+
+        The words in the file should be listed best first, as in common.txt.  See
+        a4.pmap_add_ranks for the details.
+
+        Precondition: filename is the name of a text file storing a list of words.
+        This dictionary is not minimized.
+
+        Enforced Precondition: This dictionary is not minimized."""
+        assert isinstance(self.pmap, Trie), 'a minimized dictionary cannot be ranked'
+        a4.pmap_add_ranks(self.pmap, a4.build_word_list(filename))
+
+    def autocomplete_top(self, prefix, k):
+        """Returns the list of the k best-ranked words that complete prefix.
+
+        See a4.autocomplete_top for the details.  If no ranks have been loaded,
+        these are the first k completions in alphabetical order.
+
+        Precondition: prefix is a string that is either empty or has only letters.
+        k is an int >= 0.  This dictionary is not minimized."""
+        return a4.autocomplete_top(prefix, self.pmap, k)
+
+    def anagram_index(self):
+        """Returns the anagram index of this dictionary, building it the first time.
+
+        The index is only built when it is needed, as it takes about as much
+        memory as the word list."""
+        if self._anagrams is None:
+            self._anagrams = AnagramIndex(self.words)
+        return self._anagrams
+
+    def letter_set_index(self):
+        """Returns the letter-set index of this dictionary, building it the first time."""
+        if self._letter_sets is None:
+            self._letter_sets = LetterSetIndex(self.words)
+        return self._letter_sets
+
+    def template_index(self):
+        """Returns the template index of this dictionary, building it the first time."""
+        if self._templates is None:
+            self._templates = TemplateIndex(self.words)
+        return self._templates
+
+    def pattern_index(self):
+        """Returns the letter pattern index of this dictionary, building it the
+        first time."""
+        if self._patterns is None:
+            self._patterns = cryptogram.PatternIndex(self.words)
+        return self._patterns
+
+    def anagrams(self, rack):
+        """Returns the sorted list of words that use every tile of rack exactly once.
+
+        This is one lookup in the anagram index.
+
+        Precondition: rack is a string."""
+        return self.anagram_index().anagrams(rack)
+
+    def scrabble(self, rack, size):
+        """Returns the list of words that you can form from rack using exactly size
+        letters, as in a4.scrabble.
+
+        This looks up the sub-racks of rack in the anagram index, instead of
+        searching the prefix map.  A full rack is a single lookup.  A rack with
+        blanks ('?') is searched in the prefix map, using the memo if this
+        dictionary has one (see use_memo).
+
+        Precondition: rack is a string of letters and blanks, which may be empty.
+        size is an int >= 0."""
+        if a4.BLANK in rack:
+            if self.memo is not None:
+                return self.memo.scrabble(rack, size, self.pmap)
+            return a4.scrabble(rack, size, self.pmap)
+        return self.anagram_index().scrabble(rack, size)
+
+    def scrabble_blanks(self, rack, size):
+        """Returns the list of pairs (word, blanks) for the words that you can form
+        from rack using exactly size letters, as in a4.scrabble_blanks.
+
+        This uses the memo if this dictionary has one (see use_memo).
+
+        Precondition: rack is a string of letters and blanks, which may be empty.
+        size is an int >= 0."""
+        if self.memo is not None:
+            return self.memo.scrabble_blanks(rack, size, self.pmap)
+        return a4.scrabble_blanks(rack, size, self.pmap)
+
+    def scrabble_all(self, rack):
+        """Returns a dict from each length to the list of words of that length that
+        you can form from rack, as in a4.scrabble_all.
+
+        Like scrabble, this uses the anagram index unless rack has blanks.
+
+        Precondition: rack is a string of letters and blanks, which may be empty."""
+        if a4.BLANK in rack:
+            return a4.scrabble_all(rack, self.pmap)
+        return self.anagram_index().scrabble_all(rack)
+
+    def spelling_bee(self, letters, center='', min_size=1):
+        """Returns the sorted list of words spelled only with letters (each used any
+        number of times) that use every letter in center and have at least
+        min_size letters.
+
+        See lettermask.LetterSetIndex.spelling_bee for the details.
+
+        Precondition: letters and center are strings that are either empty or
+        have only letters.  min_size is an int >= 0."""
+        return self.letter_set_index().spelling_bee(letters, center, min_size)
+
+    def match(self, template):
+        """Returns the list of words that match template, as in a4.match.
+
+        This combines the bitsets of the template's letters in the template index,
+        instead of searching the prefix map.
+
+        Precondition: template is a string of letters and '?'."""
+        return self.template_index().match(template)
+
+    def match_rack(self, template, rack):
+        """Returns the list of words that match template, filling each '?' with a
+        tile from rack, as in a4.match_rack.
+
+        Precondition: template is a string of letters and '?'.  rack is a string
+        of letters and blanks, which may be empty."""
+        return a4.match_rack(template, rack, self.pmap, self.rpmap)
+
+    def match_pattern(self, pattern):
+        """Returns the sorted list of words that pattern accepts, as in
+        pattern.match_pattern.
+
+        The pattern may have letter classes, stars and runs.  If this dictionary
+        has a reversed prefix map, a pattern with more fixed letters at its end is
+        matched from the end.
+
+        Precondition: pattern is a pattern.Pattern, or a string in the pattern
+        syntax."""
+        return match_pattern(pattern, self.pmap, self.rpmap)
+
+    def match_regex(self, expression):
+        """Returns the sorted list of words that the regular expression matches in
+        full.
+
+        The expression is compiled into a pattern.Regex, which is walked together
+        with the prefix map, so that no word below a prefix that cannot match is
+        looked at.  See pattern.Regex for the syntax.
+
+        The walk only pays off if it visits few nodes.  An expression like
+        '.*ss.*' can match below every prefix, and one like '.*(ing|ed)' narrows
+        the last letters but still leaves many words below them.  So the walk is
+        given a budget of len(words) / _WALK_COST nodes (see
+        pattern.match_pattern), and if it would go over, or if the expression
+        narrows neither end, each word is matched with the module re instead.
+
+        Precondition: expression is a string in the syntax of pattern.Regex."""
+        compiled = Regex(expression)
+        narrow = compiled.narrow_prefix()
+        if self.rpmap is not None:
+            narrow = max(narrow, compiled.reverse().narrow_prefix())
+        if narrow > 0:
+            result = match_pattern(compiled, self.pmap, self.rpmap,
+                                   len(self.words) // _WALK_COST)
+            if result is not None:
+                return result
+        regex = re.compile('(?:' + expression + r')\Z')
+        return [word for word in self.words if regex.match(word)]
+
+    def letter_pattern_words(self, word):
+        """Returns the sorted list of words with the same letter pattern as word.
+
+        See cryptogram.letter_pattern.  Example: In the dictionary for
+        'short.txt', letter_pattern_words('eave') returns ['that'].
+
+        Precondition: word is a string with only letters."""
+        return self.pattern_index().matches(word)
+
+    def solve_cryptogram(self, ciphertext, limit=None):
+        """Returns the list of the texts that ciphertext can be deciphered into,
+        with every word in this dictionary.
+
+        See cryptogram.solve for the details.  If limit is not None, at most limit
+        texts are returned.
+
+        Precondition: ciphertext is a string.  limit is None or an int > 0."""
+        keys = cryptogram.solve(ciphertext, self.pattern_index(), limit)
+        return [cryptogram.decipher(ciphertext, key) for key in keys]
@@ -0,0 +1,122 @@
+# dictionarytest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module dictionary"""
+import re
+import cornelltest
+import dictionary
+from a4test import assert_lists_equal
+
+
+# Test Procedures
+
+def test_constructor():
+    """Test the Dictionary constructor and load_dictionary"""
+    print 'Testing Dictionary constructor'
+    words = dictionary.Dictionary(['the', 'a', 'the', 'at'])
+    cornelltest.assert_equals(['a', 'at', 'the'], words.words)
+    cornelltest.assert_equals(3, len(words))
+    cornelltest.assert_true('at' in words)
+    cornelltest.assert_false('t' in words)
+    cornelltest.assert_true(words.has_word('the'))
+    cornelltest.assert_false(words.has_word('th'))
+
+    words = dictionary.load_dictionary('short.txt', True)
+    cornelltest.assert_equals(10, len(words))
+    cornelltest.assert_true(words.has_word('have'))
+
+
+def test_word_list_by_size():
+    """Test method word_list_by_size"""
+    print 'Testing Dictionary.word_list_by_size'
+    for minimize in [False, True]:
+        words = dictionary.load_dictionary('short.txt', minimize)
+        cornelltest.assert_equals(['be', 'in', 'it', 'of', 'to'],
+                                  words.word_list_by_size(2))
+        cornelltest.assert_equals(['in', 'it'], words.word_list_by_size(2, 'i'))
+        cornelltest.assert_equals(['that'], words.word_list_by_size(4, 'th'))
+        cornelltest.assert_equals(['the'], words.word_list_by_size(3, 'th'))
+        cornelltest.assert_equals([], words.word_list_by_size(5))
+        cornelltest.assert_equals([], words.word_list_by_size(0))
+        cornelltest.assert_equals([], words.word_list_by_size(2, 'x'))
+
+    # The result is a copy
+    words.word_list_by_size(1).append('z')
+    cornelltest.assert_equals(['a'], words.word_list_by_size(1))
+
+
+def test_can_complete():
+    """Test method can_complete"""
+    print 'Testing Dictionary.can_complete'
+    for minimize in [False, True]:
+        words = dictionary.load_dictionary('short.txt', minimize)
+        cornelltest.assert_true(words.can_complete('th', 3))
+        cornelltest.assert_true(words.can_complete('th', 4))
+        cornelltest.assert_false(words.can_complete('th', 2))
+        cornelltest.assert_false(words.can_complete('th', 5))
+        cornelltest.assert_true(words.can_complete('', 1))
+        cornelltest.assert_false(words.can_complete('', 5))
+        cornelltest.assert_false(words.can_complete('x', 1))
+
+
+def test_searches():
+    """Test the search methods of Dictionary"""
+    print 'Testing Dictionary searches'
+    words = dictionary.load_dictionary('short.txt')
+    assert_lists_equal(['the', 'that'], words.autocomplete('th'))
+    cornelltest.assert_equals(2, words.count_completions('th'))
+    cornelltest.assert_equals(['that', 'the'], words.autocomplete_top('th', 5))
+    words.load_ranks('common.txt')
+    cornelltest.assert_equals(['the', 'that'], words.autocomplete_top('th', 5))
+    cornelltest.assert_equals(['the', 'be'], words.autocomplete_top('', 2))
+    words.use_cache(10)
+    cornelltest.assert_equals(['that'], words.autocomplete('th', 1))
+    cornelltest.assert_equals(['that'], words.autocomplete('th', 1))
+    cornelltest.assert_equals(['the'], words.autocomplete('th', None, 'that'))
+    cornelltest.assert_equals(1, words.cache.stats()['hits'])
+    assert_lists_equal(['be', 'to'], words.scrabble('theob', 2))
+    cornelltest.assert_equals({2: ['be', 'to'], 3: ['the']}, words.scrabble_all('theob'))
+    cornelltest.assert_equals(['have'], words.anagrams('veha'))
+    cornelltest.assert_equals(['it', 'to'], words.scrabble('t?', 2))
+    cornelltest.assert_equals([('the', 'h')], words.scrabble_blanks('t?e', 3))
+    cornelltest.assert_equals({1: ['a'], 2: ['it', 'to']}, words.scrabble_all('t?'))
+    cornelltest.assert_equals(['autocomplete'], words.stats().keys())
+    words.use_memo(100)
+    cornelltest.assert_equals(['it', 'to'], words.scrabble('t?', 2))
+    cornelltest.assert_equals(['it', 'to'], words.scrabble('?t', 2))
+    cornelltest.assert_equals([('the', 'h')], words.scrabble_blanks('t?e', 3))
+    cornelltest.assert_true(words.stats()['scrabble']['hits'] > 0)
+    cornelltest.assert_equals(10, len(words.anagram_index()))
+    cornelltest.assert_equals(['that', 'the'], words.spelling_bee('aeht', 't'))
+    cornelltest.assert_equals(['that'], words.spelling_bee('aeht', 't', 4))
+    assert_lists_equal(['in', 'it'], words.match('i?'))
+    cornelltest.assert_equals(['that'], words.match('?h?t'))
+    cornelltest.assert_equals(['that'], words.match_rack('th??', 'ta'))
+    cornelltest.assert_equals([], words.match_rack('th??', 'te'))
+
+    # The reversed map answers the same queries
+    words = dictionary.load_dictionary('short.txt', False, True)
+    cornelltest.assert_equals(['dna', 'eb', 'eht', 'evah', 'fo'], words.rpmap.words('')[1:6])
+    cornelltest.assert_equals(['that'], words.match_rack('??at', 'th'))
+    cornelltest.assert_equals(['in', 'it'], words.match_rack('i?', 'nt'))
+    cornelltest.assert_equals(['be', 'have', 'the'], words.match_pattern('*[^aio]e'))
+    cornelltest.assert_equals(['a', 'and', 'in'], words.match_regex('(a|i)n?d?'))
+    cornelltest.assert_equals(['a', 'and', 'have', 'that'], words.match_regex('.*a.*'))
+    # Walking the map or falling back to re gives the same words
+    common = dictionary.load_dictionary('common.txt', False, True)
+    for text in ['th.*', '.*tion', '.*(ing|ed)', 'a.{2,3}e', '[^aeiou]+', 's[^aeiou]*',
+                 'un.*']:
+        regex = re.compile('(?:' + text + r')\Z')
+        cornelltest.assert_equals([word for word in common.words if regex.match(word)],
+                                  common.match_regex(text))
+    cornelltest.assert_equals(['that'], words.letter_pattern_words('eave'))
+    cornelltest.assert_equals(['The that'], words.solve_cryptogram('Xli xlex'))
+
+
+# Application Code
+if __name__ == "__main__":
+    test_constructor()
+    test_word_list_by_size()
+    test_can_complete()
+    test_searches()
+    print "Module dictionary is working correctly"
@@ -0,0 +1,112 @@
+# gaddag.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""GADDAGs: word graphs that can be read in both directions from any letter
+
+A prefix map can only build a word from its first letter.  On a Scrabble board a
+move must pass through a square next to the tiles already played, which may be
+in the middle of the word.  A GADDAG (Gordon, 1994) stores, for every word and
+every way of splitting it into a nonempty front and a back, the string
+
+    reverse(front) + SEP + back
+
+For example, 'care' is stored as 'c>are', 'ac>re', 'rac>e' and 'erac>'.  A move
+generator starts at a letter of the word, reads the front right to left, then
+crosses SEP and reads the back left to right.
+
+The strings are stored in a minimized graph (see dawg.Dawg), which shares their
+common suffixes.  A Gaddag is a NodeMap of these strings, not of the words, so
+the a4 searches do not make sense on it.  Use has_word and words instead.
+
+Building the Gaddag for complete.txt takes about half a minute.  Compile it once
+with pmapfile.compile_pmap, and load it with pmapfile.load_pmap; the loaded map
+works with the move generator in movegen just like a Gaddag.
+"""
+from dawg import Dawg
+
+
+# The separator between the reversed front of a word and its back
+SEP = '>'
+
+
+def gaddag_strings(word):
+    """Returns the list of the strings that the Gaddag stores for word.
+
+    Example: gaddag_strings('care') returns ['c>are', 'ac>re', 'rac>e', 'erac>'].
+
+    Precondition: word is a nonempty string with only letters."""
+    return [word[pos-1::-1] + SEP + word[pos:] for pos in range(1, len(word) + 1)]
+
+
+def follow(gaddag, node, string):
+    """Returns the node reached from node by the letters of string, or None if the
+    path leaves the graph.
+
+    Precondition: gaddag is a NodeMap (usually a Gaddag).  node is one of its
+    nodes.  string is a string."""
+    for letter in string:
+        node = gaddag.child(node, letter)
+        if node is None:
+            return None
+    return node
+
+
+class Gaddag(Dawg):
+    """Instances are minimized graphs of the GADDAG strings of a word list.
+
+    Instance Attributes:
+        word_count:   the number of words (not strings) in this graph [int >= 0]
+        string_count: the number of strings stored [int >= 0]
+    """
+
+    def __init__(self, words):
+        """**Constructor**: Create the GADDAG for words.
+
+        The words do not need to be sorted, and duplicates are ignored.
+
+        Precondition: words is a list of strings with only letters.
+
+        Enforced Precondition: words is a list."""
+        assert type(words) == list, `words` + ' is not a list'
+        unique = set(words)
+        unique.discard('')
+        strings = []
+        for word in unique:
+            strings.extend(gaddag_strings(word))
+        strings.sort()
+        Dawg.__init__(self, strings)
+        self.string_count = self.word_count
+        self.word_count = len(unique)
+
+    def has_word(self, word):
+        """Returns True if word is one of the words of this graph.
+
+        Precondition: word is a string."""
+        if word == '':
+            return False
+        node = follow(self, self.root, word[0] + SEP + word[1:])
+        return node is not None and self.is_word(node)
+
+    def words(self, prefix=''):
+        """Returns the list of words of this graph that start with prefix, sorted.
+
+        Precondition: prefix is a string."""
+        if prefix == '':
+            result = []
+            for letter, child in self.children(self.root):
+                if letter != SEP:
+                    result.extend(self.words(letter))
+            return result
+        node = follow(self, self.root, prefix[::-1] + SEP)
+        if node is None:
+            return []
+        result = []
+        stack = [(prefix, node)]
+        while stack:
+            word, node = stack.pop()
+            if self.is_word(node):
+                result.append(word)
+            edges = self.children(node)
+            for pos in range(len(edges) - 1, -1, -1):
+                stack.append((word + edges[pos][0], edges[pos][1]))
+        return result
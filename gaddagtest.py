@@ -0,0 +1,70 @@
+# gaddagtest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module gaddag"""
+import os
+import tempfile
+import cornelltest
+import a4
+import gaddag
+import pmapfile
+
+
+# Test Procedures
+
+def test_strings():
+    """Test function gaddag_strings"""
+    print 'Testing gaddag_strings'
+    cornelltest.assert_equals(['c>are', 'ac>re', 'rac>e', 'erac>'],
+                              gaddag.gaddag_strings('care'))
+    cornelltest.assert_equals(['a>'], gaddag.gaddag_strings('a'))
+
+
+def test_constructor():
+    """Test the Gaddag constructor and methods has_word and words"""
+    print 'Testing Gaddag constructor'
+    graph = gaddag.Gaddag(['care', 'cat', 'care', 'a'])
+    cornelltest.assert_equals(3, graph.word_count)
+    cornelltest.assert_equals(8, graph.string_count)
+    cornelltest.assert_true(graph.has_word('care'))
+    cornelltest.assert_true(graph.has_word('a'))
+    cornelltest.assert_false(graph.has_word('car'))
+    cornelltest.assert_false(graph.has_word(''))
+    cornelltest.assert_equals(['a', 'care', 'cat'], graph.words())
+    cornelltest.assert_equals(['care', 'cat'], graph.words('ca'))
+    cornelltest.assert_equals([], graph.words('x'))
+
+    # Reading right to left from a middle letter
+    node = gaddag.follow(graph, graph.root, 'rac' + gaddag.SEP + 'e')
+    cornelltest.assert_true(graph.is_word(node))
+    cornelltest.assert_equals(None, gaddag.follow(graph, graph.root, 'tac' + gaddag.SEP + 'e'))
+
+    words = a4.build_word_list('common.txt')
+    graph = gaddag.Gaddag(words)
+    cornelltest.assert_equals(sorted(set(words)), graph.words())
+    for word in words[:200]:
+        cornelltest.assert_true(graph.has_word(word))
+
+
+def test_compile():
+    """Test that a compiled Gaddag reads the same"""
+    print 'Testing compiled Gaddag'
+    graph = gaddag.Gaddag(a4.build_word_list('short.txt'))
+    handle, filename = tempfile.mkstemp(suffix='.pmap')
+    os.close(handle)
+    pmapfile.compile_pmap(graph, filename)
+    loaded = pmapfile.load_pmap(filename)
+    for string in ['eht>', 'ht>e', 't>o', 'fo>']:
+        node = gaddag.follow(loaded, loaded.root, string)
+        cornelltest.assert_true(loaded.is_word(node))
+    cornelltest.assert_equals(None, gaddag.follow(loaded, loaded.root, 'x>'))
+    loaded.close()
+    os.remove(filename)
+
+
+# Application Code
+if __name__ == "__main__":
+    test_strings()
+    test_constructor()
+    test_compile()
+    print "Module gaddag is working correctly"
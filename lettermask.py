@@ -0,0 +1,147 @@
+# lettermask.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Letter-set masks for queries that allow letters to repeat
+
+Some puzzles ask for the words spelled only with a given set of letters, using
+each letter as often as needed, and often require one center letter.  Such a
+query only cares which letters a word uses, not how many times.  The mask of a
+word is an int with one bit for each letter it uses, so the query is bitwise:
+a word uses only the allowed letters when its mask has no bit outside theirs.
+
+A LetterSetIndex groups the words by mask.  Many words share a mask, so a query
+only looks at the distinct masks.  When there are few allowed letters, it does
+not even look at those, but looks up each subset of the allowed letters.
+"""
+import string
+
+
+# The letters with a bit in a mask; the lowercase letters are bits 0 to 25
+LETTERS = string.ascii_lowercase + string.ascii_uppercase
+
+# The bit for each letter
+_BITS = {}
+for _pos in range(len(LETTERS)):
+    _BITS[LETTERS[_pos]] = 1 << _pos
+
+
+def letter_mask(letters):
+    """Returns the mask with a bit for every letter in letters.
+
+    Repeated letters have no effect, so letter_mask('tee') == letter_mask('et').
+
+    Precondition: letters is a string that is either empty or has only letters.
+
+    Enforced Precondition: letters is a string."""
+    assert type(letters) == str, `letters` + ' is not a string'
+    mask = 0
+    for letter in letters:
+        mask = mask | _BITS[letter]
+    return mask
+
+
+def mask_letters(mask):
+    """Returns the letters with a bit in mask, in the order of LETTERS.
+
+    Example: mask_letters(letter_mask('tee')) returns 'et'.
+
+    Precondition: mask is an int >= 0 with no bit past len(LETTERS)."""
+    return ''.join([letter for letter in LETTERS if mask & _BITS[letter]])
+
+
+class LetterSetIndex(object):
+    """Instances map each letter mask to the words with that mask.
+
+    Instance Attributes:
+        word_count: the number of words in this index [int >= 0]
+    """
+
+    def __init__(self, words):
+        """**Constructor**: Create the letter-set index for words.
+
+        Duplicates are ignored.
+
+        Precondition: words is a list of strings with only letters.
+
+        Enforced Precondition: words is a list."""
+        assert type(words) == list, `words` + ' is not a list'
+        self._words = {}
+        self.word_count = 0
+        for word in sorted(words):
+            mask = letter_mask(word)
+            if not mask in self._words:
+                self._words[mask] = [word]
+                self.word_count = self.word_count + 1
+            elif self._words[mask][-1] != word:
+                self._words[mask].append(word)
+                self.word_count = self.word_count + 1
+        self._masks = sorted(self._words)
+
+    def __len__(self):
+        """Returns the number of words in this index."""
+        return self.word_count
+
+    def mask_count(self):
+        """Returns the number of distinct masks in this index."""
+        return len(self._masks)
+
+    def _submasks(self, allowed, required):
+        """Returns the list of the masks in this index that are subsets of allowed
+        and supersets of required.
+
+        If allowed has few enough bits, this looks up each of its subsets.
+        Otherwise it checks each distinct mask.
+
+        Precondition: allowed and required are masks."""
+        if required & ~allowed:
+            return []
+        free = allowed & ~required
+        if 1 << bin(free).count('1') <= len(self._masks):
+            result = []
+            sub = free
+            while True:
+                if sub | required in self._words:
+                    result.append(sub | required)
+                if sub == 0:
+                    return result
+                sub = (sub - 1) & free
+        return [mask for mask in self._masks
+                if mask & ~allowed == 0 and mask & required == required]
+
+    def spelling_bee(self, letters, center='', min_size=1):
+        """Returns the sorted list of words spelled only with letters, that use
+        every letter in center, and have at least min_size letters.
+
+        Letters may be used any number of times.
+
+        Example: In the index for 'short.txt', spelling_bee('aeht','t') returns
+        ['that', 'the'].
+
+        Precondition: letters and center are strings that are either empty or
+        have only letters.  min_size is an int >= 0.
+
+        Enforced Precondition: letters and center are strings.  min_size is an
+        int >= 0."""
+        assert type(center) == str, `center` + ' is not a string'
+        assert type(min_size) == int and min_size >= 0, `min_size` + ' is not a non-negative integer'
+        result = []
+        for mask in self._submasks(letter_mask(letters), letter_mask(center)):
+            for word in self._words[mask]:
+                if len(word) >= min_size:
+                    result.append(word)
+        result.sort()
+        return result
+
+    def pangrams(self, letters):
+        """Returns the sorted list of words that use every one of letters, and no
+        other letter.
+
+        This is a single lookup.
+
+        Precondition: letters is a string that is either empty or has only letters.
+
+        Enforced Precondition: letters is a string."""
+        mask = letter_mask(letters)
+        if mask in self._words:
+            return self._words[mask][:]
+        return []
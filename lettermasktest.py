@@ -0,0 +1,60 @@
+# lettermasktest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module lettermask"""
+import cornelltest
+import a4
+import lettermask
+
+
+# Test Procedures
+
+def test_masks():
+    """Test functions letter_mask and mask_letters"""
+    print 'Testing letter masks'
+    cornelltest.assert_equals(0, lettermask.letter_mask(''))
+    cornelltest.assert_equals(1, lettermask.letter_mask('a'))
+    cornelltest.assert_equals(1 << 25, lettermask.letter_mask('z'))
+    cornelltest.assert_equals(1 << 26, lettermask.letter_mask('A'))
+    cornelltest.assert_equals(lettermask.letter_mask('et'), lettermask.letter_mask('tee'))
+    cornelltest.assert_equals('et', lettermask.mask_letters(lettermask.letter_mask('tee')))
+    cornelltest.assert_equals('', lettermask.mask_letters(0))
+
+
+def test_spelling_bee():
+    """Test the LetterSetIndex constructor and method spelling_bee"""
+    print 'Testing LetterSetIndex.spelling_bee'
+    index = lettermask.LetterSetIndex(['tee', 'et', 'tee', 'the', 'a', 'teeth'])
+    cornelltest.assert_equals(5, len(index))
+    cornelltest.assert_equals(3, index.mask_count())
+    cornelltest.assert_equals(['et', 'tee'], index.spelling_bee('te'))
+    cornelltest.assert_equals(['et', 'tee', 'teeth', 'the'], index.spelling_bee('teh', 't'))
+    cornelltest.assert_equals(['teeth', 'the'], index.spelling_bee('teh', 'h'))
+    cornelltest.assert_equals(['tee', 'teeth', 'the'], index.spelling_bee('teh', 't', 3))
+    cornelltest.assert_equals([], index.spelling_bee('te', 'h'))
+    cornelltest.assert_equals([], index.spelling_bee(''))
+    cornelltest.assert_equals(['teeth', 'the'], index.pangrams('het'))
+    cornelltest.assert_equals([], index.pangrams('xyz'))
+
+    index = lettermask.LetterSetIndex(a4.build_word_list('short.txt'))
+    cornelltest.assert_equals(['that', 'the'], index.spelling_bee('aeht', 't'))
+
+
+def test_large():
+    """Test that both ways of finding masks agree with a direct check"""
+    print 'Testing LetterSetIndex on common.txt'
+    words = a4.build_word_list('common.txt')
+    index = lettermask.LetterSetIndex(words)
+    for letters, center in [('aetrins', 'r'), ('abcdefghijklmnopqrstu', 'e'),
+                            ('ol', ''), ('qz', 'q')]:
+        expected = sorted(set([word for word in words
+                               if set(word) <= set(letters) and set(center) <= set(word)]))
+        cornelltest.assert_equals(expected, index.spelling_bee(letters, center))
+
+
+# Application Code
+if __name__ == "__main__":
+    test_masks()
+    test_spelling_bee()
+    test_large()
+    print "Module lettermask is working correctly"
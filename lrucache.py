@@ -0,0 +1,408 @@
+# lrucache.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Bounded caches with least-recently-used eviction
+
+LRUCache is a general cache of bounded size.  When it is full, adding an entry
+evicts the entry that was used least recently.  It counts its hits, misses and
+evictions, so that callers can tell how well it is working.
+
+AutocompleteCache uses an LRUCache to remember the results of autocomplete.  It
+registers with a4.pmap_add_listener, so that changing a prefix map with
+pmap_add_word or pmap_remove_word forgets only the results for the prefixes of
+the changed word.  Changes made in any other way are not seen; call invalidate
+after them.
+
+ScrabbleMemo uses an LRUCache to remember the results of scrabble searches with
+blanks.  It forgets everything about a prefix map when the map changes.
+"""
+import weakref
+from collections import OrderedDict
+
+import a4
+
+
+class LRUCache(object):
+    """Instances are bounded caches that evict the least recently used entry.
+
+    Instance Attributes:
+        maxsize:       the most entries this cache holds [int > 0]
+        hits:          the number of lookups that found an entry [int >= 0]
+        misses:        the number of lookups that did not [int >= 0]
+        evictions:     the number of entries evicted to make room [int >= 0]
+        invalidations: the number of entries removed by discard [int >= 0]
+    """
+
+    def __init__(self, maxsize, removed=None):
+        """**Constructor**: Create a new, empty cache holding up to maxsize entries.
+
+        If removed is not None, it is called with the key of every entry that
+        leaves the cache, whether it is evicted, discarded or cleared.
+
+        Precondition: maxsize is an int > 0.  removed is None or a function of
+        one key.
+
+        Enforced Precondition: maxsize is an int > 0."""
+        assert type(maxsize) == int and maxsize > 0, `maxsize` + ' is not a positive int'
+        self.maxsize = maxsize
+        self._removed = removed
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        """Returns the number of entries in this cache."""
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Returns True if key has an entry.  This does not count as a use."""
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Returns the value for key, or default if key has no entry.
+
+        Finding key makes it the most recently used entry, and counts as a hit.
+        Otherwise this counts as a miss.
+
+        Precondition: key is hashable."""
+        if key in self._entries:
+            value = self._entries.pop(key)
+            self._entries[key] = value
+            self.hits = self.hits + 1
+            return value
+        self.misses = self.misses + 1
+        return default
+
+    def put(self, key, value):
+        """Stores value for key, as the most recently used entry.
+
+        If the cache is full, this evicts the least recently used entry.
+
+        Precondition: key is hashable."""
+        if key in self._entries:
+            del self._entries[key]
+        elif len(self._entries) >= self.maxsize:
+            old = self._entries.popitem(False)[0]
+            self.evictions = self.evictions + 1
+            if self._removed is not None:
+                self._removed(old)
+        self._entries[key] = value
+
+    def discard(self, key):
+        """Removes the entry for key, if there is one.
+
+        Precondition: key is hashable."""
+        if key in self._entries:
+            del self._entries[key]
+            self.invalidations = self.invalidations + 1
+            if self._removed is not None:
+                self._removed(key)
+
+    def discard_all(self, test):
+        """Removes every entry whose key satisfies test.
+
+        This looks at every entry, so it is much slower than discard.
+
+        Precondition: test is a function from a key to a bool."""
+        for key in [key for key in self._entries if test(key)]:
+            self.discard(key)
+
+    def clear(self):
+        """Removes every entry.  The counters are not reset."""
+        keys = self._entries.keys()
+        self._entries.clear()
+        if self._removed is not None:
+            for key in keys:
+                self._removed(key)
+
+    def hit_rate(self):
+        """Returns the fraction of lookups that were hits (0.0 if there were none)."""
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return float(self.hits) / lookups
+
+    def stats(self):
+        """Returns a dict of the counters of this cache, with its size and hit rate."""
+        return {'size': len(self._entries), 'maxsize': self.maxsize,
+                'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hit_rate(), 'evictions': self.evictions,
+                'invalidations': self.invalidations}
+
+
+def _removal_listener(cache):
+    """Returns a function that tells cache when an entry leaves its LRUCache.
+
+    The function holds only a weak reference to cache, so that cache and its
+    LRUCache do not keep each other alive.
+
+    Precondition: cache is a PmapCache."""
+    owner = weakref.ref(cache)
+
+    def removed(key):
+        live = owner()
+        if live is not None:
+            live._removed(key)
+
+    return removed
+
+
+def _reference(pmap, cache, version):
+    """Returns a function of no arguments that returns pmap while it is alive.
+
+    This is a weak reference to pmap, which calls cache._forget when pmap is
+    freed.  The reference to cache is weak too, so that the two do not keep each
+    other alive.  A plain dict cannot be weakly referenced, so for a dict this
+    returns a function that keeps pmap alive.
+
+    Precondition: pmap is a prefix map.  cache is a PmapCache.  version is the
+    version of pmap in cache."""
+    key = id(pmap)
+    owner = weakref.ref(cache)
+
+    def freed(ref):
+        live = owner()
+        if live is not None:
+            live._forget(key, version)
+
+    try:
+        return weakref.ref(pmap, freed)
+    except TypeError:
+        return lambda: pmap
+
+
+class PmapCache(object):
+    """Instances are caches of search results for one or more prefix maps.
+
+    An entry is keyed by a tuple that starts with a version, which stands for one
+    prefix map.  A map gets a version the first time it is used with the cache,
+    and a new one when invalidate is called on it, so that its old entries can
+    never be returned again.
+
+    The cache only keeps a weak reference to each map, so it does not keep maps
+    alive.  When a map is freed, its version and its entries are dropped, and a
+    new map that reuses its id() gets a new version.  Plain dict prefix maps
+    cannot be weakly referenced, so the cache keeps a dict alive only while some
+    entry for it is still in the cache.
+
+    This class only manages the versions.  Subclasses add the searches, storing
+    their results with put, and the method pmap_changed that a4 calls when a map
+    changes.
+
+    Instance Attributes:
+        cache: the entries [LRUCache]
+    """
+
+    def __init__(self, maxsize):
+        """**Constructor**: Create a new, empty cache holding up to maxsize entries.
+
+        Precondition: maxsize is an int > 0."""
+        self.cache = LRUCache(maxsize, _removal_listener(self))
+        self._versions = {}    # id(pmap) -> (reference to pmap, version)
+        self._sizes = {}       # version -> number of its entries in cache
+        self._held = {}        # version -> id(pmap), for the dicts kept alive
+        self._next = 0
+
+    def version(self, pmap):
+        """Returns the version of pmap in this cache, giving it one if it has none.
+
+        Precondition: pmap is a prefix map."""
+        version = self._find_version(pmap)
+        if version is None:
+            # Dicts that were given a version but never got an entry
+            for old in self._held.keys():
+                if not old in self._sizes:
+                    self._release(old)
+            version = self._next
+            self._next = self._next + 1
+            reference = _reference(pmap, self, version)
+            self._versions[id(pmap)] = (reference, version)
+            if not isinstance(reference, weakref.ref):
+                self._held[version] = id(pmap)
+        return version
+
+    def put(self, key, value):
+        """Stores value for key in the cache, counting the entries of each version.
+
+        Precondition: key is a tuple whose first item is a version of this cache."""
+        if not key in self.cache:
+            self._sizes[key[0]] = self._sizes.get(key[0], 0) + 1
+        self.cache.put(key, value)
+
+    def _removed(self, key):
+        """Counts the entry for key as gone from the cache.
+
+        A dict map is released once the cache has no entry for it left.
+
+        Precondition: key is the key of an entry that was just removed."""
+        version = key[0]
+        if self._sizes.get(version, 0) > 1:
+            self._sizes[version] = self._sizes[version] - 1
+        else:
+            self._sizes.pop(version, None)
+            if version in self._held:
+                self._release(version)
+
+    def _release(self, version):
+        """Drops version, which belongs to a dict map that the cache keeps alive.
+
+        Precondition: version is a key of _held."""
+        key = self._held.pop(version)
+        entry = self._versions.get(key)
+        if entry is not None and entry[1] == version:
+            del self._versions[key]
+
+    def _find_version(self, pmap):
+        """Returns the version of pmap in this cache, or None if it has none.
+
+        Precondition: pmap is a prefix map."""
+        entry = self._versions.get(id(pmap))
+        if entry is None or entry[0]() is not pmap:
+            return None
+        return entry[1]
+
+    def invalidate(self, pmap):
+        """Forgets every entry for pmap.
+
+        Use this after changing pmap without pmap_add_word or pmap_remove_word.
+
+        Precondition: pmap is a prefix map."""
+        version = self._find_version(pmap)
+        if version is not None:
+            del self._versions[id(pmap)]
+            self._held.pop(version, None)
+            self.cache.discard_all(lambda key: key[0] == version)
+
+    def _forget(self, key, version):
+        """Drops version, and every entry for it, after its map was freed.
+
+        Precondition: key is the id() that the map had.  version is an int."""
+        entry = self._versions.get(key)
+        if entry is not None and entry[1] == version:
+            del self._versions[key]
+        self.cache.discard_all(lambda entry_key: entry_key[0] == version)
+
+    def stats(self):
+        """Returns a dict of the counters of the cache (see LRUCache.stats)."""
+        return self.cache.stats()
+
+
+class AutocompleteCache(PmapCache):
+    """Instances remember the results of autocomplete, for one or more prefix maps.
+
+    An entry is keyed by (version, prefix, limit), where version stands for one
+    prefix map (see PmapCache).
+
+    Instance Attributes:
+        cache: the entries [LRUCache]
+    """
+
+    def __init__(self, maxsize=1000):
+        """**Constructor**: Create a new, empty cache holding up to maxsize results.
+
+        Precondition: maxsize is an int > 0."""
+        PmapCache.__init__(self, maxsize)
+        self._limits = set()   # every limit used, to find the entries of a prefix
+        a4.pmap_add_listener(self)
+
+    def autocomplete(self, prefix, pmap, limit=None):
+        """Returns the list of words that complete prefix in pmap, using the cache.
+
+        If limit is not None, the list has at most limit words, as in
+        a4.autocomplete_iter.  The list returned belongs to the cache, so it must
+        not be changed.
+
+        Precondition: prefix is a string that is either empty or has only letters.
+        pmap is a prefix map.  limit is None or an int >= 0."""
+        key = (self.version(pmap), prefix, limit)
+        result = self.cache.get(key)
+        if result is None:
+            if limit is None:
+                result = a4.autocomplete(prefix, pmap)
+            else:
+                result = list(a4.autocomplete_iter(prefix, pmap, limit))
+            self._limits.add(limit)
+            self.put(key, result)
+        return result
+
+    def pmap_changed(self, pmap, word):
+        """Forgets the results for pmap that adding or removing word could change.
+
+        These are the results for every prefix of word (including word itself and
+        the empty prefix).  This is called by a4.pmap_add_word and
+        a4.pmap_remove_word.
+
+        Precondition: pmap is a prefix map.  word is a string."""
+        version = self._find_version(pmap)
+        if version is None:
+            return
+        for pos in range(len(word) + 1):
+            prefix = word[:pos]
+            for limit in self._limits:
+                self.cache.discard((version, prefix, limit))
+
+
+class ScrabbleMemo(PmapCache):
+    """Instances remember the results of scrabble searches, for one or more
+    prefix maps.
+
+    An entry is keyed by (version, tiles, size), where tiles is the sorted
+    string of the rack, and holds the pairs (word, blanks) found for it.  Racks
+    with the same tiles in any order share an entry.
+
+    Only whole queries are stored.  The subproblems inside one search (the words
+    below a node that use the tiles left) almost never repeat, as the search
+    already tries each distinct letter only once, and different racks seldom
+    reach a node with the same tiles left.  Storing them made a stream of new
+    queries slower, while storing the result costs one entry per query.
+
+    Any change to a prefix map with pmap_add_word or pmap_remove_word forgets all
+    of its entries, as it can change the result for any rack.
+
+    Instance Attributes:
+        cache: the entries [LRUCache]
+    """
+
+    def __init__(self, maxsize=1000):
+        """**Constructor**: Create a new, empty memo holding up to maxsize results.
+
+        Precondition: maxsize is an int > 0."""
+        PmapCache.__init__(self, maxsize)
+        a4.pmap_add_listener(self)
+
+    def scrabble(self, rack, size, pmap):
+        """Returns the list of words that you can form from rack using exactly size
+        letters, as in a4.scrabble, using the memo.
+
+        Precondition: rack is a string of letters and blanks, which may be empty.
+        size is an int >= 0.  pmap is a prefix map."""
+        return [word for word, blanks in self.scrabble_blanks(rack, size, pmap)]
+
+    def scrabble_blanks(self, rack, size, pmap):
+        """Returns the list of pairs (word, blanks) for the words that you can form
+        from rack using exactly size letters, as in a4.scrabble_blanks, using the
+        memo.
+
+        Precondition: rack is a string of letters and blanks, which may be empty.
+        size is an int >= 0.  pmap is a prefix map.
+
+        Enforced Precondition: rack is a string of letters and blanks.  size is an
+        int >= 0."""
+        assert a4.is_rack(rack), `rack` + ' is not a string of letters and blanks'
+        assert type(size) == int and size >= 0, `size` + ' is not a non-negative integer'
+        key = (self.version(pmap), ''.join(sorted(rack)), size)
+        result = self.cache.get(key)
+        if result is None:
+            result = tuple(a4.scrabble_blanks(rack, size, pmap))
+            self.put(key, result)
+        return list(result)
+
+    def pmap_changed(self, pmap, word):
+        """Forgets every result for pmap.
+
+        This is called by a4.pmap_add_word and a4.pmap_remove_word.
+
+        Precondition: pmap is a prefix map.  word is a string."""
+        self.invalidate(pmap)
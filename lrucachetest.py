@@ -0,0 +1,209 @@
+# lrucachetest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module lrucache"""
+import sys
+import weakref
+import cornelltest
+import a4
+import dawg
+import lrucache
+import trie
+from a4test import assert_lists_equal
+
+
+# Test Procedures
+
+def test_lru_cache():
+    """Test class LRUCache"""
+    print 'Testing LRUCache'
+    cache = lrucache.LRUCache(2)
+    cornelltest.assert_equals(0, len(cache))
+    cornelltest.assert_equals(None, cache.get('a'))
+    cornelltest.assert_equals(1, cache.misses)
+
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cornelltest.assert_equals(1, cache.get('a'))
+    cornelltest.assert_equals(1, cache.hits)
+
+    # b is now the least recently used
+    cache.put('c', 3)
+    cornelltest.assert_equals(2, len(cache))
+    cornelltest.assert_equals(1, cache.evictions)
+    cornelltest.assert_false('b' in cache)
+    cornelltest.assert_true('a' in cache)
+    cornelltest.assert_equals(3, cache.get('c'))
+
+    # Replacing an entry does not evict
+    cache.put('a', 4)
+    cornelltest.assert_equals(1, cache.evictions)
+    cornelltest.assert_equals(4, cache.get('a'))
+
+    cache.discard('a')
+    cache.discard('z')
+    cornelltest.assert_equals(1, cache.invalidations)
+    cornelltest.assert_equals(1, len(cache))
+
+    stats = cache.stats()
+    cornelltest.assert_equals(3, stats['hits'])
+    cornelltest.assert_equals(1, stats['misses'])
+    cornelltest.assert_floats_equal(0.75, stats['hit_rate'])
+
+    cache.clear()
+    cornelltest.assert_equals(0, len(cache))
+
+
+def test_autocomplete_cache():
+    """Test class AutocompleteCache"""
+    print 'Testing AutocompleteCache'
+    cache = lrucache.AutocompleteCache(100)
+    pmap = a4.word_list_to_pmap(a4.build_word_list('short.txt'))
+    other = trie.Trie(['thin', 'this'])
+
+    cornelltest.assert_equals(['that', 'the'], cache.autocomplete('th', pmap))
+    cornelltest.assert_equals(['that', 'the'], cache.autocomplete('th', pmap))
+    cornelltest.assert_equals(['that'], cache.autocomplete('th', pmap, 1))
+    cornelltest.assert_equals(['thin', 'this'], cache.autocomplete('th', other))
+    cornelltest.assert_equals(1, cache.stats()['hits'])
+    cornelltest.assert_equals(3, cache.stats()['misses'])
+    cornelltest.assert_equals([], cache.autocomplete('x', pmap))
+    cornelltest.assert_equals([], cache.autocomplete('x', pmap))
+    cornelltest.assert_equals(2, cache.stats()['hits'])
+
+    # Adding a word forgets only the prefixes of that word
+    cache.autocomplete('a', pmap)
+    a4.pmap_add_word(pmap, 'thy')
+    cornelltest.assert_false((cache.version(pmap), 'th', None) in cache.cache)
+    cornelltest.assert_false((cache.version(pmap), 'th', 1) in cache.cache)
+    cornelltest.assert_true((cache.version(pmap), 'a', None) in cache.cache)
+    cornelltest.assert_true((cache.version(other), 'th', None) in cache.cache)
+    cornelltest.assert_equals(['that', 'the', 'thy'], cache.autocomplete('th', pmap))
+
+    # Same for removing, and for node-based maps
+    a4.pmap_remove_word(other, 'thin')
+    cornelltest.assert_equals(['this'], cache.autocomplete('th', other))
+    a4.pmap_remove_word(pmap, 'thy')
+    cornelltest.assert_equals(['that', 'the'], cache.autocomplete('th', pmap))
+
+    # Changes made behind the cache's back need invalidate
+    pmap['th'].remove('a')
+    cornelltest.assert_equals(['that', 'the'], cache.autocomplete('th', pmap))
+    cache.invalidate(pmap)
+    cornelltest.assert_equals(['the'], cache.autocomplete('th', pmap))
+
+
+def test_eviction():
+    """Test that an AutocompleteCache stays within its size"""
+    print 'Testing AutocompleteCache eviction'
+    cache = lrucache.AutocompleteCache(3)
+    pmap = trie.Trie(a4.build_word_list('short.txt'))
+    for prefix in ['a', 'b', 't', 'i', 'o', 'h']:
+        cache.autocomplete(prefix, pmap)
+    cornelltest.assert_equals(3, len(cache.cache))
+    cornelltest.assert_equals(3, cache.stats()['evictions'])
+    assert_lists_equal(['have'], cache.autocomplete('h', pmap))
+    cornelltest.assert_equals(1, cache.stats()['hits'])
+
+
+def test_scrabble_memo():
+    """Test class ScrabbleMemo"""
+    print 'Testing ScrabbleMemo'
+    words = a4.build_word_list('common.txt')
+    memo = lrucache.ScrabbleMemo(100000)
+    for pmap in [a4.word_list_to_pmap(words), trie.Trie(words), dawg.Dawg(sorted(words))]:
+        for rack, size in [('retains', 4), ('eeessst', 3), ('ret?', 4), ('s??', 3), ('', 2)]:
+            cornelltest.assert_equals(a4.scrabble_blanks(rack, size, pmap),
+                                      memo.scrabble_blanks(rack, size, pmap))
+            cornelltest.assert_equals(a4.scrabble(rack, size, pmap),
+                                      memo.scrabble(rack, size, pmap))
+    cornelltest.assert_true(memo.stats()['hits'] > 0)
+
+    # Racks with the same tiles share results
+    pmap = trie.Trie(a4.build_word_list('short.txt'))
+    memo = lrucache.ScrabbleMemo(100)
+    cornelltest.assert_equals(['that'], memo.scrabble('thta', 4, pmap))
+    hits = memo.stats()['hits']
+    cornelltest.assert_equals(['that'], memo.scrabble('atht', 4, pmap))
+    cornelltest.assert_equals(hits + 1, memo.stats()['hits'])
+    cornelltest.assert_equals([], memo.scrabble('thta', 0, pmap))
+    # The lists returned can be changed without changing the memo
+    memo.scrabble_blanks('atht', 4, pmap).append(('x', ''))
+    cornelltest.assert_equals([('that', '')], memo.scrabble_blanks('thta', 4, pmap))
+
+    # Changing the map forgets its results
+    a4.pmap_add_word(pmap, 'hat')
+    cornelltest.assert_equals(['hat', 'the'], memo.scrabble('tahe', 3, pmap))
+    a4.pmap_remove_word(pmap, 'hat')
+    cornelltest.assert_equals(['the'], memo.scrabble('tahe', 3, pmap))
+
+
+def test_freed_maps():
+    """Test that caches do not keep prefix maps alive"""
+    print 'Testing PmapCache with freed maps'
+    cache = lrucache.AutocompleteCache(100)
+    pmap = trie.Trie(['thin', 'this'])
+    cache.autocomplete('th', pmap)
+    cache.autocomplete('t', pmap)
+    ref = weakref.ref(pmap)
+    version = cache.version(pmap)
+    other = trie.Trie(['that'])
+    cache.autocomplete('th', other)
+
+    # Freeing a map drops its entries, but not those of other maps
+    del pmap
+    cornelltest.assert_true(ref() is None)
+    cornelltest.assert_equals(1, len(cache.cache))
+    cornelltest.assert_true((cache.version(other), 'th', None) in cache.cache)
+
+    # A new map never gets the version of a freed one
+    for pos in range(10):
+        cornelltest.assert_true(version != cache.version(trie.Trie(['thin'])))
+        cornelltest.assert_equals(['thin'], cache.autocomplete('th', trie.Trie(['thin'])))
+
+    # Dict maps still work, as they are kept alive while they have entries
+    pmap = a4.word_list_to_pmap(['thin'])
+    references = sys.getrefcount(pmap)
+    cornelltest.assert_equals(['thin'], cache.autocomplete('th', pmap))
+    cornelltest.assert_equals(cache.version(pmap), cache.version(pmap))
+    cornelltest.assert_true(sys.getrefcount(pmap) > references)
+    cache.invalidate(pmap)
+    cornelltest.assert_equals(references, sys.getrefcount(pmap))
+
+    # and are let go once their last entry is evicted
+    cache = lrucache.AutocompleteCache(2)
+    cache.autocomplete('th', pmap)
+    cache.autocomplete('t', pmap)
+    cornelltest.assert_true(sys.getrefcount(pmap) > references)
+    other = trie.Trie(['that'])
+    cache.autocomplete('th', other)
+    cornelltest.assert_true(sys.getrefcount(pmap) > references)
+    cache.autocomplete('t', other)
+    cornelltest.assert_equals(references, sys.getrefcount(pmap))
+
+
+def test_invalidate():
+    """Test that invalidate frees the entries of a map"""
+    print 'Testing PmapCache.invalidate'
+    cache = lrucache.AutocompleteCache(100)
+    pmap = trie.Trie(['thin', 'this'])
+    other = trie.Trie(['that'])
+    for prefix in ['t', 'th', 'thi']:
+        cache.autocomplete(prefix, pmap)
+    cache.autocomplete('th', other)
+    cornelltest.assert_equals(4, len(cache.cache))
+    cache.invalidate(pmap)
+    cornelltest.assert_equals(1, len(cache.cache))
+    cornelltest.assert_true((cache.version(other), 'th', None) in cache.cache)
+    cornelltest.assert_equals(['thin', 'this'], cache.autocomplete('th', pmap))
+
+
+# Application Code
+if __name__ == "__main__":
+    test_lru_cache()
+    test_autocomplete_cache()
+    test_eviction()
+    test_freed_maps()
+    test_invalidate()
+    test_scrabble_memo()
+    print "Module lrucache is working correctly"
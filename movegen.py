@@ -0,0 +1,376 @@
+# movegen.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Move generation for Scrabble boards
+
+generate_moves finds every legal move for a rack on a board, with its score,
+using the algorithm of Gordon (1994) on a GADDAG (see the module gaddag).
+
+A move must place a tile on an anchor: an empty square next to a tile already on
+the board (or the center square, if the board is empty).  For each anchor, the
+generator reads the GADDAG from the anchor leftwards (upwards for down moves),
+placing tiles or following the tiles on the board, and then crosses the
+separator and extends to the right.  A tile may only go on a square if the word
+it forms in the other direction (its cross word) is valid.  These cross-checks
+are computed once per square before the search.
+
+Going left, the generator stops at the next anchor, so that each move is found
+only from the leftmost anchor it covers.
+"""
+import a4
+from board import Board, Move, SIZE, CENTER, RACK_SIZE, BINGO_BONUS, letter_score, step
+from gaddag import SEP, follow
+
+
+def _square(across, line, index):
+    """Returns the (row, col) of square index of a line of the board.
+
+    For across moves the lines are the rows, and for down moves the columns.
+
+    Precondition: across is a bool.  line and index are ints."""
+    if across:
+        return (line, index)
+    return (index, line)
+
+
+def cross_check(board, gaddag, row, col, across):
+    """Returns the letters that can go on the empty square (row, col), given the
+    tiles beside it in the other direction, or None if there are no such tiles.
+
+    If the square has tiles on either side in the direction other than across,
+    a letter there forms a cross word with them.  The result is the string of
+    letters whose cross word is in gaddag, in sorted order.
+
+    Precondition: board is a Board.  gaddag is a Gaddag (or a loaded compiled
+    Gaddag).  row and col are ints in 0..SIZE-1, and (row, col) is empty.
+    across is the direction of the move being made [bool]."""
+    before = []
+    square = step(row, col, not across, -1)
+    while board.tile(*square) is not None:
+        before.append(board.tile(*square))
+        square = step(square[0], square[1], not across, -1)
+    after = []
+    square = step(row, col, not across, 1)
+    while board.tile(*square) is not None:
+        after.append(board.tile(*square))
+        square = step(square[0], square[1], not across, 1)
+    if not before and not after:
+        return None
+
+    # The cross word x+before+after is stored as x, before reversed, SEP, after
+    path = ''.join(before) + SEP + ''.join(after)
+    letters = []
+    for letter, child in gaddag.children(gaddag.root):
+        if letter != SEP:
+            node = follow(gaddag, child, path)
+            if node is not None and gaddag.is_word(node):
+                letters.append(letter)
+    return ''.join(letters)
+
+
+def cross_points(board, row, col, across):
+    """Returns the points of the tiles beside the empty square (row, col) in the
+    direction other than across, or None if there are no such tiles.
+
+    These are the points that the cross word of a tile placed there scores
+    before its premiums, not counting the tile itself.
+
+    Precondition: board is a Board.  row and col are ints in 0..SIZE-1, and
+    (row, col) is empty.  across is a bool."""
+    total = 0
+    found = False
+    for direction in [-1, 1]:
+        square = step(row, col, not across, direction)
+        while board.tile(*square) is not None:
+            total = total + board.tile_score(*square)
+            found = True
+            square = step(square[0], square[1], not across, direction)
+    if not found:
+        return None
+    return total
+
+
+def anchors(board):
+    """Returns the sorted list of the anchor squares of board.
+
+    These are the empty squares next to a tile, or just the center square if the
+    board is empty.
+
+    Precondition: board is a Board."""
+    if board.is_empty():
+        return [CENTER]
+    result = []
+    for row in range(SIZE):
+        for col in range(SIZE):
+            if board.tile(row, col) is None and board.has_neighbor(row, col):
+                result.append((row, col))
+    return result
+
+
+def generate_moves(board, rack, gaddag):
+    """Returns the list of every legal move for rack on board, best score first.
+
+    Moves with equal scores are listed by word, then square, then direction.
+    A move that places a single tile forming words in both directions is listed
+    once, as an across move.  Blanks ('?') in rack may stand for any letter.  A
+    move uses as few blanks as it can, and puts them on the squares where a tile
+    would score least, so each move is listed once, with its best score.
+
+    Example: On an empty board, with the Gaddag for ['cat', 'at'], the moves for
+    the rack 'tac' are the ten ways to put 'at' or 'cat' across or down through
+    the center square.  Each 'cat' scores 10, and each 'at' scores 4.
+
+    Precondition: board is a Board.  rack is a string of letters and blanks.
+    gaddag is a Gaddag (or a loaded compiled Gaddag).
+
+    Enforced Precondition: board is a Board.  rack is a string of letters and
+    blanks."""
+    assert isinstance(board, Board), `board` + ' is not a Board'
+    assert a4.is_rack(rack), `rack` + ' is not a string of letters and blanks'
+    moves = []
+    if rack == '':
+        return moves
+    squares = anchors(board)
+    for across in [True, False]:
+        search = _MoveSearch(board, gaddag, rack, across, moves)
+        for row, col in squares:
+            if across:
+                search.run(row, col)
+            else:
+                search.run(col, row)
+    moves.sort(key=lambda move: (-move.score, move.word, move.row, move.col, not move.across))
+    return moves
+
+
+class _MoveSearch(object):
+    """Instances search one direction of a board for moves.
+
+    Instance Attributes:
+        board:  the board searched [Board]
+        gaddag: the GADDAG of the valid words [Gaddag]
+        across: the direction of the moves [bool]
+        moves:  the list that moves are added to [list of Move]
+    """
+
+    def __init__(self, board, gaddag, rack, across, moves):
+        """**Constructor**: Prepare to search board for moves with rack.
+
+        This computes the cross-checks of every empty square for the direction,
+        and what is needed to score a move without looking at the board again.
+
+        Precondition: board is a Board.  gaddag is a Gaddag.  rack is a string of
+        letters and blanks.  across is a bool.  moves is a list."""
+        self.board = board
+        self.gaddag = gaddag
+        self.across = across
+        self.moves = moves
+        self._counts = a4.rack_counts(rack)
+        self._letters = a4._rack_letters(self._counts)
+        self._anchors = set(anchors(board))
+
+        # For each square of each line: its tile, its cross-check, the points of
+        # its tile, its premium multipliers, and the points of its cross word
+        self._tiles = []
+        self._cross = []
+        self._points = []
+        self._letter_mult = []
+        self._word_mult = []
+        self._cross_points = []
+        for line in range(SIZE):
+            tiles = []
+            cross = []
+            points = []
+            letter_mult = []
+            word_mult = []
+            cross_sums = []
+            for index in range(SIZE):
+                row, col = _square(across, line, index)
+                tiles.append(board.tile(row, col))
+                points.append(board.tile_score(row, col))
+                multipliers = board.multipliers(row, col)
+                letter_mult.append(multipliers[0])
+                word_mult.append(multipliers[1])
+                if tiles[-1] is None:
+                    cross.append(cross_check(board, gaddag, row, col, across))
+                    cross_sums.append(cross_points(board, row, col, across))
+                else:
+                    cross.append(None)
+                    cross_sums.append(None)
+            self._tiles.append(tiles)
+            self._cross.append(cross)
+            self._points.append(points)
+            self._letter_mult.append(letter_mult)
+            self._word_mult.append(word_mult)
+            self._cross_points.append(cross_sums)
+
+    def run(self, line, anchor):
+        """Adds every move in line whose leftmost new tile on an anchor is at anchor.
+
+        Precondition: line and anchor are ints in 0..SIZE-1, and square anchor of
+        line is an anchor."""
+        self._line = line
+        self._anchor = anchor
+        tiles = self._tiles[line]
+        self._right_open = anchor + 1 == SIZE or tiles[anchor + 1] is None
+        self._gen(anchor, '', self.gaddag.root, [], True)
+
+    def _gen(self, pos, word, node, placed, left):
+        """Extends word with square pos of the line: its tile, or each rack tile
+        that can go there.
+
+        Precondition: pos is an int in 0..SIZE-1.  word is the part of the move
+        found so far, and node its GADDAG node.  placed is the list of new tiles
+        as (index, letter, blank).  left is True while going left of the anchor."""
+        letter = self._tiles[self._line][pos]
+        if letter is not None:
+            child = self.gaddag.child(node, letter)
+            if child is not None:
+                self._go_on(pos, letter, word, child, placed, left)
+            return
+
+        counts = self._counts
+        allowed = self._cross[self._line][pos]
+        blanks = counts.get(a4.BLANK, 0)
+        if blanks == 0:
+            # Without blanks, only the letters on the rack can be placed
+            for letter in self._letters:
+                if counts[letter] > 0 and (allowed is None or letter in allowed):
+                    child = self.gaddag.child(node, letter)
+                    if child is not None:
+                        counts[letter] = counts[letter] - 1
+                        placed.append((pos, letter, False))
+                        self._go_on(pos, letter, word, child, placed, left)
+                        placed.pop()
+                        counts[letter] = counts[letter] + 1
+            return
+
+        for letter, child in self.gaddag.children(node):
+            if letter == SEP or (allowed is not None and not letter in allowed):
+                continue
+            # Which squares get the blanks is settled by _record, so a letter
+            # is only tried once: as a tile if there is one left, or as a blank
+            if counts.get(letter, 0) > 0:
+                counts[letter] = counts[letter] - 1
+                placed.append((pos, letter, False))
+                self._go_on(pos, letter, word, child, placed, left)
+                placed.pop()
+                counts[letter] = counts[letter] + 1
+            elif blanks > 0:
+                counts[a4.BLANK] = blanks - 1
+                placed.append((pos, letter, True))
+                self._go_on(pos, letter, word, child, placed, left)
+                placed.pop()
+                counts[a4.BLANK] = blanks
+
+    def _go_on(self, pos, letter, word, node, placed, left):
+        """Adds letter at square pos to the move, records the move if it is
+        complete, and keeps extending it.
+
+        Precondition: as in _gen, where node is the GADDAG node after letter."""
+        tiles = self._tiles[self._line]
+        if left:
+            word = letter + word
+            left_open = pos == 0 or tiles[pos - 1] is None
+            after = self.gaddag.child(node, SEP)
+            if left_open and self._right_open and after is not None and self.gaddag.is_word(after):
+                self._record(pos, word, placed)
+            if pos > 0 and (tiles[pos - 1] is not None or
+                            not _square(self.across, self._line, pos - 1) in self._anchors):
+                self._gen(pos - 1, word, node, placed, True)
+            if after is not None and left_open and self._anchor + 1 < SIZE:
+                self._gen(self._anchor + 1, word, after, placed, False)
+        else:
+            word = word + letter
+            if (pos + 1 == SIZE or tiles[pos + 1] is None) and self.gaddag.is_word(node):
+                self._record(pos - len(word) + 1, word, placed)
+            if pos + 1 < SIZE:
+                self._gen(pos + 1, word, node, placed, False)
+
+    def _record(self, start, word, placed):
+        """Adds the move that puts the tiles placed to make word, starting at
+        square start of the line.
+
+        Precondition: start is an int in 0..SIZE-1.  word is a valid word.
+        placed is the list of new tiles as (index, letter, blank)."""
+        if len(word) < 2:
+            return
+        if not self.across and len(placed) == 1:
+            # A single tile with a word across is found by the across search
+            row, col = _square(self.across, self._line, placed[0][0])
+            if self.board.tile(row, col - 1) is not None or self.board.tile(row, col + 1) is not None:
+                return
+        for index, letter, blank in placed:
+            if blank:
+                placed = self._place_blanks(placed)
+                break
+        tiles = []
+        for index, letter, blank in sorted(placed):
+            row, col = _square(self.across, self._line, index)
+            tiles.append((row, col, letter, blank))
+        row, col = _square(self.across, self._line, start)
+        self.moves.append(Move(word, row, col, self.across, tiles,
+                               self._score(start, word, placed)))
+
+    def _score(self, start, word, placed):
+        """Returns the score of putting the tiles placed to make word, starting at
+        square start of the line.
+
+        This is Board.score, using the multipliers and cross word points that
+        the constructor stored for the line.
+
+        Precondition: as in _record."""
+        line = self._line
+        letter_mult = self._letter_mult[line]
+        word_mult = self._word_mult[line]
+        cross_points = self._cross_points[line]
+        main = sum(self._points[line][start:start + len(word)])
+        multiplier = 1
+        cross = 0
+        for index, letter, blank in placed:
+            if blank:
+                value = 0
+            else:
+                value = letter_score(letter) * letter_mult[index]
+            main = main + value
+            multiplier = multiplier * word_mult[index]
+            if cross_points[index] is not None:
+                cross = cross + (cross_points[index] + value) * word_mult[index]
+        total = main * multiplier + cross
+        if len(placed) == RACK_SIZE:
+            total = total + BINGO_BONUS
+        return total
+
+    def _place_blanks(self, placed):
+        """Returns placed with the blanks moved to where they cost the fewest points.
+
+        The search uses a blank for a letter only when the rack has no tile of
+        that letter left, but that blank could go on any of the new squares with
+        that letter.  A tile adds the same points to a score whether or not the
+        others are blanks: its letter score, times its letter multiplier, times
+        the word multipliers of the words it is in.  So the blanks for a letter
+        go on the squares where those multipliers are smallest.
+
+        Precondition: placed is the list of new tiles as (index, letter, blank),
+        with at least one blank."""
+        line = self._line
+        need = {}
+        multiplier = 1
+        for index, letter, blank in placed:
+            if blank:
+                need[letter] = need.get(letter, 0) + 1
+            multiplier = multiplier * self._word_mult[line][index]
+        costs = []
+        for pos in range(len(placed)):
+            index, letter, blank = placed[pos]
+            if letter in need:
+                words = multiplier
+                if self._cross_points[line][index] is not None:
+                    words = words + self._word_mult[line][index]
+                costs.append((self._letter_mult[line][index] * words, pos))
+        result = [(index, letter, False) for index, letter, blank in placed]
+        for cost, pos in sorted(costs):
+            index, letter, blank = result[pos]
+            if need[letter] > 0:
+                need[letter] = need[letter] - 1
+                result[pos] = (index, letter, True)
+        return result
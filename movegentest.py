@@ -0,0 +1,217 @@
+# movegentest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module movegen"""
+import itertools
+import cornelltest
+import a4
+import board
+import gaddag
+import movegen
+
+
+# A board with a few words on it
+BOARD = ['...............',
+         '...............',
+         '...............',
+         '...............',
+         '...............',
+         '.....h.........',
+         '.....a.........',
+         '...theme.......',
+         '.......a.......',
+         '.......not.....',
+         '...............',
+         '...............',
+         '...............',
+         '...............',
+         '...............']
+
+
+def brute_force_moves(grid, rack, words):
+    """Returns the dict from (word, row, col, across) to score of every legal move
+    for rack on grid, found by trying every word at every square.
+
+    Blanks ('?') in rack may stand for any letter.  The score of a move is the
+    best over every choice of which new tiles are blanks.
+
+    This is slow, but simple enough to check generate_moves against.
+
+    Precondition: grid is a Board.  rack is a string of letters and blanks.
+    words is a list of strings with only letters."""
+    valid = set(words)
+    counts = a4.rack_counts(rack)
+    blanks = counts.get(a4.BLANK, 0)
+    result = {}
+    for across in [True, False]:
+        for line in range(board.SIZE):
+            for start in range(board.SIZE):
+                row, col = movegen._square(across, line, start)
+                for word in valid:
+                    if len(word) < 2 or start + len(word) > board.SIZE:
+                        continue
+                    if (grid.tile(*board.step(row, col, across, -1)) is not None or
+                        grid.tile(*board.step(row, col, across, len(word))) is not None):
+                        continue
+
+                    # The word must agree with the board and use some tiles
+                    tiles = []
+                    fits = True
+                    for pos in range(len(word)):
+                        square = board.step(row, col, across, pos)
+                        letter = grid.tile(*square)
+                        if letter is None:
+                            tiles.append((square[0], square[1], word[pos], False))
+                        elif letter != word[pos]:
+                            fits = False
+                    if not fits or not tiles:
+                        continue
+                    need = a4.rack_counts(''.join([tile[2] for tile in tiles]))
+                    if sum([max(0, need[x] - counts.get(x, 0)) for x in need]) > blanks:
+                        continue
+
+                    # The move must connect, and make valid cross words
+                    if grid.is_empty():
+                        fits = board.CENTER in [(tile[0], tile[1]) for tile in tiles]
+                    else:
+                        fits = [tile for tile in tiles if grid.has_neighbor(tile[0], tile[1])] != []
+                    placed = dict([((tile[0], tile[1]), tile[2]) for tile in tiles])
+                    for tile in tiles:
+                        cross = grid.word_at(tile[0], tile[1], not across, placed)[2]
+                        if len(cross) > 1 and not cross in valid:
+                            fits = False
+                    if not fits:
+                        continue
+                    if (not across and len(tiles) == 1 and
+                        len(grid.word_at(tiles[0][0], tiles[0][1], True, placed)[2]) > 1):
+                        continue
+                    result[(word, row, col, across)] = best_blank_score(grid, tiles, across, rack)
+    return result
+
+
+def best_blank_score(grid, tiles, across, rack):
+    """Returns the best score of placing tiles from rack, over every choice of
+    which of them are blanks.
+
+    Precondition: grid is a Board.  tiles is a list of new tiles as in Move
+    (with blank False) that rack can pay for.  across is a bool.  rack is a
+    string of letters and blanks."""
+    counts = a4.rack_counts(rack)
+    best = None
+    for chosen in itertools.product([False, True], repeat=len(tiles)):
+        placed = [(tiles[pos][0], tiles[pos][1], tiles[pos][2], chosen[pos])
+                  for pos in range(len(tiles))]
+        real = a4.rack_counts(''.join([tile[2] for tile in placed if not tile[3]]))
+        if (list(chosen).count(True) <= counts.get(a4.BLANK, 0) and
+            not [x for x in real if real[x] > counts.get(x, 0)]):
+            score = grid.score(placed, across)
+            if best is None or score > best:
+                best = score
+    return best
+
+
+# Test Procedures
+
+def test_cross_check():
+    """Test functions cross_check and anchors"""
+    print 'Testing cross_check'
+    graph = gaddag.Gaddag(['at', 'an', 'cat', 'can', 'ta', 'hat'])
+    grid = board.Board(['.' * 15] * 7 + ['.....cat.......'] + ['.' * 15] * 7)
+    cornelltest.assert_equals(None, movegen.cross_check(grid, graph, 7, 8, True))
+    cornelltest.assert_equals(None, movegen.cross_check(grid, graph, 6, 4, True))
+    # Below the a of cat: 'at' and 'an' read down
+    cornelltest.assert_equals('nt', movegen.cross_check(grid, graph, 8, 6, True))
+    # Above the t of cat: 'at' reads down
+    cornelltest.assert_equals('a', movegen.cross_check(grid, graph, 6, 7, True))
+    # Left of cat: nothing makes a word across
+    cornelltest.assert_equals('', movegen.cross_check(grid, graph, 7, 4, False))
+
+    cornelltest.assert_equals([board.CENTER], movegen.anchors(board.Board()))
+    cornelltest.assert_equals(8, len(movegen.anchors(grid)))
+
+
+def test_first_move():
+    """Test generate_moves on an empty board"""
+    print 'Testing generate_moves on an empty board'
+    graph = gaddag.Gaddag(['cat', 'at'])
+    moves = movegen.generate_moves(board.Board(), 'tac', graph)
+    cornelltest.assert_equals(10, len(moves))
+    cornelltest.assert_equals(('cat', 5, 7, False), moves[0].key())
+    cornelltest.assert_equals(10, moves[0].score)
+    cornelltest.assert_equals([], movegen.generate_moves(board.Board(), '', graph))
+    cornelltest.assert_equals([], movegen.generate_moves(board.Board(), 'xyz', graph))
+
+    words = a4.build_word_list('common.txt')
+    graph = gaddag.Gaddag(words)
+    expected = brute_force_moves(board.Board(), 'retains', words)
+    found = movegen.generate_moves(board.Board(), 'retains', graph)
+    cornelltest.assert_equals(expected, dict([(move.key(), move.score) for move in found]))
+
+
+def test_board_moves():
+    """Test generate_moves against a brute-force search"""
+    print 'Testing generate_moves on a board'
+    words = a4.build_word_list('common.txt') + ['theme', 'ham', 'not', 'hat', 'met']
+    graph = gaddag.Gaddag(words)
+    grid = board.Board(BOARD)
+    for rack in ['retains', 'aeiou', 'sstt', 'e']:
+        expected = brute_force_moves(grid, rack, words)
+        found = movegen.generate_moves(grid, rack, graph)
+        cornelltest.assert_equals(len(expected), len(found))
+        cornelltest.assert_equals(expected, dict([(move.key(), move.score) for move in found]))
+        scores = [move.score for move in found]
+        cornelltest.assert_equals(sorted(scores, reverse=True), scores)
+        for move in found:
+            cornelltest.assert_equals(grid.score(move.tiles, move.across), move.score)
+
+    # Playing a move keeps the board legal
+    best = movegen.generate_moves(grid, 'retains', graph)[0]
+    grid.place(best)
+    cornelltest.assert_equals(11 + len(best.tiles), grid.tile_count)
+
+
+def test_blanks():
+    """Test generate_moves with blanks on the rack"""
+    print 'Testing generate_moves with blanks'
+    words = a4.build_word_list('common.txt')
+    graph = gaddag.Gaddag(words)
+    grid = board.Board(BOARD)
+
+    # A blank finds at least the moves of every letter it could be
+    found = movegen.generate_moves(grid, 'ta?', graph)
+    keys = set([move.key() for move in found])
+    for letter in 'abcdefghijklmnopqrstuvwxyz':
+        for move in movegen.generate_moves(grid, 'ta' + letter, graph):
+            cornelltest.assert_true(move.key() in keys)
+
+    # A blank may stand for a letter on the rack, to free a premium square
+    graph = gaddag.Gaddag(['aaaaa', 'qat'])
+    found = movegen.generate_moves(board.Board(), 'aaaa?', graph)
+    cornelltest.assert_equals(10, found[0].score)
+    cornelltest.assert_equals(brute_force_moves(board.Board(), 'aaaa?', ['aaaaa', 'qat']),
+                              dict([(move.key(), move.score) for move in found]))
+    move = [move for move in found if move.key() == ('aaaaa', 7, 3, True)][0]
+    cornelltest.assert_equals(10, move.score)
+    cornelltest.assert_false((7, 3, 'a', True) in move.tiles)
+
+    # Each move is listed once, with the best score of any placement of blanks
+    words = a4.build_word_list('common.txt') + ['theme', 'ham', 'not', 'hat', 'met']
+    graph = gaddag.Gaddag(words)
+    for rack in ['ta?', 'rest?', 'e??']:
+        expected = brute_force_moves(grid, rack, words)
+        found = movegen.generate_moves(grid, rack, graph)
+        cornelltest.assert_equals(len(expected), len(found))
+        cornelltest.assert_equals(expected, dict([(move.key(), move.score) for move in found]))
+        cornelltest.assert_equals(max(expected.values()), found[0].score)
+        for move in found:
+            cornelltest.assert_true(len(move.blanks()) <= rack.count('?'))
+            cornelltest.assert_equals(grid.score(move.tiles, move.across), move.score)
+
+
+# Application Code
+if __name__ == "__main__":
+    test_cross_check()
+    test_first_move()
+    test_board_moves()
+    test_blanks()
+    print "Module movegen is working correctly"
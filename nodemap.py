@@ -0,0 +1,161 @@
+# nodemap.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Base class for prefix maps stored as a graph of nodes
+
+The dict prefix map of a4 stores one key per prefix.  The other prefix maps in
+this package (compiled files, array tries) store a graph of nodes instead, where
+each node stands for a prefix and each edge is labelled with a letter.  A subclass
+only has to say how to follow edges and whether a node ends a word; this class
+turns that into the dict-like interface that a4 searches with.
+
+A node is whatever value the subclass uses to name it (usually an int).  The
+root node, for the prefix '', is the attribute root.
+"""
+
+
+# The shortest completion length of a node that completes no word
+NO_LENGTH = 0xFFFF
+
+
+class NodeMap(object):
+    """Instances are prefix maps made of nodes.
+
+    This is an abstract class.  Subclasses must set the attribute root and
+    implement the methods child, children and is_word.  Subclasses should also
+    implement __len__ (the number of nodes, counting the root).  A subclass that
+    does not store its nodes (like sortedwords.SortedWords) still returns the
+    number of nodes it would have, which is the number of distinct prefixes of
+    its words.  A subclass that stores the
+    completion lengths of its nodes, so that lengths takes constant time, should
+    set stores_lengths to True; the searches in a4 then use them for pruning.
+
+    Instance Attributes:
+        root:           the node for the empty prefix [a node]
+        stores_lengths: whether lengths takes constant time [bool]
+    """
+    root = 0
+    stores_lengths = False
+
+    # Methods for Subclasses
+    def child(self, node, letter):
+        """Returns the node reached from node by letter, or None if there is none.
+
+        Precondition: node is a node of this map.  letter is a single character."""
+        raise NotImplementedError('child is not implemented')
+
+    def children(self, node):
+        """Returns the list of (letter, node) pairs leaving node, sorted by letter.
+
+        Precondition: node is a node of this map."""
+        raise NotImplementedError('children is not implemented')
+
+    def is_word(self, node):
+        """Returns True if node ends a word.
+
+        Precondition: node is a node of this map."""
+        raise NotImplementedError('is_word is not implemented')
+
+    # Queries
+    def lengths(self, node):
+        """Returns the pair (shortest, longest) of the lengths of the completions
+        of node.
+
+        A completion is the part of a word after the prefix of node, so it is 0 if
+        node ends a word.  If no word passes through node, shortest is greater than
+        longest.  This version searches below node; subclasses store the lengths
+        so that this takes constant time.
+
+        Precondition: node is a node of this map."""
+        shortest = NO_LENGTH
+        longest = 0
+        stack = [(node, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if self.is_word(node):
+                shortest = min(shortest, depth)
+                longest = max(longest, depth)
+            for letter, child in self.children(node):
+                stack.append((child, depth + 1))
+        return (shortest, longest)
+
+    def count(self, node):
+        """Returns the number of words that pass through (or end at) node.
+
+        This version searches below node; subclasses store the counts so that
+        this takes constant time.
+
+        Precondition: node is a node of this map."""
+        total = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if self.is_word(node):
+                total = total + 1
+            for letter, child in self.children(node):
+                stack.append(child)
+        return total
+
+    def find(self, prefix):
+        """Returns the node for prefix, or None if no word starts with prefix.
+
+        Precondition: prefix is a string."""
+        node = self.root
+        for letter in prefix:
+            node = self.child(node, letter)
+            if node is None:
+                return None
+        return node
+
+    def has_word(self, word):
+        """Returns True if word is in this map.
+
+        Precondition: word is a string."""
+        node = self.find(word)
+        return word != '' and node is not None and self.is_word(node)
+
+    def words(self, prefix=''):
+        """Returns the list of words in this map that start with prefix, sorted.
+
+        Precondition: prefix is a string."""
+        node = self.find(prefix)
+        if node is None:
+            return []
+        result = []
+        stack = [(prefix, node)]
+        while stack:
+            word, node = stack.pop()
+            if self.is_word(node):
+                result.append(word)
+            nodes = self.children(node)
+            for pos in range(len(nodes) - 1, -1, -1):
+                stack.append((word + nodes[pos][0], nodes[pos][1]))
+        return result
+
+    # Prefix Map Interface
+    def __contains__(self, prefix):
+        """Returns True if some word in this map starts with prefix."""
+        return type(prefix) == str and self.find(prefix) is not None
+
+    def __getitem__(self, prefix):
+        """Returns the list of next letters for prefix, as in a dict prefix map.
+
+        If prefix is a word, the list starts with ''."""
+        node = self.find(prefix)
+        if node is None:
+            raise KeyError(prefix)
+        result = [letter for letter, child in self.children(node)]
+        if self.is_word(node):
+            result.insert(0, '')
+        return result
+
+    def __iter__(self):
+        """Yields every prefix in this map, in breadth first order."""
+        queue = [('', self.root)]
+        pos = 0
+        while pos < len(queue):
+            prefix, node = queue[pos]
+            yield prefix
+            for letter, child in self.children(node):
+                queue.append((prefix + letter, child))
+            pos = pos + 1
@@ -0,0 +1,814 @@
+# pattern.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Patterns and regular expressions for searching a prefix map
+
+A template for a4.match only has letters and '?'.  A Pattern also understands
+
+    [aeiou]   any one of the letters in the brackets
+    [^s]      any one letter not in the brackets
+    *         any number of letters, including none
+    x{3}      a run of exactly 3 of x, where x is a letter, '?' or a class
+    x{2,4}    a run of 2 to 4 of x
+    x{2,}     a run of 2 or more of x
+
+so '*[^s]ing' is the words that end in 'ing' but not in 'sing', and
+'?{3}[aeiou]{2}*' is the words whose fourth and fifth letters are vowels.
+
+A Regex is a regular expression in the usual syntax (see the class for what is
+supported), matched against whole words.
+
+A pattern or expression is compiled once into an Automaton: a nondeterministic
+automaton over letters.  The search in match_pattern walks the prefix map and
+the automaton together.  The automaton is run as a deterministic one, whose
+states are sets of its own states, built as they are first reached.  A branch of
+the map is left as soon as the automaton has no state for it, or (when the map
+stores completion lengths) as soon as no completion has a length the automaton
+can still accept.
+"""
+import a4
+
+
+# The length of an unbounded match, such as the rest of a '*'
+UNBOUNDED = float('inf')
+
+
+def charset_has(charset, letter):
+    """Returns True if letter is in charset.
+
+    A charset is None for any letter, or a pair (letters, negated), where letters
+    is a frozenset.  If negated is False, the charset is the letters in letters.
+    Otherwise it is every letter not in letters.
+
+    Precondition: charset is a charset.  letter is a single character."""
+    if charset is None:
+        return True
+    return (letter in charset[0]) != charset[1]
+
+
+class Automaton(object):
+    """Instances are nondeterministic automata over letters.
+
+    The states are numbered from 0.  A state has edges, each labeled with a
+    charset (see charset_has), and epsilon edges, which are followed without
+    reading a letter.  A word is accepted if some path from start to final reads
+    its letters.
+
+    The methods initial, step and is_final run the automaton as a deterministic
+    one.  Its states are frozensets of states closed under epsilon edges, and
+    step remembers every transition it computes.
+
+    Instance Attributes:
+        start: the start state [int]
+        final: the accepting state [int]
+    """
+
+    def __init__(self):
+        """**Constructor**: Create an automaton with just a start and a final state.
+
+        It accepts nothing until edges are added."""
+        self._edges = []
+        self._epsilons = []
+        self.start = self.add_state()
+        self.final = self.add_state()
+
+    def __len__(self):
+        """Returns the number of states of this automaton."""
+        return len(self._edges)
+
+    def add_state(self):
+        """Returns a new state, with no edges."""
+        self._edges.append([])
+        self._epsilons.append([])
+        self._forget()
+        return len(self._edges) - 1
+
+    def add_edge(self, source, charset, target):
+        """Adds an edge from source to target that reads a letter in charset.
+
+        Precondition: source and target are states.  charset is a charset."""
+        self._edges[source].append((charset, target))
+        self._forget()
+
+    def add_epsilon(self, source, target):
+        """Adds an edge from source to target that reads no letter.
+
+        Precondition: source and target are states."""
+        self._epsilons[source].append(target)
+        self._forget()
+
+    def _forget(self):
+        """Forgets the transitions and bounds computed so far."""
+        self._steps = {}
+        self._letters = {}
+        self._all = {}
+        self._bounds = None
+
+    def reverse(self):
+        """Returns the automaton that accepts the words of this one spelled
+        backwards.
+
+        Every edge is turned around, and the start and final states swap."""
+        result = Automaton()
+        result._edges = [[] for state in self._edges]
+        result._epsilons = [[] for state in self._epsilons]
+        for source in range(len(self._edges)):
+            for charset, target in self._edges[source]:
+                result._edges[target].append((charset, source))
+            for target in self._epsilons[source]:
+                result._epsilons[target].append(source)
+        result.start = self.final
+        result.final = self.start
+        return result
+
+    # Running
+    def _closure(self, states):
+        """Returns the frozenset of the states reached from states by epsilon edges
+        (including states themselves).
+
+        Precondition: states is a collection of states."""
+        result = set(states)
+        stack = list(states)
+        while stack:
+            for target in self._epsilons[stack.pop()]:
+                if not target in result:
+                    result.add(target)
+                    stack.append(target)
+        return frozenset(result)
+
+    def initial(self):
+        """Returns the deterministic state before reading any letter."""
+        return self._closure([self.start])
+
+    def step(self, state, letter):
+        """Returns the deterministic state after reading letter in state, or None
+        if no word can continue with letter.
+
+        Precondition: state is a deterministic state.  letter is a single
+        character."""
+        key = (state, letter)
+        if key in self._steps:
+            return self._steps[key]
+        targets = []
+        for source in state:
+            for charset, target in self._edges[source]:
+                if charset_has(charset, letter):
+                    targets.append(target)
+        result = None
+        if targets:
+            result = self._closure(targets)
+        self._steps[key] = result
+        return result
+
+    def is_final(self, state):
+        """Returns True if state accepts the letters read so far.
+
+        Precondition: state is a deterministic state."""
+        return self.final in state
+
+    def letters(self, state):
+        """Returns the sorted string of the letters that can be read in state, or
+        None if any letter not in some list can be.
+
+        When this is not None, a search only has to try these letters.
+
+        Precondition: state is a deterministic state."""
+        if state in self._letters:
+            return self._letters[state]
+        letters = set()
+        for source in state:
+            for charset, target in self._edges[source]:
+                if charset is None or charset[1]:
+                    self._letters[state] = None
+                    return None
+                letters.update(charset[0])
+        result = ''.join(sorted(letters))
+        self._letters[state] = result
+        return result
+
+    def accepts_all(self, state):
+        """Returns True if state accepts the letters read so far followed by any
+        letters at all, as the expression '.*' does.
+
+        A search can then take every word below its node without stepping the
+        automaton.  Every state reached from state must be final and able to read
+        every letter.  The letters named by the edges are tried one at a time; a
+        character that no edge names stands for all the other letters.
+
+        Precondition: state is a deterministic state."""
+        if state in self._all:
+            return self._all[state]
+        alphabet = set(['\0'])
+        for edges in self._edges:
+            for charset, target in edges:
+                if charset is not None:
+                    alphabet.update(charset[0])
+        seen = set([state])
+        stack = [state]
+        result = True
+        while stack and result:
+            current = stack.pop()
+            if not self.is_final(current) or self.letters(current) is not None:
+                result = False
+            for x in alphabet:
+                if not result:
+                    break
+                after = self.step(current, x)
+                if after is None:
+                    result = False
+                elif not after in seen:
+                    seen.add(after)
+                    stack.append(after)
+        self._all[state] = result
+        return result
+
+    def matches(self, word):
+        """Returns True if this automaton accepts word.
+
+        Precondition: word is a string."""
+        state = self.initial()
+        for letter in word:
+            state = self.step(state, letter)
+            if state is None:
+                return False
+        return self.is_final(state)
+
+    def narrow_prefix(self):
+        """Returns the number of letters at the start of every accepted word that
+        come from a list of letters, rather than being any letter.
+
+        These are the letters that narrow a search of a prefix map right away.
+        The count stops at the first letter that can be any letter (or any but a
+        few), or where an accepted word can end.
+
+        Example: This is 3 for the pattern 'ing*', 2 for the expression
+        '(in|ed).*', and 0 for '*ing'."""
+        states = set([self.initial()])
+        count = 0
+        while count < len(self._edges):
+            after = set()
+            for state in states:
+                letters = self.letters(state)
+                if letters is None or self.is_final(state):
+                    return count
+                for x in letters:
+                    if self.step(state, x) is not None:
+                        after.add(self.step(state, x))
+            if not after:
+                return count
+            states = after
+            count = count + 1
+        return count
+
+    # Lengths
+    def bounds(self, state):
+        """Returns the pair (shortest, longest) of the numbers of letters that can
+        still be read in state and reach the final state.
+
+        longest is UNBOUNDED if there is no limit, and shortest is UNBOUNDED if
+        the final state cannot be reached at all.  longest may be UNBOUNDED even
+        when there is a limit, if the states below state have cycles of epsilon
+        edges, but shortest is exact.
+
+        Precondition: state is a deterministic state."""
+        if self._bounds is None:
+            self._find_bounds()
+        shortest = UNBOUNDED
+        longest = 0
+        for source in state:
+            low, high = self._bounds[source]
+            shortest = min(shortest, low)
+            if low != UNBOUNDED:
+                longest = max(longest, high)
+        return (shortest, longest)
+
+    def _find_bounds(self):
+        """Computes the shortest and longest path from each state to the final one.
+
+        Shortest paths are found backwards from the final state, taking epsilon
+        edges first, as they cost no letters.  Longest paths are found by a
+        depth-first search; any cycle on the way counts as unbounded."""
+        size = len(self._edges)
+        into = [[] for state in range(size)]
+        for source in range(size):
+            for charset, target in self._edges[source]:
+                into[target].append((source, 1))
+            for target in self._epsilons[source]:
+                into[target].append((source, 0))
+        shortest = [UNBOUNDED] * size
+        shortest[self.final] = 0
+        queue = [self.final]
+        while queue:
+            # Few states: a simple scan for the nearest state is fast enough
+            queue.sort(key=lambda state: shortest[state])
+            state = queue.pop(0)
+            for source, cost in into[state]:
+                if shortest[state] + cost < shortest[source]:
+                    shortest[source] = shortest[state] + cost
+                    queue.append(source)
+
+        longest = [None] * size
+        self._bounds = []
+        for state in range(size):
+            if shortest[state] == UNBOUNDED:
+                self._bounds.append((UNBOUNDED, 0))
+            else:
+                self._bounds.append((shortest[state],
+                                     self._longest(state, shortest, longest, set())))
+
+    def _longest(self, state, shortest, longest, active):
+        """Returns the longest path from state to the final state, as in bounds.
+
+        Precondition: state is a state that can reach the final state.  shortest
+        is the list of the shortest paths of the states.  longest is the list of
+        the longest paths found so far, with None for the rest.  active is the
+        set of states on the current path."""
+        if state in active:
+            return UNBOUNDED
+        if longest[state] is not None:
+            return longest[state]
+        active.add(state)
+        best = 0
+        for charset, target in self._edges[state]:
+            if shortest[target] != UNBOUNDED:
+                best = max(best, 1 + self._longest(target, shortest, longest, active))
+        for target in self._epsilons[state]:
+            if shortest[target] != UNBOUNDED:
+                best = max(best, self._longest(target, shortest, longest, active))
+        active.remove(state)
+        longest[state] = best
+        return best
+
+
+class Pattern(Automaton):
+    """Instances are compiled patterns, in the syntax described in this module.
+
+    Instance Attributes:
+        text: the pattern that was compiled [str]
+    """
+
+    def __init__(self, text):
+        """**Constructor**: Compile the pattern text.
+
+        Each item of the pattern becomes a chain of states: one edge for each
+        letter it must read, one optional edge (with an epsilon edge beside it)
+        for each letter it may read, and a state with a loop for an unbounded
+        run.
+
+        Precondition: text is a pattern.
+
+        Enforced Precondition: text is a string, in the pattern syntax."""
+        assert type(text) == str, `text` + ' is not a string'
+        Automaton.__init__(self)
+        self.text = text
+        state = self.start
+        for charset, low, high in _parse(text):
+            for x in range(low):
+                target = self.add_state()
+                self.add_edge(state, charset, target)
+                state = target
+            if high == UNBOUNDED:
+                target = self.add_state()
+                self.add_epsilon(state, target)
+                self.add_edge(target, charset, target)
+                state = target
+            else:
+                for x in range(high - low):
+                    target = self.add_state()
+                    self.add_edge(state, charset, target)
+                    self.add_epsilon(state, target)
+                    state = target
+        self.add_epsilon(state, self.final)
+
+    def __repr__(self):
+        """Returns the call that compiles this pattern, such as "Pattern('[^s]*ing')"."""
+        return 'Pattern(' + `self.text` + ')'
+
+
+def _parse(text):
+    """Returns the list of the items of the pattern text, as triples
+    (charset, low, high).
+
+    Each item reads between low and high letters in charset.  high is UNBOUNDED
+    for a '*' or a run like 'a{2,}'.
+
+    Example: _parse('[^s]?{2}') returns [((frozenset(['s']), True), 1, 1),
+    (None, 2, 2)].
+
+    Precondition: text is a string.
+
+    Enforced Precondition: text is in the pattern syntax."""
+    items = []
+    pos = 0
+    while pos < len(text):
+        x = text[pos]
+        if x == '*':
+            items.append((None, 0, UNBOUNDED))
+            pos = pos + 1
+            continue
+        if x == '?':
+            charset = None
+            pos = pos + 1
+        elif x == '[':
+            end = text.find(']', pos)
+            assert end != -1, `text` + ' has a [ with no ]'
+            letters = text[pos+1:end]
+            negated = letters.startswith('^')
+            if negated:
+                letters = letters[1:]
+            assert letters.isalpha(), `text[pos:end+1]` + ' is not a class of letters'
+            charset = (frozenset(letters), negated)
+            pos = end + 1
+        else:
+            assert x.isalpha(), `x` + ' is not a letter, ?, *, or ['
+            charset = (frozenset(x), False)
+            pos = pos + 1
+
+        low = 1
+        high = 1
+        if pos < len(text) and text[pos] == '{':
+            end = text.find('}', pos)
+            assert end != -1, `text` + ' has a { with no }'
+            counts = text[pos+1:end].split(',')
+            assert len(counts) <= 2 and counts[0].isdigit(), `text[pos:end+1]` + ' is not a run'
+            low = int(counts[0])
+            high = low
+            if len(counts) == 2 and counts[1] == '':
+                high = UNBOUNDED
+            elif len(counts) == 2:
+                assert counts[1].isdigit() and int(counts[1]) >= low, `text[pos:end+1]` + ' is not a run'
+                high = int(counts[1])
+            pos = end + 1
+        items.append((charset, low, high))
+    return items
+
+
+class Regex(Automaton):
+    """Instances are compiled regular expressions, matched against whole words.
+
+    The syntax is the usual one, for the parts that make sense for single words:
+    letters, '.', classes such as [a-e] and [^aeiou], groups with ( ) or (?: ),
+    alternation with |, and the repeats *, +, ?, {n}, {n,} and {n,m}.  A '?'
+    after a repeat (a lazy repeat) is allowed, but makes no difference.  \\w is
+    any letter, and a backslash before any other character that is not a letter
+    or digit stands for that character.  A word matches if the expression
+    matches all of it, so a '^' at the start and a '$' at the end are allowed
+    but do nothing.  Other features of the module re, such as backreferences,
+    are not supported.
+
+    The automaton is built by Thompson's construction: each part of the
+    expression becomes a piece with one entry and one exit state, and the pieces
+    are joined by epsilon edges.
+
+    Instance Attributes:
+        text: the expression that was compiled [str]
+    """
+
+    def __init__(self, text):
+        """**Constructor**: Compile the regular expression text.
+
+        Precondition: text is a regular expression in the syntax above.
+
+        Enforced Precondition: text is a string, in the syntax above."""
+        assert type(text) == str, `text` + ' is not a string'
+        Automaton.__init__(self)
+        self.text = text
+        self._text = text
+        if self._text.startswith('^'):
+            self._text = self._text[1:]
+        if self._text.endswith('$') and not self._text.endswith('\\$'):
+            self._text = self._text[:-1]
+        self._pos = 0
+        entry, exit = self._alternation()
+        assert self._pos == len(self._text), `text` + ' has an unmatched )'
+        self.add_epsilon(self.start, entry)
+        self.add_epsilon(exit, self.final)
+
+    def __repr__(self):
+        """Returns the call that compiles this expression, such as "Regex('(un)?do')"."""
+        return 'Regex(' + `self.text` + ')'
+
+    # Parsing; each method returns the pair (entry, exit) of the piece it builds
+    def _peek(self):
+        """Returns the next character of the expression, or '' at its end."""
+        return self._text[self._pos:self._pos+1]
+
+    def _alternation(self):
+        """Parses sequences separated by '|'."""
+        entry, exit = self._sequence()
+        if self._peek() != '|':
+            return (entry, exit)
+        start = self.add_state()
+        end = self.add_state()
+        self.add_epsilon(start, entry)
+        self.add_epsilon(exit, end)
+        while self._peek() == '|':
+            self._pos = self._pos + 1
+            entry, exit = self._sequence()
+            self.add_epsilon(start, entry)
+            self.add_epsilon(exit, end)
+        return (start, end)
+
+    def _sequence(self):
+        """Parses repeats up to a '|', a ')', or the end."""
+        entry = self.add_state()
+        exit = entry
+        while not self._peek() in ['', '|', ')']:
+            first, last = self._repeat()
+            self.add_epsilon(exit, first)
+            exit = last
+        return (entry, exit)
+
+    def _repeat(self):
+        """Parses an atom and any repeats after it.
+
+        A repeat that needs several copies of the atom parses it again."""
+        begin = self._pos
+        entry, exit = self._atom()
+        while self._peek() in ['*', '+', '?', '{']:
+            x = self._peek()
+            self._pos = self._pos + 1
+            if x == '*':
+                entry, exit = self._optional(self._loop(entry, exit))
+            elif x == '+':
+                entry, exit = self._loop(entry, exit)
+            elif x == '?':
+                entry, exit = self._optional((entry, exit))
+            else:
+                low, high = self._counts()
+                entry, exit = self._copies(begin, (entry, exit), low, high)
+            if self._peek() == '?':
+                self._pos = self._pos + 1
+            begin = None
+        return (entry, exit)
+
+    def _loop(self, entry, exit):
+        """Returns the piece for one or more of the piece (entry, exit)."""
+        self.add_epsilon(exit, entry)
+        return (entry, exit)
+
+    def _optional(self, piece):
+        """Returns the piece for zero or one of piece."""
+        entry, exit = piece
+        start = self.add_state()
+        self.add_epsilon(start, entry)
+        self.add_epsilon(start, exit)
+        return (start, exit)
+
+    def _counts(self):
+        """Parses the rest of a repeat {n}, {n,} or {n,m}, and returns (low, high)."""
+        end = self._text.find('}', self._pos)
+        assert end != -1, `self.text` + ' has a { with no }'
+        counts = self._text[self._pos:end].split(',')
+        assert len(counts) <= 2 and counts[0].isdigit(), `self.text` + ' has a bad repeat'
+        low = int(counts[0])
+        high = low
+        if len(counts) == 2 and counts[1] == '':
+            high = UNBOUNDED
+        elif len(counts) == 2:
+            assert counts[1].isdigit() and int(counts[1]) >= low, `self.text` + ' has a bad repeat'
+            high = int(counts[1])
+        self._pos = end + 1
+        return (low, high)
+
+    def _copies(self, begin, piece, low, high):
+        """Returns the piece for low to high copies of piece, the atom starting at
+        position begin of the expression.
+
+        The first copy is piece itself, and the others are parsed again from
+        begin.  A repeat of a repeat, like a*{2}, is not supported.
+
+        Precondition: low is an int >= 0, and high is an int >= low or UNBOUNDED."""
+        assert begin is not None, `self.text` + ' repeats a repeat'
+        if high == 0:
+            empty = self.add_state()
+            return (empty, empty)
+        after = self._pos
+        copies = [piece]
+        count = max(low, 1)
+        if high != UNBOUNDED:
+            count = high
+        while len(copies) < count:
+            self._pos = begin
+            copies.append(self._atom())
+        self._pos = after
+
+        if high == UNBOUNDED:
+            copies[-1] = self._loop(*copies[-1])
+        if low == 0:
+            copies = [self._optional(copy) for copy in copies]
+        else:
+            copies = copies[:low] + [self._optional(copy) for copy in copies[low:]]
+        entry, exit = copies[0]
+        for first, last in copies[1:]:
+            self.add_epsilon(exit, first)
+            exit = last
+        return (entry, exit)
+
+    def _atom(self):
+        """Parses a letter, '.', class, escape, or group."""
+        x = self._peek()
+        assert x != '', `self.text` + ' ends too soon'
+        self._pos = self._pos + 1
+        if x == '(':
+            if self._text.startswith('?:', self._pos):
+                self._pos = self._pos + 2
+            assert self._peek() != '?', `self.text` + ' has an unsupported group'
+            piece = self._alternation()
+            assert self._peek() == ')', `self.text` + ' has an unmatched ('
+            self._pos = self._pos + 1
+            return piece
+        assert not x in '*+?{)|', `self.text` + ' has nothing to repeat before ' + `x`
+        if x == '.':
+            charset = None
+        elif x == '[':
+            charset = self._class()
+        elif x == '\\':
+            x = self._peek()
+            self._pos = self._pos + 1
+            if x == 'w':
+                charset = None
+            else:
+                assert x != '' and not x.isalnum(), `self.text` + ' has an unsupported escape'
+                charset = (frozenset(x), False)
+        else:
+            charset = (frozenset(x), False)
+        entry = self.add_state()
+        exit = self.add_state()
+        self.add_edge(entry, charset, exit)
+        return (entry, exit)
+
+    def _class(self):
+        """Parses the rest of a class after its '[', and returns its charset.
+
+        A ']' right after the '[' (or '[^') is a letter of the class, and a '-'
+        between two characters is a range."""
+        negated = self._peek() == '^'
+        if negated:
+            self._pos = self._pos + 1
+        end = self._text.find(']', self._pos + 1)
+        assert end != -1, `self.text` + ' has a [ with no ]'
+        body = self._text[self._pos:end]
+        self._pos = end + 1
+        letters = set()
+        pos = 0
+        while pos < len(body):
+            if pos + 2 < len(body) and body[pos+1] == '-':
+                for code in range(ord(body[pos]), ord(body[pos+2]) + 1):
+                    letters.add(chr(code))
+                pos = pos + 3
+            else:
+                letters.add(body[pos])
+                pos = pos + 1
+        return (frozenset(letters), negated)
+
+
+def match_pattern(pattern, pmap, rpmap=None, limit=None):
+    """Returns the sorted list of the words of pmap that pattern accepts.
+
+    pattern is an Automaton (usually a Pattern or Regex), or a string to compile
+    as a Pattern.  If rpmap is not None, it is the prefix map of the reversed
+    words (see a4.reverse_word_list), and the search runs backwards when the
+    pattern starts with fewer narrow letters than it ends with (see
+    Automaton.narrow_prefix).
+
+    If limit is not None, the search gives up and returns None as soon as it
+    would visit more than limit nodes of the map, counting one for each word
+    that it takes below a node at once (see _search).  When the map stores the
+    number of words below each node, a search that must spend more than limit
+    is given up before it starts (see min_visits).
+
+    Example: If pmap is the prefix map created from 'short.txt', then
+    match_pattern('[^t]?', pmap) returns ['be', 'in', 'it', 'of'].
+
+    Precondition: pattern is an Automaton or a pattern.  pmap is a prefix map.
+    rpmap is None or the prefix map for the reversed words of pmap.  limit is
+    None or an int >= 0.
+
+    Enforced Precondition: pmap is a prefix map."""
+    assert a4.is_pmap(pmap), `pmap` + ' is not a prefix map'
+    if not isinstance(pattern, Automaton):
+        pattern = Pattern(pattern)
+    if rpmap is not None:
+        backwards = pattern.reverse()
+        if backwards.narrow_prefix() > pattern.narrow_prefix():
+            result = match_pattern(backwards, rpmap, None, limit)
+            if result is None:
+                return None
+            return a4.reverse_word_list(result)
+
+    nodes = a4.pmap_nodes(pmap)
+    node = nodes.find('')
+    result = []
+    if node is None:
+        return result
+    budget = None
+    if limit is not None:
+        if min_visits(pattern, pmap) > limit:
+            return None
+        budget = [limit]
+    _search(pattern, nodes, node, '', pattern.initial(),
+            getattr(nodes, 'stores_lengths', False), result, budget)
+    if budget is not None and budget[0] < 0:
+        return None
+    return result
+
+
+def min_visits(automaton, pmap):
+    """Returns a lower bound on the budget that match_pattern spends to search
+    pmap with automaton.
+
+    The automaton narrows the first narrow_prefix() letters, so the search only
+    reaches the prefixes of that length that it can read.  If the automaton
+    accepts any letters at all after such a prefix (see Automaton.accepts_all),
+    the search takes every word below it, at a cost of one for each word.  The
+    bound is the number of words below those prefixes, plus one for each node
+    above them.  Any other prefix counts for nothing, as the automaton may prune
+    most of the words below it.
+
+    This only looks at the few nodes above the narrowed prefixes.  A dict prefix
+    map does not store its counts, so for a dict the bound is 0.
+
+    Example: If pmap is the prefix map created from 'short.txt', then
+    min_visits(Regex('th.*'), pmap) returns 4 (2 words and the nodes for '' and
+    't'), and min_visits(Regex('th[^e]*'), pmap) returns 0.
+
+    Precondition: automaton is an Automaton.  pmap is a prefix map."""
+    if type(pmap) == dict:
+        return 0
+    depth = automaton.narrow_prefix()
+    level = [('', pmap.find(''), automaton.initial())]
+    for pos in range(depth):
+        below = []
+        for prefix, node, state in level:
+            for x in automaton.letters(state):
+                child = pmap.child(node, x)
+                after = automaton.step(state, x)
+                if child is not None and after is not None:
+                    below.append((prefix + x, child, after))
+        level = below
+    above = set()
+    total = 0
+    for prefix, node, state in level:
+        if automaton.accepts_all(state):
+            total = total + pmap.count(node)
+            for pos in range(len(prefix)):
+                above.add(prefix[:pos])
+    return total + len(above)
+
+
+def _search(automaton, nodes, node, prefix, state, lengths, result, budget=None):
+    """Appends to result every word below node that automaton accepts, reading
+    on from state.
+
+    Like a4._match_search, this walks the nodes of the prefix map.  A child is
+    only followed if the automaton can read its letter.  If lengths is True, the
+    map stores completion lengths, and a node is skipped when none of its
+    completions is as long as the automaton can still read.
+
+    Once the automaton accepts any letters at all (see Automaton.accepts_all),
+    every word below node is taken at once with the words method of the map,
+    when it has one.
+
+    If budget is not None, it is a list holding the number of nodes that may
+    still be visited.  Each visit takes one from it, and taking every word below
+    a node takes one for each word.  Once it is below 0 the search stops
+    (leaving result incomplete).
+
+    Precondition: automaton is an Automaton.  nodes is a prefix map as returned
+    by a4.pmap_nodes, and node is its node for prefix.  state is the
+    deterministic state of automaton after prefix.  lengths is a bool.  result
+    is a list.  budget is None or a list of one int."""
+    if (automaton.letters(state) is None and hasattr(nodes, 'words')
+            and automaton.accepts_all(state)):
+        if budget is not None:
+            budget[0] = budget[0] - nodes.count(node)
+            if budget[0] < 0:
+                return
+        result.extend(nodes.words(prefix))
+        return
+    if budget is not None:
+        budget[0] = budget[0] - 1
+        if budget[0] < 0:
+            return
+    if automaton.is_final(state) and nodes.is_word(node):
+        result.append(prefix)
+    shortest, longest = automaton.bounds(state)
+    if longest == 0:
+        return
+    if lengths:
+        low, high = nodes.lengths(node)
+        if high < max(shortest, 1) or low > longest:
+            return
+    letters = automaton.letters(state)
+    if letters is None:
+        for x, child in nodes.children(node):
+            after = automaton.step(state, x)
+            if after is not None:
+                _search(automaton, nodes, child, prefix + x, after, lengths, result, budget)
+    else:
+        for x in letters:
+            child = nodes.child(node, x)
+            if child is not None:
+                _search(automaton, nodes, child, prefix + x,
+                        automaton.step(state, x), lengths, result, budget)
@@ -0,0 +1,187 @@
+# patterntest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module pattern"""
+import re
+
+import cornelltest
+import a4
+import dawg
+import pattern
+import trie
+
+
+# Test Procedures
+
+def test_parse():
+    """Test function _parse"""
+    print 'Testing pattern parsing'
+    cornelltest.assert_equals([((frozenset('s'), True), 1, 1), (None, 2, 2)],
+                              pattern._parse('[^s]?{2}'))
+    cornelltest.assert_equals([(None, 0, pattern.UNBOUNDED), ((frozenset('a'), False), 1, 1)],
+                              pattern._parse('*a'))
+    cornelltest.assert_equals([((frozenset('ae'), False), 2, pattern.UNBOUNDED)],
+                              pattern._parse('[ae]{2,}'))
+    cornelltest.assert_equals([((frozenset('x'), False), 0, 3)], pattern._parse('x{0,3}'))
+    cornelltest.assert_equals([], pattern._parse(''))
+
+
+def test_matches():
+    """Test the Pattern constructor and method matches"""
+    print 'Testing Pattern.matches'
+    cases = [('a?e', ['ate', 'axe'], ['at', 'ates', 'bte']),
+             ('[aeiou]?', ['at', 'in'], ['ta', 'a']),
+             ('*[^s]ing', ['ring', 'bring', 'wing'], ['sing', 'ing', 'rings']),
+             ('*', ['', 'a', 'strength'], []),
+             ('?{3}', ['the', 'and'], ['at', 'that']),
+             ('t?{1,2}', ['to', 'the'], ['t', 'that']),
+             ('[ae]{2,}', ['ae', 'eaea'], ['a', 'abe']),
+             ('*a*b*', ['ab', 'xaybz'], ['ba', 'a'])]
+    for text, good, bad in cases:
+        compiled = pattern.Pattern(text)
+        for word in good:
+            cornelltest.assert_true(compiled.matches(word))
+            cornelltest.assert_true(compiled.reverse().matches(word[::-1]))
+        for word in bad:
+            cornelltest.assert_false(compiled.matches(word))
+            cornelltest.assert_false(compiled.reverse().matches(word[::-1]))
+    cornelltest.assert_equals("Pattern('a?e')", `pattern.Pattern('a?e')`)
+
+
+def test_bounds():
+    """Test methods bounds and narrow_prefix"""
+    print 'Testing Automaton.bounds and narrow_prefix'
+    compiled = pattern.Pattern('ab?{1,3}')
+    cornelltest.assert_equals((3, 5), compiled.bounds(compiled.initial()))
+    state = compiled.step(compiled.initial(), 'a')
+    cornelltest.assert_equals((2, 4), compiled.bounds(state))
+    cornelltest.assert_equals(None, compiled.step(compiled.initial(), 'b'))
+    compiled = pattern.Pattern('a*')
+    cornelltest.assert_equals((1, pattern.UNBOUNDED), compiled.bounds(compiled.initial()))
+    cornelltest.assert_equals(2, pattern.Pattern('ab?{1,3}').narrow_prefix())
+    cornelltest.assert_equals(3, pattern.Pattern('ing*').narrow_prefix())
+    cornelltest.assert_equals(0, pattern.Pattern('*ing').narrow_prefix())
+    cornelltest.assert_equals(3, pattern.Pattern('*ing').reverse().narrow_prefix())
+    cornelltest.assert_equals(2, pattern.Pattern('[aeiou]b?').narrow_prefix())
+    cornelltest.assert_equals(0, pattern.Pattern('[^s]ing').narrow_prefix())
+
+
+def test_match_pattern():
+    """Test function match_pattern"""
+    print 'Testing function match_pattern'
+    pmap = a4.word_list_to_pmap(a4.build_word_list('short.txt'))
+    cornelltest.assert_equals(['be', 'in', 'it', 'of'], pattern.match_pattern('[^t]?', pmap))
+    cornelltest.assert_equals(['that', 'the'], pattern.match_pattern('th*', pmap))
+    cornelltest.assert_equals(['a', 'be', 'have', 'the', 'to'],
+                              pattern.match_pattern('*[aeiou]', pmap))
+    cornelltest.assert_equals(['a', 'and', 'have'], pattern.match_pattern('[ah]*', pmap))
+    cornelltest.assert_equals([], pattern.match_pattern('x*', pmap))
+
+    # The same words as a filter, on every kind of map, either way round
+    words = a4.build_word_list('common.txt')
+    maps = [a4.word_list_to_pmap(words), trie.Trie(words), dawg.Dawg(sorted(words))]
+    rpmap = trie.Trie(a4.reverse_word_list(words))
+    for text in ['?', 't??', '*[^s]ing', '[^s]*ing', '*tion', '[aeiou]{3}*',
+                 '?{2}[^aeiou]{3}*', 's*s', 'th[aeiou]?{1,2}', '*', 'q[^u]*']:
+        compiled = pattern.Pattern(text)
+        expected = sorted([word for word in set(words) if compiled.matches(word)])
+        for pmap in maps:
+            cornelltest.assert_equals(expected, pattern.match_pattern(compiled, pmap))
+        cornelltest.assert_equals(expected, pattern.match_pattern(compiled, maps[1], rpmap))
+    cornelltest.assert_equals(a4.match('??e??', maps[1]), pattern.match_pattern('??e??', maps[1]))
+
+    # A search that would visit more than limit nodes gives up
+    expected = pattern.match_pattern('th*', maps[1])
+    for pmap in maps:
+        cornelltest.assert_equals(expected, pattern.match_pattern('th*', pmap, None, 1000))
+        cornelltest.assert_equals(None, pattern.match_pattern('th*', pmap, None, 5))
+        cornelltest.assert_equals(None, pattern.match_pattern('*', pmap, None, 50))
+    cornelltest.assert_equals(None, pattern.match_pattern('*s', maps[1], rpmap, 2))
+    cornelltest.assert_equals(pattern.match_pattern('*s', maps[1]),
+                              pattern.match_pattern('*s', maps[1], rpmap, 1000))
+
+
+def test_min_visits():
+    """Test function min_visits"""
+    print 'Testing function min_visits'
+    words = a4.build_word_list('short.txt')
+    pmap = trie.Trie(words)
+    # The 2 words and the nodes for '' and 't'
+    cornelltest.assert_equals(4, pattern.min_visits(pattern.Regex('th.*'), pmap))
+    cornelltest.assert_equals(len(set(words)), pattern.min_visits(pattern.Regex('.*'), pmap))
+    # Only expressions that accept any letters after the prefix count
+    cornelltest.assert_equals(0, pattern.min_visits(pattern.Regex('.*e'), pmap))
+    cornelltest.assert_equals(0, pattern.min_visits(pattern.Regex('th.'), pmap))
+    cornelltest.assert_equals(0, pattern.min_visits(pattern.Regex('th[^e]*'), pmap))
+    cornelltest.assert_equals(0, pattern.min_visits(pattern.Regex('x.*'), pmap))
+    cornelltest.assert_equals(0, pattern.min_visits(pattern.Regex('th.*'),
+                                                    a4.word_list_to_pmap(words)))
+
+    # It is a lower bound on the budget that match_pattern spends, and exact when
+    # every narrowed prefix is followed by '.*'
+    words = a4.build_word_list('common.txt')
+    pmap = dawg.Dawg(sorted(words))
+    for text in ['th.*', '(th|wh).*', 's[aeiou].*', '.*', 'a.*e', 's[^aeiou]*', 'q[^u]*']:
+        compiled = pattern.Regex(text)
+        budget = [len(pmap) * len(words)]
+        pattern._search(compiled, pmap, pmap.root, '', compiled.initial(), True, [], budget)
+        spent = len(pmap) * len(words) - budget[0]
+        cornelltest.assert_true(pattern.min_visits(compiled, pmap) <= spent)
+        if text.endswith('.*'):
+            cornelltest.assert_equals(spent, pattern.min_visits(compiled, pmap))
+
+    # A selective expression is walked within a small budget.  One that takes
+    # every word below its prefix costs exactly its bound, so a budget that is
+    # too small is never spent on it.
+    words = words + ['unable', 'uncle', 'under', 'undo', 'unit', 'until', 'unwise',
+                     'sky', 'spry', 'sty', 'shh']
+    pmap = trie.Trie(words)
+    for text, bound in [('s[^aeiou]*', 0), ('un.*', 9)]:
+        regex = re.compile('(?:' + text + r')\Z')
+        expected = sorted([word for word in set(words) if regex.match(word)])
+        compiled = pattern.Regex(text)
+        budget = [len(pmap)]
+        pattern._search(compiled, pmap, pmap.root, '', compiled.initial(), True, [], budget)
+        spent = len(pmap) - budget[0]
+        cornelltest.assert_true(spent < len(expected) * 4)
+        cornelltest.assert_equals(bound, pattern.min_visits(compiled, pmap))
+        cornelltest.assert_equals(expected, pattern.match_pattern(compiled, pmap, None, spent))
+        cornelltest.assert_equals(None, pattern.match_pattern(compiled, pmap, None, spent - 1))
+    cornelltest.assert_equals(9, spent)
+
+
+def test_regex():
+    """Test class Regex, and match_pattern with it"""
+    print 'Testing Regex'
+    cornelltest.assert_true(pattern.Regex('(un|re)?do').matches('undo'))
+    cornelltest.assert_true(pattern.Regex('^(un|re)?do$').matches('do'))
+    cornelltest.assert_false(pattern.Regex('(un|re)?do').matches('redone'))
+    cornelltest.assert_true(pattern.Regex('a{2,}b{0}').matches('aaa'))
+    cornelltest.assert_false(pattern.Regex('a{2,}b{0}').matches('aab'))
+    cornelltest.assert_equals("Regex('(un|re)?do')", `pattern.Regex('(un|re)?do')`)
+    cornelltest.assert_equals(2, pattern.Regex('(in|ed).*').narrow_prefix())
+    cornelltest.assert_equals(0, pattern.Regex('.*(in|ed)').narrow_prefix())
+
+    # The same words as the module re, matching whole words
+    words = a4.build_word_list('common.txt')
+    pmap = trie.Trie(words)
+    rpmap = trie.Trie(a4.reverse_word_list(words))
+    for text in ['th.*', '(un|re)?do(es|ne|ing)?', '.*(ing|ed)$', '^[a-c]+[^a-z]*$',
+                 'a.{2,3}e', '(ab|a)*b', 'x{0}the', '.*o.*', '[]a]', '(?:a|b)+c?', 'e?.{3}',
+                 '(.)(.)', '\\w+?s', '.*[aeiou]{2}.*']:
+        regex = re.compile('(?:' + text.lstrip('^').rstrip('$') + r')\Z')
+        expected = sorted([word for word in set(words) if regex.match(word)])
+        compiled = pattern.Regex(text)
+        cornelltest.assert_equals(expected, pattern.match_pattern(compiled, pmap))
+        cornelltest.assert_equals(expected, pattern.match_pattern(compiled, pmap, rpmap))
+
+
+# Application Code
+if __name__ == "__main__":
+    test_parse()
+    test_matches()
+    test_bounds()
+    test_match_pattern()
+    test_min_visits()
+    test_regex()
+    print "Module pattern is working correctly"
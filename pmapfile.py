@@ -0,0 +1,305 @@
+# pmapfile.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Compiled (binary) prefix maps
+
+Building the prefix map for complete.txt with word_list_to_pmap takes several
+seconds and a lot of memory.  This module compiles a word list once into a binary
+file, and loads that file back with mmap.  Nothing is parsed at load time; every
+query reads the handful of bytes that it needs straight from the file.
+
+File layout (version 3, all integers little-endian):
+
+    header:   magic 'PMAP', version [uint16], flags [uint16],
+              node count, edge count, word count [uint32 each]
+    offsets:  node count + 1 uint32s.  The edges of node n are the edges
+              offsets[n] .. offsets[n+1]-1.  Node 0 is the root (the prefix '').
+              If the MINIMIZED flag is set, a node may have several parents.
+    targets:  edge count uint32s, the node each edge leads to
+    minlen:   node count uint16s, the shortest completion of each node
+    maxlen:   node count uint16s, the longest completion of each node
+    counts:   node count uint32s, the number of words completing each node
+    labels:   edge count bytes, the letter on each edge (sorted within a node)
+    terminal: node count bytes, 1 if the node ends a word and 0 otherwise
+
+To compile a word list from the command line:
+
+    python pmapfile.py complete.txt complete.pmap
+
+Add the option -m (before the file names) to compile a minimized map.
+"""
+import mmap
+import os
+import struct
+import sys
+
+import a4
+from dawg import Dawg
+from nodemap import NodeMap
+from trie import Trie
+
+
+# File format constants
+MAGIC = 'PMAP'
+VERSION = 3
+
+# Header flags
+MINIMIZED = 1   # nodes are shared, as in a Dawg
+
+# magic, version, flags, node count, edge count, word count
+_HEADER = struct.Struct('<4sHHIII')
+_UINT = struct.Struct('<I')
+_PAIR = struct.Struct('<II')
+_SHORT = struct.Struct('<H')
+
+
+def compile_word_list(words, filename, minimize=False):
+    """Writes the compiled prefix map for the given word list to filename.
+
+    The words do not need to be sorted, and duplicates are ignored.  If minimize
+    is True, the map is stored as a minimized graph (see dawg.Dawg), which makes
+    for a much smaller file.
+
+    Precondition: words is a list of strings with only letters.  filename is the
+    name of a file that can be written.  minimize is a bool.
+
+    Enforced Precondition: words is a list.  filename is a string."""
+    assert type(words) == list, `words` + ' is not a list'
+    assert type(filename) == str, `filename` + ' is not a string'
+    if minimize:
+        compile_pmap(Dawg(sorted(words)), filename)
+    else:
+        compile_pmap(Trie(words), filename)
+
+
+def compile_pmap(pmap, filename):
+    """Writes the compiled form of the node-based prefix map pmap to filename.
+
+    Any node-based prefix map can be compiled, including a Trie or a Dawg.  Nodes
+    that pmap shares (as in a Dawg) stay shared in the file.
+
+    Precondition: pmap is a NodeMap.  filename is the name of a file that can be
+    written.
+
+    Enforced Precondition: pmap is a NodeMap.  filename is a string."""
+    assert isinstance(pmap, NodeMap), `pmap` + ' is not a NodeMap'
+    assert type(filename) == str, `filename` + ' is not a string'
+
+    # Number the nodes breadth first, so that siblings are stored together
+    number = {pmap.root: 0}
+    order = [pmap.root]
+    offsets = [0]
+    targets = []
+    labels = []
+    terminal = []
+    minlen = []
+    maxlen = []
+    counts = []
+    minimized = False
+    pos = 0
+    while pos < len(order):
+        node = order[pos]
+        if pmap.is_word(node):
+            terminal.append(chr(1))
+        else:
+            terminal.append(chr(0))
+        shortest, longest = pmap.lengths(node)
+        minlen.append(shortest)
+        maxlen.append(longest)
+        counts.append(pmap.count(node))
+        for letter, child in pmap.children(node):
+            if child in number:
+                minimized = True
+            else:
+                number[child] = len(order)
+                order.append(child)
+            labels.append(letter)
+            targets.append(number[child])
+        offsets.append(len(targets))
+        pos = pos + 1
+
+    if minimized:
+        flags = MINIMIZED
+    else:
+        flags = 0
+
+    file = open(filename, 'wb')
+    file.write(_HEADER.pack(MAGIC, VERSION, flags, len(order), len(targets),
+                            counts[0]))
+    file.write(struct.pack('<%dI' % len(offsets), *offsets))
+    file.write(struct.pack('<%dI' % len(targets), *targets))
+    file.write(struct.pack('<%dH' % len(minlen), *minlen))
+    file.write(struct.pack('<%dH' % len(maxlen), *maxlen))
+    file.write(struct.pack('<%dI' % len(counts), *counts))
+    file.write(''.join(labels))
+    file.write(''.join(terminal))
+    file.close()
+
+
+def compile_file(source, filename, minimize=False):
+    """Compiles the word list stored in the text file source, writing the result
+    to filename.
+
+    Precondition: source is the name of a text file storing a list of words, as
+    in build_word_list.  filename is the name of a file that can be written.
+    minimize is a bool, as in compile_word_list.
+
+    Enforced Precondition: source and filename are strings."""
+    assert type(source) == str, `source` + ' is not a string'
+    compile_word_list(a4.build_word_list(source), filename, minimize)
+
+
+def load_pmap(filename):
+    """Returns the compiled prefix map stored in filename.
+
+    The file is memory-mapped, not read, so this takes the same (short) time no
+    matter how large the dictionary is.
+
+    Precondition: filename is the name of a file written by compile_word_list.
+
+    Enforced Precondition: filename is a string."""
+    assert type(filename) == str, `filename` + ' is not a string'
+    return CompiledPmap(filename)
+
+
+class CompiledPmap(NodeMap):
+    """Instances are read-only prefix maps backed by a compiled file.
+
+    A compiled prefix map can be used anywhere that a4 expects a prefix map for
+    searching: pmap_has_word, autocomplete, scrabble and match.  Like the dict
+    version, pmap[prefix] is the list of next letters of prefix (with '' first if
+    prefix is a word), and prefix in pmap is True if some word starts with prefix.
+    It cannot be changed with pmap_add_word.
+
+    The nodes of a compiled map are ints, with the root at 0.
+
+    Instance Attributes:
+        filename:   the file this map was loaded from [str]
+        version:    the format version of the file [int]
+        minimized:  whether nodes may be shared by several prefixes [bool]
+        node_count: the number of nodes [int]
+        edge_count: the number of edges [int]
+        word_count: the number of words [int]
+    """
+    stores_lengths = True
+
+    def __init__(self, filename):
+        """**Constructor**: Memory-map the compiled prefix map in filename.
+
+        Precondition: filename is the name of a file written by compile_word_list."""
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        self._data = None
+        try:
+            self._load()
+        except:
+            # Do not leave the file open when it cannot be used
+            self.close()
+            raise
+
+    def _load(self):
+        """Maps the file and reads its header.
+
+        Raises IOError if the file is too short for a header, is not a compiled
+        prefix map, has the wrong version, or is shorter than the sections that
+        its header describes.
+
+        Precondition: self._file is open for reading."""
+        filename = self.filename
+        # mmap refuses an empty file, so the size is checked first
+        size = os.fstat(self._file.fileno()).st_size
+        if size < _HEADER.size:
+            raise IOError(filename + ' is empty or is not a compiled prefix map')
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = _HEADER.unpack_from(self._data, 0)
+        if header[0] != MAGIC:
+            raise IOError(filename + ' is not a compiled prefix map')
+        if header[1] != VERSION:
+            raise IOError(filename + ' has format version ' + `header[1]` +
+                          ', expected ' + `VERSION`)
+
+        self.version = header[1]
+        self.minimized = header[2] & MINIMIZED != 0
+        self.node_count = header[3]
+        self.edge_count = header[4]
+        self.word_count = header[5]
+
+        self._offsets = _HEADER.size
+        self._targets = self._offsets + 4 * (self.node_count + 1)
+        self._minlen = self._targets + 4 * self.edge_count
+        self._maxlen = self._minlen + 2 * self.node_count
+        self._counts = self._maxlen + 2 * self.node_count
+        self._labels = self._counts + 4 * self.node_count
+        self._terminal = self._labels + self.edge_count
+        expected = self._terminal + self.node_count
+        if len(self._data) < expected:
+            raise IOError(filename + ' is truncated: it has ' + `len(self._data)` +
+                          ' bytes, but its header needs ' + `expected`)
+
+    def close(self):
+        """Closes the underlying file.  The map may not be used afterwards."""
+        if self._data is not None:
+            self._data.close()
+        self._file.close()
+
+    # Node Access
+    def child(self, node, letter):
+        """Returns the node reached from node by letter, or None if there is none.
+
+        Precondition: node is a node of this map.  letter is a single character."""
+        start, end = _PAIR.unpack_from(self._data, self._offsets + 4 * node)
+        pos = self._data[self._labels + start:self._labels + end].find(letter)
+        if pos == -1:
+            return None
+        return _UINT.unpack_from(self._data, self._targets + 4 * (start + pos))[0]
+
+    def children(self, node):
+        """Returns the list of (letter, node) pairs leaving node, sorted by letter.
+
+        Precondition: node is a node of this map."""
+        start, end = _PAIR.unpack_from(self._data, self._offsets + 4 * node)
+        if start == end:
+            return []
+        letters = self._data[self._labels + start:self._labels + end]
+        nodes = struct.unpack_from('<%dI' % (end - start), self._data,
+                                   self._targets + 4 * start)
+        return zip(letters, nodes)
+
+    def is_word(self, node):
+        """Returns True if node ends a word.
+
+        Precondition: node is a node of this map."""
+        return self._data[self._terminal + node] != chr(0)
+
+    def lengths(self, node):
+        """Returns the pair (shortest, longest) of the lengths of the completions
+        of node.
+
+        If no word passes through node, shortest is greater than longest.
+
+        Precondition: node is a node of this map."""
+        return (_SHORT.unpack_from(self._data, self._minlen + 2 * node)[0],
+                _SHORT.unpack_from(self._data, self._maxlen + 2 * node)[0])
+
+    def count(self, node):
+        """Returns the number of words that complete node.
+
+        Precondition: node is a node of this map."""
+        return _UINT.unpack_from(self._data, self._counts + 4 * node)[0]
+
+    def __len__(self):
+        """Returns the number of nodes in this map."""
+        return self.node_count
+
+
+# Application Code
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    minimize = len(args) > 0 and args[0] == '-m'
+    if minimize:
+        args = args[1:]
+    if len(args) != 2:
+        print 'Usage: python pmapfile.py [-m] wordlist.txt output.pmap'
+        sys.exit(1)
+    compile_file(args[0], args[1], minimize)
@@ -0,0 +1,145 @@
+# pmapfiletest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module pmapfile"""
+import os
+import tempfile
+import cornelltest
+import a4
+import pmapfile
+from a4test import assert_lists_equal
+
+
+def compile_temp(words):
+    """Returns the name of a temporary file storing the compiled map for words"""
+    handle, filename = tempfile.mkstemp(suffix='.pmap')
+    os.close(handle)
+    pmapfile.compile_word_list(words, filename)
+    return filename
+
+
+# Test Procedures
+
+def test_compile_word_list():
+    """Test function compile_word_list and the header of the result"""
+    print 'Testing compile_word_list'
+    filename = compile_temp(['at', 'by', 'a', 'at'])
+    pmap = pmapfile.load_pmap(filename)
+    cornelltest.assert_equals(pmapfile.VERSION, pmap.version)
+    cornelltest.assert_equals(3, pmap.word_count)
+    cornelltest.assert_equals(5, pmap.node_count)
+    cornelltest.assert_equals(4, pmap.edge_count)
+    cornelltest.assert_equals(5, len(pmap))
+    pmap.close()
+
+    # Empty word list is just a root
+    empty = compile_temp([])
+    pmap = pmapfile.load_pmap(empty)
+    cornelltest.assert_equals(0, pmap.word_count)
+    cornelltest.assert_equals(1, pmap.node_count)
+    cornelltest.assert_false(a4.pmap_has_word(pmap, 'a'))
+    assert_lists_equal([], a4.autocomplete('a', pmap))
+    pmap.close()
+
+    os.remove(filename)
+    os.remove(empty)
+
+
+def test_compile_minimized():
+    """Test compiling a minimized map"""
+    print 'Testing compile_word_list with minimize'
+    words = ['taps', 'tap', 'tops', 'top']
+    handle, filename = tempfile.mkstemp(suffix='.pmap')
+    os.close(handle)
+    pmapfile.compile_word_list(words, filename, True)
+    pmap = pmapfile.load_pmap(filename)
+    cornelltest.assert_true(pmap.minimized)
+    cornelltest.assert_equals(4, pmap.word_count)
+    cornelltest.assert_equals(5, pmap.node_count)
+    cornelltest.assert_equals(sorted(words), a4.pmap_to_word_list(pmap))
+    assert_lists_equal(['top', 'tops'], a4.autocomplete('to', pmap))
+    cornelltest.assert_equals((3, 4), pmap.lengths(pmap.root))
+    cornelltest.assert_equals((0, 1), pmap.lengths(pmap.find('top')))
+    cornelltest.assert_equals(2, a4.count_completions('top', pmap))
+    cornelltest.assert_equals(4, a4.count_completions('', pmap))
+    pmap.close()
+    os.remove(filename)
+
+
+def test_load_pmap_errors():
+    """Test that load_pmap refuses files that are not compiled maps"""
+    print 'Testing load_pmap errors'
+    try:
+        pmapfile.load_pmap('short.txt')
+        cornelltest.quit_with_error('load_pmap accepted short.txt')
+    except IOError:
+        pass
+
+    # Empty and truncated files are refused before any lookup
+    filename = compile_temp(['at', 'by', 'a'])
+    data = open(filename, 'rb').read()
+    for size in [0, 10, len(data) - 1]:
+        file = open(filename, 'wb')
+        file.write(data[:size])
+        file.close()
+        try:
+            pmapfile.load_pmap(filename)
+            cornelltest.quit_with_error('load_pmap accepted ' + `size` + ' bytes')
+        except IOError:
+            pass
+    # The file is closed after a failure, so it can be removed on any system
+    os.remove(filename)
+
+
+def test_prefix_map_interface():
+    """Test that a compiled map looks like the dict prefix map"""
+    print 'Testing CompiledPmap as a prefix map'
+    words = ['at', 'by', 'a']
+    filename = compile_temp(words)
+    pmap = pmapfile.load_pmap(filename)
+
+    cornelltest.assert_true('' in pmap)
+    cornelltest.assert_true('b' in pmap)
+    cornelltest.assert_false('c' in pmap)
+    assert_lists_equal(['a','b'], pmap[''])
+    assert_lists_equal(['','t'], pmap['a'])
+    assert_lists_equal([''], pmap['by'])
+    assert_lists_equal(['', 'a', 'b', 'at', 'by'], list(pmap))
+    assert_lists_equal(words, a4.pmap_to_word_list(pmap))
+
+    cornelltest.assert_true(a4.pmap_has_word(pmap, 'a'))
+    cornelltest.assert_true(a4.pmap_has_word(pmap, 'by'))
+    cornelltest.assert_false(a4.pmap_has_word(pmap, 'b'))
+    cornelltest.assert_false(a4.pmap_has_word(pmap, ''))
+    cornelltest.assert_false(a4.pmap_has_word(pmap, 'cat'))
+
+    pmap.close()
+    os.remove(filename)
+
+
+def test_searches():
+    """Test that searching a compiled map agrees with the dict prefix map"""
+    print 'Testing searches on CompiledPmap'
+    words = a4.build_word_list('short.txt')
+    filename = compile_temp(words)
+    pmap = pmapfile.load_pmap(filename)
+
+    assert_lists_equal(['the', 'that'], a4.autocomplete('th', pmap))
+    assert_lists_equal([], a4.autocomplete('x', pmap))
+    assert_lists_equal(['be', 'to'], a4.scrabble('theob', 2, pmap))
+    assert_lists_equal(['have'], a4.scrabble('veha', 4, pmap))
+    assert_lists_equal(['in', 'it'], a4.match('i?', pmap))
+    assert_lists_equal(['the', 'and'], a4.match('???', pmap))
+
+    pmap.close()
+    os.remove(filename)
+
+
+# Application Code
+if __name__ == "__main__":
+    test_compile_word_list()
+    test_compile_minimized()
+    test_load_pmap_errors()
+    test_prefix_map_interface()
+    test_searches()
+    print "Module pmapfile is working correctly"
@@ -0,0 +1,186 @@
+# sortedwords.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Prefix maps stored as a sorted word list
+
+The words that complete a prefix are a contiguous range of the sorted word list.
+A SortedWords keeps the sorted words in one string buffer, with an array of the
+offsets where each word starts.  The completions of a prefix, and how many of
+them there are, then take two binary searches and a slice.  There is no other
+index, so this takes less memory than any other prefix map, but it cannot have
+words added to it.
+
+A SortedWords is also a NodeMap, so it can be searched with the a4 functions.
+Its nodes are not stored, but are computed as they are needed.  The node for a
+prefix is the triple (start, end, depth), where start..end-1 are the positions
+of the words that complete the prefix and depth is the length of the prefix.
+"""
+from array import array
+
+from nodemap import NodeMap
+
+
+# A character that sorts after every letter, to mark the end of a prefix range:
+# the words that start with prefix are those from prefix up to prefix + END
+END = chr(127)
+
+
+class SortedWords(NodeMap):
+    """Instances are read-only prefix maps stored as a sorted word list.
+
+    Instance Attributes:
+        word_count: the number of words [int >= 0]
+        node_count: the number of nodes (distinct prefixes, including '') [int > 0]
+        root:       the node for the empty prefix [tuple (0, word_count, 0)]
+    """
+
+    def __init__(self, words):
+        """**Constructor**: Create the sorted word list for words.
+
+        The words do not need to be sorted, and duplicates are ignored.
+
+        Precondition: words is a list of strings with only letters.
+
+        Enforced Precondition: words is a list."""
+        assert type(words) == list, `words` + ' is not a list'
+        unique = []
+        for word in sorted(words):
+            if not unique or unique[-1] != word:
+                unique.append(word)
+
+        self._buffer = ''.join(unique)
+        self._offsets = array('i', [0])
+        pos = 0
+        for word in unique:
+            pos = pos + len(word)
+            self._offsets.append(pos)
+        self.word_count = len(unique)
+
+        # Each word adds the prefixes it does not share with the word before it
+        self.node_count = 1
+        previous = ''
+        for word in unique:
+            shared = 0
+            while shared < min(len(word), len(previous)) and word[shared] == previous[shared]:
+                shared = shared + 1
+            self.node_count = self.node_count + len(word) - shared
+            previous = word
+        self.root = (0, self.word_count, 0)
+
+    def __len__(self):
+        """Returns the number of nodes (distinct prefixes) in this list, as for
+        the other node-based prefix maps.  The nodes are not stored, so this is
+        counted once, when the list is created.  The number of words is
+        word_count."""
+        return self.node_count
+
+    def nbytes(self):
+        """Returns the number of bytes used by the buffer and offsets."""
+        return len(self._buffer) + len(self._offsets) * self._offsets.itemsize
+
+    def word(self, pos):
+        """Returns the word at position pos of the sorted list.
+
+        Precondition: pos is an int in 0..word_count-1."""
+        return self._buffer[self._offsets[pos]:self._offsets[pos+1]]
+
+    def _search(self, key, start, end):
+        """Returns the first position in start..end-1 whose word is >= key.
+
+        If there is no such position, this returns end.
+
+        Precondition: key is a string.  start and end are ints with
+        0 <= start <= end <= word_count."""
+        buffer = self._buffer
+        offsets = self._offsets
+        while start < end:
+            mid = (start + end) // 2
+            if buffer[offsets[mid]:offsets[mid+1]] < key:
+                start = mid + 1
+            else:
+                end = mid
+        return start
+
+    # Range Queries
+    def span(self, prefix):
+        """Returns the pair (start, end) of positions of the words completing prefix.
+
+        The words completing prefix are at positions start..end-1, so there are
+        end-start of them.
+
+        Precondition: prefix is a string."""
+        start = self._search(prefix, 0, self.word_count)
+        end = self._search(prefix + END, start, self.word_count)
+        return (start, end)
+
+    def words(self, prefix=''):
+        """Returns the list of words in this list that start with prefix, sorted.
+
+        Precondition: prefix is a string."""
+        start, end = self.span(prefix)
+        return [self.word(pos) for pos in range(start, end)]
+
+    # Node Access
+    def find(self, prefix):
+        """Returns the node for prefix, or None if no word starts with prefix.
+
+        Precondition: prefix is a string."""
+        start, end = self.span(prefix)
+        if start == end:
+            return None
+        return (start, end, len(prefix))
+
+    def child(self, node, letter):
+        """Returns the node reached from node by letter, or None if there is none.
+
+        Precondition: node is a node of this list.  letter is a single character."""
+        start, end, depth = node
+        prefix = self._buffer[self._offsets[start]:self._offsets[start]+depth] + letter
+        start = self._search(prefix, start, end)
+        end = self._search(prefix + END, start, end)
+        if start == end:
+            return None
+        return (start, end, depth + 1)
+
+    def children(self, node):
+        """Returns the list of (letter, node) pairs leaving node, sorted by letter.
+
+        Precondition: node is a node of this list."""
+        start, end, depth = node
+        if self.is_word(node):
+            start = start + 1
+        result = []
+        while start < end:
+            prefix = self._buffer[self._offsets[start]:self._offsets[start]+depth+1]
+            stop = self._search(prefix + END, start, end)
+            result.append((prefix[-1], (start, stop, depth + 1)))
+            start = stop
+        return result
+
+    def is_word(self, node):
+        """Returns True if node ends a word.
+
+        Precondition: node is a node of this list."""
+        start, end, depth = node
+        return start < end and self._offsets[start+1] - self._offsets[start] == depth
+
+    def count(self, node):
+        """Returns the number of words that complete node.
+
+        Precondition: node is a node of this list."""
+        return node[1] - node[0]
+
+    def lengths(self, node):
+        """Returns the pair (shortest, longest) of the lengths of the completions
+        of node.
+
+        The lengths are not stored, so this takes time proportional to the number
+        of completions.
+
+        Precondition: node is a node of this list."""
+        start, end, depth = node
+        if start == end:
+            return NodeMap.lengths(self, node)
+        offsets = self._offsets
+        sizes = [offsets[pos+1] - offsets[pos] for pos in range(start, end)]
+        return (min(sizes) - depth, max(sizes) - depth)
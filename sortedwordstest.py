@@ -0,0 +1,88 @@
+# sortedwordstest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module sortedwords"""
+import cornelltest
+import a4
+import sortedwords
+import trie
+from a4test import assert_lists_equal
+
+
+# Test Procedures
+
+def test_constructor():
+    """Test the SortedWords constructor"""
+    print 'Testing SortedWords constructor'
+    words = sortedwords.SortedWords([])
+    cornelltest.assert_equals(0, words.word_count)
+    cornelltest.assert_equals(1, len(words))
+    cornelltest.assert_equals([], words.words())
+    cornelltest.assert_equals(None, words.find('a'))
+
+    words = sortedwords.SortedWords(['the', 'be', 'the', 'a'])
+    cornelltest.assert_equals(3, words.word_count)
+    # The prefixes '', 'a', 'b', 'be', 't', 'th' and 'the'
+    cornelltest.assert_equals(7, len(words))
+    full = a4.build_word_list('common.txt')
+    cornelltest.assert_equals(len(trie.Trie(full)), len(sortedwords.SortedWords(full)))
+    cornelltest.assert_equals(['a', 'be', 'the'], words.words())
+    cornelltest.assert_equals('be', words.word(1))
+
+
+def test_ranges():
+    """Test methods span, words and count"""
+    print 'Testing SortedWords ranges'
+    words = sortedwords.SortedWords(a4.build_word_list('short.txt'))
+    cornelltest.assert_equals((7, 9), words.span('th'))
+    cornelltest.assert_equals((10, 10), words.span('x'))
+    cornelltest.assert_equals(2, words.count(words.find('th')))
+    cornelltest.assert_equals(1, words.count(words.find('tha')))
+    cornelltest.assert_equals(10, words.count(words.root))
+    cornelltest.assert_equals(0, a4.count_completions('x', words))
+    cornelltest.assert_equals(0, a4.count_completions('thee', words))
+    cornelltest.assert_equals(['that', 'the'], words.words('th'))
+    cornelltest.assert_equals(['a', 'and'], words.words('a'))
+    cornelltest.assert_equals([], words.words('ab'))
+
+
+def test_nodes():
+    """Test the node methods of SortedWords"""
+    print 'Testing SortedWords nodes'
+    words = sortedwords.SortedWords(['a', 'at', 'ate', 'by'])
+    root = words.root
+    cornelltest.assert_false(words.is_word(root))
+    cornelltest.assert_equals(['a', 'b'], [x for x, y in words.children(root)])
+    node = words.child(root, 'a')
+    cornelltest.assert_true(words.is_word(node))
+    cornelltest.assert_equals(node, words.find('a'))
+    cornelltest.assert_equals(None, words.child(root, 'c'))
+    cornelltest.assert_equals((0, 2), words.lengths(node))
+    cornelltest.assert_equals((1, 3), words.lengths(root))
+
+    assert_lists_equal(['a','b'], words[''])
+    assert_lists_equal(['','t'], words['a'])
+    assert_lists_equal(['','e'], words['at'])
+    cornelltest.assert_true(a4.pmap_has_word(words, 'at'))
+    cornelltest.assert_false(a4.pmap_has_word(words, 'b'))
+    cornelltest.assert_false(a4.pmap_has_word(words, ''))
+
+
+def test_searches():
+    """Test that searching a SortedWords agrees with the dict prefix map"""
+    print 'Testing searches on SortedWords'
+    words = sortedwords.SortedWords(a4.build_word_list('short.txt'))
+    assert_lists_equal(['the', 'that'], a4.autocomplete('th', words))
+    cornelltest.assert_equals(['that'], list(a4.autocomplete_iter('th', words, 1)))
+    assert_lists_equal(['be', 'to'], a4.scrabble('theob', 2, words))
+    assert_lists_equal(['in', 'it'], a4.match('i?', words))
+    assert_lists_equal(['the','and'], a4.match('???', words))
+
+
+# Application Code
+if __name__ == "__main__":
+    test_constructor()
+    test_ranges()
+    test_nodes()
+    test_searches()
+    print "Module sortedwords is working correctly"
@@ -0,0 +1,139 @@
+# templateindex.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Positional bitsets for matching templates
+
+A template such as '??a?e??' fixes a few letters at a few positions, and leaves
+the rest free.  Walking a prefix map with it has to follow every letter at each
+free position before it reaches the fixed ones, which for a template that starts
+with several '?' means most of the map.
+
+A TemplateIndex keeps the words of each length in a sorted list, so that a word
+is known by its position in the list (its id).  For every position and letter,
+it keeps the set of ids of the words with that letter there, as an int with one
+bit per id.  The words matching a template are then the AND of the bitsets for
+its fixed letters, and no word with the wrong letter is ever looked at.
+"""
+
+
+def bit_ids(bits):
+    """Returns the sorted list of the positions of the 1 bits of bits.
+
+    Example: bit_ids(0b10110) returns [1, 2, 4].
+
+    Precondition: bits is an int >= 0."""
+    # Reading the binary string is much faster than shifting a long int
+    digits = bin(bits)[:1:-1]
+    result = []
+    pos = digits.find('1')
+    while pos != -1:
+        result.append(pos)
+        pos = digits.find('1', pos + 1)
+    return result
+
+
+def ids_bits(ids, size):
+    """Returns the int whose 1 bits are at the positions in ids.
+
+    This builds the binary string once, as setting the bits of a long int one at
+    a time copies it each time.
+
+    Example: ids_bits([1, 2, 4], 5) returns 0b10110.
+
+    Precondition: ids is a list of ints in 0..size-1.  size is an int > 0."""
+    digits = ['0'] * size
+    for pos in ids:
+        digits[size - 1 - pos] = '1'
+    return int(''.join(digits), 2)
+
+
+class TemplateIndex(object):
+    """Instances map each (position, letter) to the words of each length with that
+    letter at that position.
+
+    Instance Attributes:
+        word_count: the number of words in this index [int >= 0]
+    """
+
+    def __init__(self, words):
+        """**Constructor**: Create the template index for words.
+
+        Duplicates are ignored.
+
+        Precondition: words is a list of strings with only letters.
+
+        Enforced Precondition: words is a list."""
+        assert type(words) == list, `words` + ' is not a list'
+        self._words = {}   # length -> sorted list of words
+        for word in sorted(set(words)):
+            if word != '':
+                if len(word) in self._words:
+                    self._words[len(word)].append(word)
+                else:
+                    self._words[len(word)] = [word]
+        self.word_count = sum([len(bucket) for bucket in self._words.values()])
+
+        self._bits = {}    # length -> dict from (position, letter) to bitset
+        self._counts = {}  # length -> dict from (position, letter) to word count
+        for size in self._words:
+            ids = {}
+            bucket = self._words[size]
+            for pos in range(len(bucket)):
+                word = bucket[pos]
+                for index in range(size):
+                    key = (index, word[index])
+                    if key in ids:
+                        ids[key].append(pos)
+                    else:
+                        ids[key] = [pos]
+            self._bits[size] = {}
+            self._counts[size] = {}
+            for key in ids:
+                self._bits[size][key] = ids_bits(ids[key], len(bucket))
+                self._counts[size][key] = len(ids[key])
+
+    def __len__(self):
+        """Returns the number of words in this index."""
+        return self.word_count
+
+    def bitset_count(self):
+        """Returns the number of (length, position, letter) bitsets in this index."""
+        return sum([len(bits) for bits in self._bits.values()])
+
+    def match(self, template):
+        """Returns the sorted list of words that match template, as in a4.match.
+
+        The bitsets of the fixed letters are combined rarest first, so the
+        intermediate sets shrink as fast as possible, and the query stops as soon
+        as one is empty.  A template with no fixed letters returns every word of
+        its length.
+
+        Example: In the index for 'short.txt', match('t??') returns ['the'].
+
+        Precondition: template is a string of letters and '?'.
+
+        Enforced Precondition: template is a string."""
+        assert type(template) == str, `template` + ' is not a string'
+        size = len(template)
+        if not size in self._words:
+            return []
+        counts = self._counts[size]
+        keys = []
+        for pos in range(size):
+            if template[pos] != '?':
+                key = (pos, template[pos])
+                if not key in counts:
+                    return []
+                keys.append((counts[key], key))
+        if not keys:
+            return self._words[size][:]
+
+        keys.sort()
+        bits = self._bits[size]
+        result = bits[keys[0][1]]
+        for count, key in keys[1:]:
+            result = result & bits[key]
+            if result == 0:
+                return []
+        bucket = self._words[size]
+        return [bucket[pos] for pos in bit_ids(result)]
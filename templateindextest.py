@@ -0,0 +1,58 @@
+# templateindextest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module templateindex"""
+import cornelltest
+import a4
+import templateindex
+
+
+# Test Procedures
+
+def test_bits():
+    """Test functions bit_ids and ids_bits"""
+    print 'Testing bit_ids and ids_bits'
+    cornelltest.assert_equals([1, 2, 4], templateindex.bit_ids(0b10110))
+    cornelltest.assert_equals([], templateindex.bit_ids(0))
+    cornelltest.assert_equals([0], templateindex.bit_ids(1))
+    cornelltest.assert_equals(0b10110, templateindex.ids_bits([1, 2, 4], 5))
+    cornelltest.assert_equals(0, templateindex.ids_bits([], 3))
+    ids = range(0, 1000, 7)
+    cornelltest.assert_equals(ids, templateindex.bit_ids(templateindex.ids_bits(ids, 1000)))
+
+
+def test_constructor():
+    """Test the TemplateIndex constructor"""
+    print 'Testing TemplateIndex constructor'
+    index = templateindex.TemplateIndex(['the', 'to', 'the', 'a', ''])
+    cornelltest.assert_equals(3, len(index))
+    # (0,'t'), (1,'h'), (2,'e') for length 3; (0,'t'), (1,'o') for 2; (0,'a') for 1
+    cornelltest.assert_equals(6, index.bitset_count())
+
+
+def test_match():
+    """Test method match"""
+    print 'Testing TemplateIndex.match'
+    index = templateindex.TemplateIndex(a4.build_word_list('short.txt'))
+    cornelltest.assert_equals(['the'], index.match('t??'))
+    cornelltest.assert_equals(['in', 'it'], index.match('i?'))
+    cornelltest.assert_equals(['be', 'in', 'it', 'of', 'to'], index.match('??'))
+    cornelltest.assert_equals(['that'], index.match('that'))
+    cornelltest.assert_equals([], index.match('x?'))
+    cornelltest.assert_equals([], index.match('?????'))
+    cornelltest.assert_equals([], index.match(''))
+
+    # The same words as a4.match, on a larger list
+    words = a4.build_word_list('common.txt')
+    index = templateindex.TemplateIndex(words)
+    pmap = a4.word_list_to_pmap(words)
+    for template in ['?', 't??', '??e??', 's???s', '????????', '??a?e??', 'q?']:
+        cornelltest.assert_equals(a4.match(template, pmap), index.match(template))
+
+
+# Application Code
+if __name__ == "__main__":
+    test_bits()
+    test_constructor()
+    test_match()
+    print "Module templateindex is working correctly"
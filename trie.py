@@ -0,0 +1,323 @@
+# trie.py
+# Michelle Nelson, mhn29
+# 10/17/26
+"""Array-backed prefix maps
+
+The dict prefix map stores every prefix as its own string key, with its own list
+of next letters.  For complete.txt that is several hundred bytes per prefix.  A
+Trie stores the same information as a table of nodes held in a few arrays, at
+about eighteen bytes per prefix.
+
+Each node has a first child and a next sibling (both node numbers, or -1 for
+none), the letter on the edge into it, and a flags byte whose low bit marks the
+end of a word.  The children of a node form a linked list sorted by letter.
+Each node also stores the lengths of its shortest and longest completions, so
+that searches for words of a given length can skip nodes that cannot reach it,
+and the number of words that complete it.
+
+A trie can also rank its words, for example by how common they are.  Once any
+word has a rank, each node stores the rank of its own word and the best (lowest)
+rank below it, so that a search for the best completions can go straight to them.
+These two arrays are only made when the first rank is set.
+
+A Trie can be passed to the a4 functions pmap_add_word, pmap_has_word,
+pmap_to_word_list and the searches in place of a dict prefix map.
+"""
+from array import array
+
+from nodemap import NodeMap, NO_LENGTH
+
+
+# Flag bits
+TERMINAL = 1
+
+# The rank of a word that has not been ranked (worse than any real rank)
+UNRANKED = 0x7FFFFFFF
+
+
+class Trie(NodeMap):
+    """Instances are prefix maps stored as a table of nodes.
+
+    The nodes of a Trie are ints, with the root at 0.  When remove_word unlinks a
+    node, its number is not reused.
+
+    Instance Attributes:
+        word_count: the number of words in this trie [int >= 0]
+    """
+    stores_lengths = True
+
+    def __init__(self, words=None):
+        """**Constructor**: Create a new trie, holding the given words.
+
+        Precondition: words is None or a list of strings with only letters."""
+        assert words is None or type(words) == list, `words` + ' is not a list'
+        self._child   = array('i', [-1])
+        self._sibling = array('i', [-1])
+        self._letter  = array('c', '\0')
+        self._flags   = array('B', [0])
+        self._minlen  = array('H', [NO_LENGTH])
+        self._maxlen  = array('H', [0])
+        self._count   = array('i', [0])
+        self._rank    = None
+        self._best    = None
+        self._dead    = 0
+        self.word_count = 0
+        if words is not None:
+            for word in words:
+                self.add_word(word)
+
+    def __len__(self):
+        """Returns the number of nodes (distinct prefixes) in this trie."""
+        return len(self._flags) - self._dead
+
+    def nbytes(self):
+        """Returns the number of bytes used by the node table."""
+        return (len(self._child) * self._child.itemsize +
+                len(self._sibling) * self._sibling.itemsize +
+                len(self._letter) * self._letter.itemsize +
+                len(self._flags) * self._flags.itemsize +
+                len(self._minlen) * self._minlen.itemsize +
+                len(self._maxlen) * self._maxlen.itemsize +
+                len(self._count) * self._count.itemsize +
+                self._ranks_nbytes())
+
+    def _ranks_nbytes(self):
+        """Returns the number of bytes used by the rank arrays."""
+        if self._rank is None:
+            return 0
+        return (len(self._rank) * self._rank.itemsize +
+                len(self._best) * self._best.itemsize)
+
+    # Node Access
+    def child(self, node, letter):
+        """Returns the node reached from node by letter, or None if there is none.
+
+        Precondition: node is a node of this trie.  letter is a single character."""
+        pos = self._child[node]
+        while pos != -1:
+            found = self._letter[pos]
+            if found == letter:
+                return pos
+            if found > letter:
+                return None
+            pos = self._sibling[pos]
+        return None
+
+    def children(self, node):
+        """Returns the list of (letter, node) pairs leaving node, sorted by letter.
+
+        Precondition: node is a node of this trie."""
+        result = []
+        pos = self._child[node]
+        while pos != -1:
+            result.append((self._letter[pos], pos))
+            pos = self._sibling[pos]
+        return result
+
+    def is_word(self, node):
+        """Returns True if node ends a word.
+
+        Precondition: node is a node of this trie."""
+        return self._flags[node] & TERMINAL != 0
+
+    def lengths(self, node):
+        """Returns the pair (shortest, longest) of the lengths of the completions
+        of node.
+
+        If no word passes through node, shortest is greater than longest.
+
+        Precondition: node is a node of this trie."""
+        return (self._minlen[node], self._maxlen[node])
+
+    def count(self, node):
+        """Returns the number of words that pass through (or end at) node.
+
+        Precondition: node is a node of this trie."""
+        return self._count[node]
+
+    def ranked(self):
+        """Returns True if any word in this trie has been given a rank."""
+        return self._rank is not None
+
+    def rank(self, node):
+        """Returns the rank of the word ending at node.
+
+        If that word has no rank (or node does not end a word), this returns
+        UNRANKED.
+
+        Precondition: node is a node of this trie."""
+        if self._rank is None:
+            return UNRANKED
+        return self._rank[node]
+
+    def best_rank(self, node):
+        """Returns the best (lowest) rank of the words that complete node.
+
+        If none of them has a rank, this returns UNRANKED.
+
+        Precondition: node is a node of this trie."""
+        if self._best is None:
+            return UNRANKED
+        return self._best[node]
+
+    # Modification
+    def set_rank(self, word, rank):
+        """Sets the rank of word, updating the best ranks of its prefixes.
+
+        Lower ranks are better.  Words that are never given a rank come after
+        every ranked word.
+
+        Precondition: word is a word in this trie.  rank is an int in 0..UNRANKED.
+
+        Enforced Precondition: word is in this trie.  rank is an int in 
+        0..UNRANKED."""
+        assert type(rank) == int and 0 <= rank <= UNRANKED, `rank` + ' is not a valid rank'
+        assert self.has_word(word), `word` + ' is not in the trie'
+
+        if self._rank is None:
+            self._rank = array('i', [UNRANKED]) * len(self._flags)
+            self._best = array('i', [UNRANKED]) * len(self._flags)
+
+        path = [0]
+        for letter in word:
+            path.append(self.child(path[-1], letter))
+        self._rank[path[-1]] = rank
+        for pos in range(len(path)-1, -1, -1):
+            self._measure(path[pos])
+
+    def add_word(self, word):
+        """Adds a single word (and so all of its prefixes) to this trie.
+
+        Adding a word that is already present does nothing.
+
+        Precondition: word is a string with only letters.
+
+        Enforced Precondition: word is a string with only letters."""
+        assert type(word) == str, `word` + ' is not a string'
+        assert word.isalpha() == True, `word` + ' needs to be only letters'
+
+        found = self.find(word)
+        if found is not None and self._flags[found] & TERMINAL:
+            return
+
+        node = 0
+        remain = len(word)
+        for letter in word:
+            self._count[node] = self._count[node] + 1
+            self._note_length(node, remain)
+            node = self._add_child(node, letter)
+            remain = remain - 1
+        self._count[node] = self._count[node] + 1
+        self._note_length(node, 0)
+        self._flags[node] = self._flags[node] | TERMINAL
+        self.word_count = self.word_count + 1
+
+    def remove_word(self, word):
+        """Removes a single word from this trie.
+
+        Prefixes of word that no longer start any word are unlinked from the trie.
+        Removing a word that is not present does nothing.
+
+        Precondition: word is a string.
+
+        Enforced Precondition: word is a string."""
+        assert type(word) == str, `word` + ' is not a string'
+
+        path = [0]
+        for letter in word:
+            node = self.child(path[-1], letter)
+            if node is None:
+                return
+            path.append(node)
+        if word == '' or not self._flags[path[-1]] & TERMINAL:
+            return
+
+        self._flags[path[-1]] = self._flags[path[-1]] & ~TERMINAL
+        if self._rank is not None:
+            self._rank[path[-1]] = UNRANKED
+        self.word_count = self.word_count - 1
+        for pos in range(len(path)-1, -1, -1):
+            node = path[pos]
+            self._count[node] = self._count[node] - 1
+            if self._count[node] == 0 and pos > 0:
+                self._unlink(path[pos-1], node)
+            else:
+                self._measure(node)
+
+    def _add_child(self, node, letter):
+        """Returns the child of node for letter, creating it if necessary.
+
+        The new node is linked into the sibling list of node in letter order.
+
+        Precondition: node is a node of this trie.  letter is a single character."""
+        prev = -1
+        pos = self._child[node]
+        while pos != -1 and self._letter[pos] < letter:
+            prev = pos
+            pos = self._sibling[pos]
+        if pos != -1 and self._letter[pos] == letter:
+            return pos
+
+        made = len(self._flags)
+        self._child.append(-1)
+        self._sibling.append(pos)
+        self._letter.append(letter)
+        self._flags.append(0)
+        self._minlen.append(NO_LENGTH)
+        self._maxlen.append(0)
+        self._count.append(0)
+        if self._rank is not None:
+            self._rank.append(UNRANKED)
+            self._best.append(UNRANKED)
+        if prev == -1:
+            self._child[node] = made
+        else:
+            self._sibling[prev] = made
+        return made
+
+    def _unlink(self, node, child):
+        """Removes child from the sibling list of node.
+
+        The arrays keep the entries of child, but nothing refers to them.
+
+        Precondition: child is a child of node in this trie."""
+        if self._child[node] == child:
+            self._child[node] = self._sibling[child]
+        else:
+            pos = self._child[node]
+            while self._sibling[pos] != child:
+                pos = self._sibling[pos]
+            self._sibling[pos] = self._sibling[child]
+        self._dead = self._dead + 1
+
+    def _note_length(self, node, length):
+        """Records that node has a completion of the given length.
+
+        Precondition: node is a node of this trie.  length is an int >= 0."""
+        if length < self._minlen[node]:
+            self._minlen[node] = length
+        if length > self._maxlen[node]:
+            self._maxlen[node] = length
+
+    def _measure(self, node):
+        """Recomputes the completion lengths (and best rank, if there are ranks) of
+        node from those of its children.
+
+        Precondition: node is a node of this trie, and the lengths and best ranks
+        of its children are correct."""
+        if self._flags[node] & TERMINAL:
+            shortest = 0
+        else:
+            shortest = NO_LENGTH
+        longest = 0
+        best = self.rank(node)
+        pos = self._child[node]
+        while pos != -1:
+            shortest = min(shortest, self._minlen[pos] + 1)
+            longest = max(longest, self._maxlen[pos] + 1)
+            best = min(best, self.best_rank(pos))
+            pos = self._sibling[pos]
+        self._minlen[node] = shortest
+        self._maxlen[node] = longest
+        if self._best is not None:
+            self._best[node] = best
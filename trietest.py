@@ -0,0 +1,250 @@
+# trietest.py
+# Michelle Nelson, mhn29
+# 10/17/26
+""" Unit Test for module trie"""
+import cornelltest
+import a4
+import trie
+from a4test import assert_lists_equal
+
+
+# Test Procedures
+
+def test_add_word():
+    """Test adding words to a Trie with pmap_add_word"""
+    print 'Testing Trie with pmap_add_word'
+    pmap = trie.Trie()
+    cornelltest.assert_equals(1, len(pmap))
+    cornelltest.assert_equals(0, pmap.word_count)
+
+    a4.pmap_add_word(pmap, 'a')
+    cornelltest.assert_equals(2, len(pmap))
+    assert_lists_equal(['a'], pmap[''])
+    assert_lists_equal([''], pmap['a'])
+
+    a4.pmap_add_word(pmap, 'by')
+    a4.pmap_add_word(pmap, 'at')
+    cornelltest.assert_equals(5, len(pmap))
+    cornelltest.assert_equals(3, pmap.word_count)
+    assert_lists_equal(['a','b'], pmap[''])
+    assert_lists_equal(['','t'], pmap['a'])
+    assert_lists_equal(['y'], pmap['b'])
+    assert_lists_equal([''], pmap['by'])
+
+    # Duplicates change nothing
+    a4.pmap_add_word(pmap, 'at')
+    cornelltest.assert_equals(5, len(pmap))
+    cornelltest.assert_equals(3, pmap.word_count)
+
+    # Children stay sorted whatever the insertion order
+    a4.pmap_add_word(pmap, 'as')
+    a4.pmap_add_word(pmap, 'ax')
+    a4.pmap_add_word(pmap, 'ab')
+    cornelltest.assert_equals(['', 'b', 's', 't', 'x'], pmap['a'])
+
+    a4.pmap_add_word(pmap, 'goop')
+    cornelltest.assert_true('o' in pmap['go'])
+    cornelltest.assert_true('p' in pmap['goo'])
+
+
+def test_has_word():
+    """Test pmap_has_word on a Trie"""
+    print 'Testing Trie with pmap_has_word'
+    pmap = trie.Trie(['a', 'at'])
+    cornelltest.assert_false(a4.pmap_has_word(pmap, ''))
+    cornelltest.assert_false(a4.pmap_has_word(pmap, 'by'))
+    cornelltest.assert_true(a4.pmap_has_word(pmap, 'a'))
+    cornelltest.assert_true(a4.pmap_has_word(pmap, 'at'))
+
+    pmap = trie.Trie(['that'])
+    cornelltest.assert_false(a4.pmap_has_word(pmap, 'th'))
+    cornelltest.assert_true(a4.pmap_has_word(pmap, 'that'))
+
+
+def test_to_word_list():
+    """Test pmap_to_word_list on a Trie"""
+    print 'Testing Trie with pmap_to_word_list'
+    assert_lists_equal([], a4.pmap_to_word_list(trie.Trie()))
+
+    expected = ['the', 'be','to','of','and','a','in','that','have','it']
+    pmap = trie.Trie(expected)
+    words = a4.pmap_to_word_list(pmap)
+    assert_lists_equal(expected, words)
+    cornelltest.assert_equals(sorted(expected), words)
+
+
+def test_searches():
+    """Test that searching a Trie agrees with the dict prefix map"""
+    print 'Testing searches on Trie'
+    pmap = trie.Trie(a4.build_word_list('short.txt'))
+    assert_lists_equal(['the', 'that'], a4.autocomplete('th', pmap))
+    assert_lists_equal(['be', 'to'], a4.scrabble('theob', 2, pmap))
+    cornelltest.assert_equals(['be'], a4.scrabble('bbeeb', 2, pmap))
+    assert_lists_equal(['in', 'it'], a4.match('i?', pmap))
+    
+    # Pruning on stored lengths finds the same words as the dict
+    words = a4.build_word_list('common.txt')
+    pmap = trie.Trie(words)
+    other = a4.word_list_to_pmap(words)
+    for rack, size in [('retains', 4), ('eeessst', 3), ('aeiou', 2)]:
+        cornelltest.assert_equals(a4.scrabble(rack, size, other),
+                                  a4.scrabble(rack, size, pmap))
+        cornelltest.assert_equals(a4.scrabble_all(rack, other),
+                                  a4.scrabble_all(rack, pmap))
+    for rack, size in [('ret?', 4), ('s??', 3), ('e?e?', 2)]:
+        expected = set()
+        for blank in 'abcdefghijklmnopqrstuvwxyz':
+            for word in a4.scrabble(rack.replace('?', blank, 1), size, pmap):
+                expected.add(word)
+        if rack.count('?') == 1:
+            cornelltest.assert_equals(sorted(expected), a4.scrabble(rack, size, pmap))
+        cornelltest.assert_equals(a4.scrabble(rack, size, other),
+                                  a4.scrabble(rack, size, pmap))
+        cornelltest.assert_equals(a4.scrabble_all(rack, other),
+                                  a4.scrabble_all(rack, pmap))
+    for template in ['?', 't??', '??e??', 's???s', '????????']:
+        cornelltest.assert_equals(a4.match(template, other), a4.match(template, pmap))
+    cornelltest.assert_equals([], a4.match('x?', pmap))
+    for template, rack in [('??e??', 'retains'), ('s???s', 'aeiou?'), ('?a?e', 'eeessst')]:
+        matches = []
+        for word in a4.match(template, pmap):
+            wild = ''.join([word[pos] for pos in range(len(word)) if template[pos] == '?'])
+            if a4.scrabble(rack, len(wild), a4.word_list_to_pmap([wild])):
+                matches.append(word)
+        cornelltest.assert_equals(matches, a4.match_rack(template, rack, pmap))
+        cornelltest.assert_equals(matches, a4.match_rack(template, rack, other))
+    rpmap = trie.Trie(a4.reverse_word_list(words))
+    for template in ['???ing', '??e??', '?????s', 'a???e', 'x??']:
+        cornelltest.assert_equals(a4.match(template, pmap), a4.match(template, pmap, rpmap))
+        cornelltest.assert_equals(a4.match_rack(template, 'retains', pmap),
+                                  a4.match_rack(template, 'retains', pmap, rpmap))
+    cornelltest.assert_equals([], a4.scrabble_helper('xq', 'abc', 1, pmap))
+
+
+def test_lengths():
+    """Test the completion lengths stored in a Trie"""
+    print 'Testing Trie.lengths'
+    pmap = trie.Trie()
+    shortest, longest = pmap.lengths(pmap.root)
+    cornelltest.assert_true(shortest > longest)
+
+    pmap = trie.Trie(['that', 'the', 'a'])
+    cornelltest.assert_equals((1, 4), pmap.lengths(pmap.root))
+    cornelltest.assert_equals((1, 2), pmap.lengths(pmap.find('th')))
+    cornelltest.assert_equals((0, 0), pmap.lengths(pmap.find('a')))
+    a4.pmap_add_word(pmap, 'thatch')
+    cornelltest.assert_equals((1, 4), pmap.lengths(pmap.find('th')))
+    cornelltest.assert_equals((0, 2), pmap.lengths(pmap.find('that')))
+
+
+def test_counts():
+    """Test the word counts stored in a Trie"""
+    print 'Testing Trie counts'
+    pmap = trie.Trie()
+    cornelltest.assert_equals(0, a4.count_completions('', pmap))
+
+    pmap = trie.Trie(a4.build_word_list('short.txt'))
+    cornelltest.assert_equals(10, a4.count_completions('', pmap))
+    cornelltest.assert_equals(2, a4.count_completions('th', pmap))
+    cornelltest.assert_equals(0, a4.count_completions('x', pmap))
+
+    a4.pmap_add_word(pmap, 'thatch')
+    a4.pmap_add_word(pmap, 'that')
+    cornelltest.assert_equals(3, a4.count_completions('th', pmap))
+    cornelltest.assert_equals(2, a4.count_completions('that', pmap))
+    cornelltest.assert_equals(11, pmap.word_count)
+
+
+def test_remove_word():
+    """Test removing words from a Trie with pmap_remove_word"""
+    print 'Testing Trie with pmap_remove_word'
+    pmap = trie.Trie(['a', 'as', 'at', 'ate', 'by'])
+    cornelltest.assert_equals(7, len(pmap))
+
+    # Not a word, so nothing changes
+    a4.pmap_remove_word(pmap, 'b')
+    a4.pmap_remove_word(pmap, 'cat')
+    a4.pmap_remove_word(pmap, '')
+    cornelltest.assert_equals(5, pmap.word_count)
+
+    a4.pmap_remove_word(pmap, 'ate')
+    cornelltest.assert_equals(6, len(pmap))
+    cornelltest.assert_equals(4, pmap.word_count)
+    cornelltest.assert_equals(None, pmap.find('ate'))
+    cornelltest.assert_equals(3, a4.count_completions('a', pmap))
+    cornelltest.assert_equals((0, 1), pmap.lengths(pmap.find('a')))
+    cornelltest.assert_equals((0, 0), pmap.lengths(pmap.find('at')))
+
+    # A word that is a prefix of another only loses its mark
+    a4.pmap_remove_word(pmap, 'a')
+    cornelltest.assert_false(a4.pmap_has_word(pmap, 'a'))
+    cornelltest.assert_equals((1, 1), pmap.lengths(pmap.find('a')))
+    cornelltest.assert_equals(2, a4.count_completions('a', pmap))
+    assert_lists_equal(['s','t'], pmap['a'])
+
+    a4.pmap_remove_word(pmap, 'by')
+    assert_lists_equal(['a'], pmap[''])
+    cornelltest.assert_equals(['as', 'at'], a4.pmap_to_word_list(pmap))
+    cornelltest.assert_equals((2, 2), pmap.lengths(pmap.root))
+
+    # Words can be added back
+    a4.pmap_add_word(pmap, 'by')
+    cornelltest.assert_equals(['as', 'at', 'by'], a4.pmap_to_word_list(pmap))
+    cornelltest.assert_equals(3, a4.count_completions('', pmap))
+
+
+def test_ranks():
+    """Test ranking a Trie and autocomplete_top"""
+    print 'Testing Trie ranks and autocomplete_top'
+    pmap = trie.Trie(['a', 'an', 'and', 'ant', 'at', 'ate', 'be'])
+    cornelltest.assert_false(pmap.ranked())
+    cornelltest.assert_equals(['a', 'an', 'and'], a4.autocomplete_top('', pmap, 3))
+
+    a4.pmap_add_ranks(pmap, ['be', 'at', 'xyzzy', 'and', 'at'])
+    cornelltest.assert_true(pmap.ranked())
+    cornelltest.assert_equals(0, pmap.rank(pmap.find('be')))
+    cornelltest.assert_equals(1, pmap.rank(pmap.find('at')))
+    cornelltest.assert_equals(3, pmap.rank(pmap.find('and')))
+    cornelltest.assert_equals(trie.UNRANKED, pmap.rank(pmap.find('an')))
+    cornelltest.assert_equals(1, pmap.best_rank(pmap.find('a')))
+    cornelltest.assert_equals(3, pmap.best_rank(pmap.find('an')))
+
+    # Ranked words first, then the rest alphabetically
+    cornelltest.assert_equals(['at', 'and', 'a', 'an', 'ant', 'ate'],
+                              a4.autocomplete_top('a', pmap, 10))
+    cornelltest.assert_equals(['be', 'at'], a4.autocomplete_top('', pmap, 2))
+    cornelltest.assert_equals(['and', 'an'], a4.autocomplete_top('an', pmap, 2))
+    cornelltest.assert_equals([], a4.autocomplete_top('an', pmap, 0))
+    cornelltest.assert_equals([], a4.autocomplete_top('x', pmap, 3))
+
+    # Changing the trie keeps the best ranks up to date
+    pmap.set_rank('ant', 2)
+    cornelltest.assert_equals(['at', 'ant', 'and'], a4.autocomplete_top('a', pmap, 3))
+    a4.pmap_remove_word(pmap, 'at')
+    cornelltest.assert_equals(2, pmap.best_rank(pmap.find('a')))
+    a4.pmap_add_word(pmap, 'at')
+    cornelltest.assert_equals(['ant', 'and', 'a'], a4.autocomplete_top('a', pmap, 3))
+
+
+def test_nbytes():
+    """Test that the node table is much smaller than a dict prefix map"""
+    print 'Testing Trie.nbytes'
+    pmap = trie.Trie()
+    empty = pmap.nbytes()
+    pmap.add_word('cat')
+    cornelltest.assert_true(pmap.nbytes() > empty)
+    cornelltest.assert_true(pmap.nbytes() <= 18 * len(pmap))
+
+
+# Application Code
+if __name__ == "__main__":
+    test_add_word()
+    test_has_word()
+    test_to_word_list()
+    test_searches()
+    test_lengths()
+    test_counts()
+    test_remove_word()
+    test_ranks()
+    test_nbytes()
+    print "Module trie is working correctly"